@@ -0,0 +1 @@
+"""Benchmarks for MECSR scraper hot paths, run over saved pages."""
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Per-page CPU cost of each extractor backend, parse included.
+
+Every backend is first checked to produce the same streamlined records as the
+BeautifulSoup reference, then timed over the same saved pages.
+
+Usage:
+    python -m benchmarks.backend_benchmark output/archive/mecsr_pages_<timestamp>
+    python -m benchmarks.backend_benchmark path/to/html_dir --rounds 5
+"""
+
+import argparse
+from typing import List, Tuple, Optional
+
+from bs4 import BeautifulSoup
+
+from benchmarks.pages import load_pages
+from benchmarks.timing import time_passes
+from extraction_executor import create_extractor
+from utils.constants import EXTRACTOR_BS4, EXTRACTOR_BACKENDS
+
+
+def cpu_per_page(func, pages: List[Tuple[str, str]], rounds: int) -> float:
+    """Mean CPU seconds per page for func(url, html), best of several rounds"""
+    return time_passes(lambda page: func(*page), pages, rounds)['best_cpu'] / len(pages)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the streamlined extractor backends")
+    parser.add_argument("source", help="Directory of .html files or a page archive path")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="Timing rounds, the best one is reported")
+    parser.add_argument("--limit", type=int, default=None, help="Only use the first N pages")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.source, limit=args.limit)
+    if not pages:
+        print("❌ No pages found!")
+        return
+
+    extractors = {backend: create_extractor(backend) for backend in EXTRACTOR_BACKENDS}
+    reference = [extractors[EXTRACTOR_BS4].extract_streamlined_mall_data(html, url)
+                 for url, html in pages]
+
+    # Backends must agree before their timings mean anything
+    for backend, extractor in extractors.items():
+        mismatches = [url for (url, html), expected in zip(pages, reference)
+                      if extractor.extract_streamlined_mall_data(html, url) != expected]
+        if mismatches:
+            print(f"❌ {backend} output differs on {len(mismatches)} pages, e.g. {mismatches[0]}")
+            return
+
+    print(f"📄 {len(pages)} pages, identical output, "
+          f"best of {args.rounds} rounds (CPU time per page)")
+    soup_parse = cpu_per_page(lambda url, html: BeautifulSoup(html, 'lxml'), pages, args.rounds)
+    print(f"   {'BeautifulSoup parse only':<26}{soup_parse * 1000:8.2f} ms")
+
+    costs = {}
+    for backend, extractor in extractors.items():
+        costs[backend] = cpu_per_page(
+            lambda url, html: extractor.extract_streamlined_mall_data(html, url), pages, args.rounds
+        )
+        print(f"   {backend:<26}{costs[backend] * 1000:8.2f} ms")
+
+    baseline = costs[EXTRACTOR_BS4]
+    for backend, cost in costs.items():
+        if backend != EXTRACTOR_BS4 and cost > 0:
+            print(f"⚡ {backend}: {baseline / cost:.1f}x faster than {EXTRACTOR_BS4} per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Per-page CPU time and peak memory of mall link harvesting on directory pages.
+
+Compares DetailExtractor.extract_mall_links (anchors only) with a full
+html.parser parse of the same page.
+
+Usage:
+    python -m benchmarks.discovery_benchmark output/archive/mecsr_pages_<timestamp>
+    python -m benchmarks.discovery_benchmark path/to/directory_html_dir
+"""
+
+import argparse
+import tracemalloc
+from typing import List, Tuple, Optional
+
+from bs4 import BeautifulSoup
+
+from benchmarks.pages import load_pages
+from benchmarks.timing import time_passes
+from scrapers.detail_extractor import DetailExtractor
+
+
+def full_parse_links(html: str) -> List[str]:
+    """Link harvesting over a fully parsed page, for comparison"""
+    soup = BeautifulSoup(html, 'html.parser')
+    links = []
+    for link in soup.find_all('a', href=True):
+        href = link.get('href')
+        if (href and '/directory-shopping-centres/' in href
+                and href != '/directory-shopping-centres/'):
+            if href.startswith('http'):
+                href = href.replace('https://www.mecsr.org', '')
+            if href not in links:
+                links.append(href)
+    return links
+
+
+def measure(func, pages: List[Tuple[str, str]], rounds: int) -> Tuple[float, int]:
+    """Best CPU seconds per page and peak traced bytes for a single page"""
+    best = time_passes(func, [html for _, html in pages], rounds)['best_cpu']
+
+    peak = 0
+    for _, html in pages:
+        tracemalloc.start()
+        func(html)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return best / len(pages), peak
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark mall link harvesting on directory pages")
+    parser.add_argument("source", help="Directory of .html files or a page archive path")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="Timing rounds, the best one is reported")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.source, directory=True)
+    if not pages:
+        print("❌ No directory pages found!")
+        return
+
+    extractor = DetailExtractor()
+    if any(extractor.extract_mall_links(html) != full_parse_links(html) for _, html in pages):
+        print("❌ Anchor-only harvesting found different links than a full parse")
+        return
+
+    full_cpu, full_peak = measure(full_parse_links, pages, args.rounds)
+    fast_cpu, fast_peak = measure(extractor.extract_mall_links, pages, args.rounds)
+
+    print(f"📄 {len(pages)} directory pages, identical links, best of {args.rounds} rounds")
+    print(f"   Full parse:    {full_cpu * 1000:8.2f} ms/page  peak {full_peak / 1024:8.0f} KiB")
+    print(f"   Anchors only:  {fast_cpu * 1000:8.2f} ms/page  peak {fast_peak / 1024:8.0f} KiB")
+    if fast_cpu > 0 and fast_peak > 0:
+        print(f"⚡ {full_cpu / fast_cpu:.1f}x less CPU, "
+              f"{full_peak / fast_peak:.1f}x less peak memory per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Record/replay fixture server for offline end-to-end runs.
+
+Serves the directory and mall pages recorded in a page archive from a local
+aiohttp server, with optional injected latency, errors and 429 bursts, so the
+whole scraper can be run and benchmarked reproducibly without touching mecsr.org.
+
+Usage:
+    # Record: --archive keeps every fetched directory and mall page
+    python simple_mecsr_scraper.py --archive
+
+    # Replay, then point the scraper at the stand-in server
+    python -m benchmarks.fixture_server output/archive/mecsr_pages_<timestamp> \
+        --latency 0.05 --jitter 0.1
+    BASE_URL=http://127.0.0.1:8765 python simple_mecsr_scraper.py --no-cache
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from typing import Dict, Any, List, Tuple, Optional
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from scrapers.page_archive import PageArchive
+
+
+class FixtureServer:
+    """Local stand-in for the MECSR site, replaying recorded pages with injected faults"""
+
+    def __init__(self,
+                 pages: Dict[str, Tuple[str, str]],
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 slow_rate: float = 0.0,
+                 slow_latency: float = 1.0,
+                 error_rate: float = 0.0,
+                 throttle_every: float = 0.0,
+                 throttle_for: float = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Initialize the FixtureServer
+
+        Args:
+            pages: Mapping of path with query string to (html, content type)
+            latency: Fixed delay (seconds) before every response
+            jitter: Maximum random delay added on top of latency
+            slow_rate: Share of requests delayed by slow_latency as well, for a latency tail
+            slow_latency: Extra delay of the slow requests
+            error_rate: Share of requests answered with 503
+            throttle_every: Start a 429 burst every this many seconds (0 disables)
+            throttle_for: Length of each 429 burst in seconds
+            seed: Random seed for reproducible fault injection
+        """
+        self.pages = pages
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.throttle_every = throttle_every
+        self.throttle_for = throttle_for
+        self._random = random.Random(seed)
+
+        self._runner: Optional[web.AppRunner] = None
+        self._started_at = 0.0
+        self.base_url: Optional[str] = None
+
+        self.stats = {
+            'requests': 0,
+            'served': 0,
+            'not_found': 0,
+            'errors': 0,
+            'throttled': 0
+        }
+
+    @classmethod
+    def from_archive(cls, archive_path: str, **options: Any) -> "FixtureServer":
+        """
+        Build a server over the latest recorded body of every URL in a page archive
+
+        Args:
+            archive_path: Archive path (with or without the .warc.gz suffix)
+            **options: Fault injection options passed to the constructor
+
+        Returns:
+            FixtureServer serving the archived pages
+        """
+        pages = {}
+        with PageArchive(archive_path) as archive:
+            for entry, html in archive.iter_pages():
+                if entry.get('status_code', 200) not in (200, 304):
+                    continue
+                parts = urlsplit(entry['url'])
+                path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+                pages[path] = (html, entry.get('content_type') or 'text/html; charset=utf-8')
+        return cls(pages, **options)
+
+    def _throttle_remaining(self) -> float:
+        """Seconds left in the current 429 burst, 0 outside bursts"""
+        if not self.throttle_every or not self.throttle_for:
+            return 0.0
+        position = (time.monotonic() - self._started_at) % self.throttle_every
+        # Bursts sit at the end of each period, so a run starts unthrottled
+        burst_start = self.throttle_every - self.throttle_for
+        return self.throttle_every - position if position >= burst_start else 0.0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Serve one recorded page, or an injected fault"""
+        self.stats['requests'] += 1
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if self.slow_rate and self._random.random() < self.slow_rate:
+            delay += self.slow_latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        throttle_remaining = self._throttle_remaining()
+        if throttle_remaining:
+            self.stats['throttled'] += 1
+            retry_after = str(math.ceil(throttle_remaining))
+            return web.Response(status=429, headers={'Retry-After': retry_after})
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.stats['errors'] += 1
+            return web.Response(status=503)
+
+        page = self.pages.get(request.path_qs)
+        if page is None:
+            self.stats['not_found'] += 1
+            return web.Response(status=404)
+
+        html, content_type = page
+        self.stats['served'] += 1
+        return web.Response(body=html.encode('utf-8'), headers={'Content-Type': content_type})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> str:
+        """
+        Start serving
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+
+        Returns:
+            Base URL to use as BASE_URL
+        """
+        app = web.Application()
+        app.router.add_get('/{tail:.*}', self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        port = self._runner.addresses[0][1]
+        self._started_at = time.monotonic()
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def stop(self):
+        """Stop serving"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FixtureServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+
+async def serve(server: FixtureServer, host: str, port: int):
+    """Run the server until interrupted"""
+    base_url = await server.start(host, port)
+    print(f"🧪 Serving {len(server.pages)} recorded pages at {base_url}")
+    print(f"   Point the scraper at it with BASE_URL={base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Replay recorded MECSR pages from a local server")
+    parser.add_argument("archive", help="Page archive written with --archive")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Fixed delay per response in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Maximum random delay added per response")
+    parser.add_argument("--slow-rate", type=float, default=0.0,
+                        help="Share of responses that are slow")
+    parser.add_argument("--slow-latency", type=float, default=1.0,
+                        help="Extra delay of slow responses")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Share of requests answered with 503")
+    parser.add_argument("--throttle-every", type=float, default=0.0,
+                        help="Seconds between 429 bursts (default: no bursts)")
+    parser.add_argument("--throttle-for", type=float, default=0.0,
+                        help="Length of each 429 burst in seconds")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed for reproducible faults")
+    args = parser.parse_args(argv)
+
+    server = FixtureServer.from_archive(
+        args.archive,
+        latency=args.latency,
+        jitter=args.jitter,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+        error_rate=args.error_rate,
+        throttle_every=args.throttle_every,
+        throttle_for=args.throttle_for,
+        seed=args.seed
+    )
+    if not server.pages:
+        print("❌ No recorded pages found!")
+        return
+
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    print(f"📊 {server.stats['requests']} requests: {server.stats['served']} served, "
+          f"{server.stats['not_found']} not found, {server.stats['errors']} errors, "
+          f"{server.stats['throttled']} throttled")
+
+
+if __name__ == "__main__":
+    main()
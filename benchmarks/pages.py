@@ -0,0 +1,40 @@
+"""
+Saved page loading for benchmarks.
+Pages come from a directory of .html files or from a raw page archive written
+with --archive, so benchmarks run without network access.
+"""
+
+from typing import List, Tuple, Optional
+from pathlib import Path
+
+from re_extract import is_mall_detail_url
+from scrapers.page_archive import PageArchive
+
+
+def load_pages(source: str,
+               limit: Optional[int] = None,
+               directory: bool = False) -> List[Tuple[str, str]]:
+    """
+    Load saved mall pages
+
+    Args:
+        source: Directory of .html files or a page archive path
+        limit: Maximum number of pages to load
+        directory: Load directory listing pages from an archive instead of mall pages
+
+    Returns:
+        List of (url, html) tuples
+    """
+    path = Path(source)
+    pages = []
+
+    if path.is_dir():
+        for html_file in sorted(path.glob('*.html')):
+            url = f"https://www.mecsr.org/directory-shopping-centres/{html_file.stem}"
+            pages.append((url, html_file.read_text(encoding='utf-8')))
+    else:
+        with PageArchive(source) as archive:
+            pages = [(entry['url'], html) for entry, html in archive.iter_pages()
+                     if is_mall_detail_url(entry['url']) != directory]
+
+    return pages[:limit] if limit else pages
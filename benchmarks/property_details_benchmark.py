@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the Post Details fallback regexes and field-name keys.
+
+Times the compiled pattern registry and memoized field_name_to_key against the
+previous per-call approach (pattern dict rebuilt per page, re.search with
+flags, mapping dict and three re.sub calls per table row) over saved pages.
+
+Usage:
+    python -m benchmarks.property_details_benchmark output/archive/mecsr_pages_<timestamp>
+    python -m benchmarks.property_details_benchmark path/to/html_dir --repeat 20
+"""
+
+import argparse
+import re
+from typing import Dict, Any, List, Optional
+
+from bs4 import BeautifulSoup
+
+from benchmarks.pages import load_pages
+from benchmarks.timing import time_passes
+from enhanced_extractor import (
+    EnhancedDataExtractor, FALLBACK_PATTERNS, FIELD_KEY_MAPPINGS, field_name_to_key
+)
+
+
+def legacy_fallback_patterns() -> Dict[str, str]:
+    """Pattern dict as it used to be rebuilt for every page"""
+    return {key: pattern.pattern for key, pattern in FALLBACK_PATTERNS.items()}
+
+
+def legacy_apply_fallbacks(text_content: str) -> Dict[str, Any]:
+    """Fallback regex pass as it used to run"""
+    details = {}
+    for key, pattern in legacy_fallback_patterns().items():
+        match = re.search(pattern, text_content, re.IGNORECASE | re.MULTILINE)
+        if match:
+            details[key] = match.group(1).strip()
+    return details
+
+
+def compiled_apply_fallbacks(text_content: str) -> Dict[str, Any]:
+    """Fallback regex pass over the compiled registry"""
+    details = {}
+    for key, pattern in FALLBACK_PATTERNS.items():
+        match = pattern.search(text_content)
+        if match:
+            details[key] = match.group(1).strip()
+    return details
+
+
+def legacy_field_name_to_key(field_name: str) -> str:
+    """Field-name resolution as it used to run for every table row"""
+    clean_name = re.sub(r'<[^>]+>', '', field_name)
+    clean_name = re.sub(r'[^\w\s]', '', clean_name)
+    clean_name = clean_name.strip()
+    field_mappings = dict(FIELD_KEY_MAPPINGS)
+    if clean_name in field_mappings:
+        return field_mappings[clean_name]
+    key = clean_name.lower().replace(' ', '_')
+    key = re.sub(r'_+', '_', key)
+    return key.strip('_')
+
+
+def best_time(func, inputs: List[str], repeat: int) -> float:
+    """Best wall time of one pass over the inputs"""
+    return time_passes(func, inputs, repeat)['best_wall']
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Post Details regexes and field-name keys")
+    parser.add_argument("source", help="Directory of .html files or a page archive path")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="Timing rounds, the best one is reported")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.source)
+    if not pages:
+        print("❌ No pages found!")
+        return
+
+    # Inputs as the extractor sees them: section text and table-row field names
+    extractor = EnhancedDataExtractor()
+    section_texts, field_names = [], []
+    for _, html in pages:
+        section = extractor._find_property_details_section(BeautifulSoup(html, 'lxml'))
+        if not section:
+            continue
+        section_texts.append(section.get_text())
+        labels = section.find_all('div', class_=lambda x: x and 'bold' in str(x))
+        field_names.extend(div.get_text(strip=True) for div in labels)
+
+    regexes_agree = all(legacy_apply_fallbacks(text) == compiled_apply_fallbacks(text)
+                        for text in section_texts)
+    keys_agree = all(legacy_field_name_to_key(name) == field_name_to_key(name)
+                     for name in field_names)
+    if not (regexes_agree and keys_agree):
+        print("❌ Compiled registry and previous approach disagree")
+        return
+
+    legacy_regex = best_time(legacy_apply_fallbacks, section_texts, args.repeat)
+    compiled_regex = best_time(compiled_apply_fallbacks, section_texts, args.repeat)
+    legacy_keys = best_time(legacy_field_name_to_key, field_names, args.repeat)
+    memoized_keys = best_time(field_name_to_key, field_names, args.repeat)
+
+    print(f"📄 {len(section_texts)} Post Details sections, {len(field_names)} table rows, "
+          f"best of {args.repeat}")
+    print(f"   Fallback regexes: {legacy_regex / len(section_texts) * 1e6:8.1f} -> "
+          f"{compiled_regex / len(section_texts) * 1e6:8.1f} µs/page  "
+          f"({legacy_regex / compiled_regex:.1f}x)")
+    print(f"   Field-name keys:  {legacy_keys / len(field_names) * 1e6:8.2f} -> "
+          f"{memoized_keys / len(field_names) * 1e6:8.2f} µs/row   "
+          f"({legacy_keys / memoized_keys:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the extraction hot paths.
+
+Times every public extraction entry point and each _extract_* helper
+individually over a fixed corpus of saved pages, reporting per-page p50/p95
+wall time and pages/sec per core (single-process CPU throughput). Results can
+be saved as a baseline; later runs compared against it exit non-zero when a
+case regresses beyond the tolerance.
+
+Usage:
+    python -m benchmarks.suite output/archive/mecsr_pages_<timestamp> \
+        --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite output/archive/mecsr_pages_<timestamp> \
+        --baseline benchmarks/baseline.json
+    python -m benchmarks.suite path/to/html_dir \
+        --directory-pages path/to/directory_html_dir --filter streamlined
+"""
+
+import argparse
+import inspect
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Callable, Optional
+
+from bs4 import BeautifulSoup
+
+from benchmarks.pages import load_pages
+from benchmarks.timing import time_passes
+from enhanced_extractor import EnhancedDataExtractor
+from extraction_executor import create_extractor
+from scrapers.detail_extractor import DetailExtractor
+from utils.constants import EXTRACTOR_BACKENDS
+from utils.helpers import percentile, ensure_directory, get_iso_timestamp
+
+
+# A case is a name plus per-page callables, prepared so only the measured work remains
+BenchmarkCase = Tuple[str, List[Callable[[], Any]]]
+
+
+def soup_helpers(extractor: EnhancedDataExtractor) -> List[str]:
+    """Names of the _extract_* helpers that take a parsed page"""
+    return sorted(
+        name for name, method in inspect.getmembers(extractor, inspect.ismethod)
+        if name.startswith('_extract_') and list(inspect.signature(method).parameters) == ['soup']
+    )
+
+
+def build_cases(mall_pages: List[Tuple[str, str]],
+                directory_pages: List[Tuple[str, str]]) -> List[BenchmarkCase]:
+    """
+    Prepare every benchmark case over the corpus
+
+    Args:
+        mall_pages: (url, html) of mall detail pages
+        directory_pages: (url, html) of directory listing pages
+
+    Returns:
+        List of (case name, per-page callables)
+    """
+    extractor = EnhancedDataExtractor()
+    detail_extractor = DetailExtractor()
+    cases = []
+
+    if mall_pages:
+        cases.append(('parse lxml', [
+            lambda html=html: BeautifulSoup(html, 'lxml') for _, html in mall_pages
+        ]))
+        cases.append(('parse html.parser', [
+            lambda html=html: BeautifulSoup(html, 'html.parser') for _, html in mall_pages
+        ]))
+
+        for backend in EXTRACTOR_BACKENDS:
+            backend_extractor = create_extractor(backend)
+            cases.append((f'extract_streamlined_mall_data [{backend}]', [
+                lambda html=html, url=url, e=backend_extractor:
+                    e.extract_streamlined_mall_data(html, url)
+                for url, html in mall_pages
+            ]))
+        cases.append(('extract_comprehensive_mall_data', [
+            lambda html=html, url=url: extractor.extract_comprehensive_mall_data(html, url)
+            for url, html in mall_pages
+        ]))
+        cases.append(('DetailExtractor.extract_mall_details', [
+            lambda html=html: detail_extractor.extract_mall_details(html) for _, html in mall_pages
+        ]))
+
+        # Helpers run on pages parsed up front, so only the helper itself is timed
+        soups = [BeautifulSoup(html, 'html.parser') for _, html in mall_pages]
+        for name in soup_helpers(extractor):
+            helper = getattr(extractor, name)
+            cases.append((name, [lambda soup=soup, helper=helper: helper(soup) for soup in soups]))
+
+        sections = [extractor._find_property_details_section(soup) for soup in soups]
+        for name in ('_extract_property_details_from_section', '_extract_structured_table_data'):
+            helper = getattr(extractor, name)
+            cases.append((name, [lambda section=section, helper=helper: helper(section)
+                                 for section in sections if section is not None]))
+
+    if directory_pages:
+        cases.append(('extract_mall_links', [
+            lambda html=html: detail_extractor.extract_mall_links(html)
+            for _, html in directory_pages
+        ]))
+        cases.append(('extract_mall_data', [
+            lambda html=html: detail_extractor.extract_mall_data(html)
+            for _, html in directory_pages
+        ]))
+
+    return [(name, calls) for name, calls in cases if calls]
+
+
+def run_case(calls: List[Callable[[], Any]], rounds: int) -> Dict[str, float]:
+    """
+    Time one case
+
+    Args:
+        calls: One callable per page
+        rounds: Passes over the corpus; every pass contributes per-page samples
+
+    Returns:
+        Dictionary with p50_ms, p95_ms and pages_per_sec (per core, best pass)
+    """
+    timing = time_passes(lambda call: call(), calls, rounds, per_call=True)
+    best_cpu = timing['best_cpu']
+
+    return {
+        'pages': len(calls),
+        'p50_ms': percentile(timing['samples'], 50) * 1000,
+        'p95_ms': percentile(timing['samples'], 95) * 1000,
+        'pages_per_sec': len(calls) / best_cpu if best_cpu else float('inf')
+    }
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, float]],
+                        baseline: Dict[str, Any],
+                        tolerance: float) -> List[str]:
+    """
+    Find cases slower than the baseline
+
+    Args:
+        results: Case name -> timings from this run
+        baseline: Saved baseline document
+        tolerance: Allowed slowdown as a fraction (0.2 = 20%)
+
+    Returns:
+        One message per regressed case
+    """
+    regressions = []
+    for name, timings in results.items():
+        expected = baseline['cases'].get(name)
+        if not expected:
+            continue
+
+        if timings['p50_ms'] > expected['p50_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {timings['p50_ms']:.3f} ms "
+                               f"vs baseline {expected['p50_ms']:.3f} ms")
+        if timings['pages_per_sec'] * (1 + tolerance) < expected['pages_per_sec']:
+            regressions.append(f"{name}: {timings['pages_per_sec']:.0f} pages/s/core "
+                               f"vs baseline {expected['pages_per_sec']:.0f}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the extraction hot paths over saved pages")
+    parser.add_argument("source", help="Page archive, or a directory of mall .html files")
+    parser.add_argument("--directory-pages", default=None,
+                        help="Directory of directory-listing .html files "
+                             "(archives already include them)")
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the corpus per case")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="Only use the first N pages of each kind")
+    parser.add_argument("--filter", default=None,
+                        help="Only run cases whose name contains this text")
+    parser.add_argument("--baseline", default=None,
+                        help="Baseline JSON to compare against; regressions exit 1")
+    parser.add_argument("--save-baseline", default=None,
+                        help="Write this run's results as a baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    mall_pages = load_pages(args.source, limit=args.limit)
+    if args.directory_pages:
+        directory_pages = load_pages(args.directory_pages, limit=args.limit)
+    elif Path(args.source).is_dir():
+        directory_pages = []
+    else:
+        directory_pages = load_pages(args.source, limit=args.limit, directory=True)
+
+    if not mall_pages and not directory_pages:
+        print("❌ No pages found!")
+        sys.exit(1)
+
+    cases = build_cases(mall_pages, directory_pages)
+    if args.filter:
+        cases = [(name, calls) for name, calls in cases if args.filter in name]
+
+    print(f"📄 {len(mall_pages)} mall pages, {len(directory_pages)} directory pages, "
+          f"{args.rounds} rounds")
+    print(f"   {'case':<48}{'p50 ms':>10}{'p95 ms':>10}{'pages/s/core':>14}")
+    results = {}
+    for name, calls in cases:
+        results[name] = run_case(calls, args.rounds)
+        timings = results[name]
+        print(f"   {name:<48}{timings['p50_ms']:>10.3f}{timings['p95_ms']:>10.3f}"
+              f"{timings['pages_per_sec']:>14.0f}")
+
+    if args.save_baseline:
+        ensure_directory(str(Path(args.save_baseline).parent))
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created_at': get_iso_timestamp(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'mall_pages': len(mall_pages),
+                'directory_pages': len(directory_pages),
+                'cases': results
+            }, f, indent=2)
+        print(f"💾 Baseline saved to: {args.save_baseline}")
+
+    if args.baseline:
+        if not Path(args.baseline).exists():
+            print(f"❌ No baseline at {args.baseline}; record one with --save-baseline")
+            sys.exit(1)
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        corpus = (len(mall_pages), len(directory_pages))
+        if (baseline.get('mall_pages'), baseline.get('directory_pages')) != corpus:
+            print("⚠️ Baseline was recorded over a different corpus, timings may not be comparable")
+        if baseline.get('python') != platform.python_version():
+            print(f"⚠️ Baseline was recorded on Python {baseline.get('python')}")
+
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions beyond {args.tolerance:.0%}:")
+            for message in regressions:
+                print(f"   {message}")
+            sys.exit(1)
+        print(f"✅ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from utils.constants import DEFAULT_EXTRACTOR_BACKEND
+
 
 class ScrapingSettings(BaseSettings):
     """Application settings with environment variable support"""
@@ -27,15 +29,54 @@ class ScrapingSettings(BaseSettings):
     requests_per_minute: int = Field(default=60, env="REQUESTS_PER_MINUTE")  # Increased for 1001 malls
     max_concurrent_requests: int = Field(default=10, env="MAX_CONCURRENT_REQUESTS")  # Increased concurrency
     batch_size: int = Field(default=20, env="BATCH_SIZE")  # Larger batches for efficiency
+    rate_limit_burst: int = Field(default=1, env="RATE_LIMIT_BURST")  # Token bucket capacity
+    rate_limit_jitter: float = Field(default=0.5, env="RATE_LIMIT_JITTER")  # Max random delay
+
+    # Adaptive Concurrency (AIMD, enabled with --adaptive or ADAPTIVE_CONCURRENCY)
+    adaptive_concurrency: bool = Field(default=False, env="ADAPTIVE_CONCURRENCY")
+    min_concurrency: int = Field(default=1, env="MIN_CONCURRENCY")
+    max_concurrency: int = Field(default=12, env="MAX_CONCURRENCY")
+    # Limit multiplier on 429/5xx/timeouts
+    concurrency_decrease_factor: float = Field(default=0.5, env="CONCURRENCY_DECREASE_FACTOR")
+    # Stop growing past this multiple of the best latency
+    concurrency_latency_tolerance: float = Field(default=2.0, env="CONCURRENCY_LATENCY_TOLERANCE")
+
+    # Extraction Configuration
+    # "bs4", "single_pass" or "lxml"
+    extractor_backend: str = Field(default=DEFAULT_EXTRACTOR_BACKEND, env="EXTRACTOR_BACKEND")
+    # None = one per CPU core, 0 = inline
+    extraction_workers: Optional[int] = Field(default=None, env="EXTRACTION_WORKERS")
+    # Comma-separated streamlined fields, None = all
+    extract_fields: Optional[str] = Field(default=None, env="EXTRACT_FIELDS")
+    # None = bundled utils/tenant_taxonomy.json
+    tenant_taxonomy_path: Optional[str] = Field(default=None, env="TENANT_TAXONOMY_PATH")
 
     # Retry Configuration
     max_retries: int = Field(default=5, env="MAX_RETRIES")  # More retries for large-scale
     base_retry_delay: float = Field(default=2.0, env="BASE_RETRY_DELAY")  # Longer delay
     max_retry_delay: float = Field(default=120.0, env="MAX_RETRY_DELAY")  # Max 2 minutes
 
+    # HTTP Cache Configuration
+    cache_enabled: bool = Field(default=True, env="CACHE_ENABLED")
+    cache_directory: str = Field(default="./.http_cache", env="CACHE_DIRECTORY")
+    # Revalidate after 6 hours
+    cache_ttl_seconds: float = Field(default=6 * 3600, env="CACHE_TTL_SECONDS")
+
     # Storage Configuration
     output_directory: str = Field(default="./output", env="OUTPUT_DIRECTORY")
+    # "json", streaming "jsonl" or upserted "sqlite"
     output_format: str = Field(default="json", env="OUTPUT_FORMAT")
+    # Mall store for the sqlite format
+    sqlite_path: str = Field(default="./output/mecsr_malls.sqlite", env="SQLITE_PATH")
+    sqlite_batch_size: int = Field(default=50, env="SQLITE_BATCH_SIZE")  # Records per transaction
+    # Share of known malls refetched per incremental run, stalest first
+    incremental_refresh_fraction: float = Field(default=0.03, env="INCREMENTAL_REFRESH_FRACTION")
+
+    # Metrics Configuration
+    # Prometheus text, or JSON summary for .json; None = no dump
+    metrics_file: Optional[str] = Field(default=None, env="METRICS_FILE")
+    # Seconds between metrics file rewrites
+    metrics_dump_interval: float = Field(default=15.0, env="METRICS_DUMP_INTERVAL")
 
     # Logging Configuration
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -68,7 +109,9 @@ class CrawlerConfig:
         }
 
         self.run_config = {
-            "cache_mode": "bypass",  # Always fresh data for large-scale scraping
+            # Conditional refetch of cached pages
+            "cache_mode": "revalidate" if settings.cache_enabled else "bypass",
+            "cache_ttl_seconds": settings.cache_ttl_seconds,
             "page_timeout": 45000,   # 45 seconds for larger pages
             "word_count_threshold": 10,
             "process_iframes": True,
@@ -80,7 +123,9 @@ class CrawlerConfig:
         self.rate_limit = {
             "requests_per_minute": settings.requests_per_minute,
             "max_concurrent": settings.max_concurrent_requests,
-            "batch_size": settings.batch_size
+            "batch_size": settings.batch_size,
+            "burst": settings.rate_limit_burst,
+            "jitter": settings.rate_limit_jitter
         }
 
         # Scraping scope settings
@@ -7,10 +7,110 @@ capturing all available data including Post Details, tenant lists, images, and m
 """
 
 import re
-from typing import List, Dict, Any, Optional
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Pattern, Iterable, FrozenSet, Callable, TypeVar
 from bs4 import BeautifulSoup
 
 from scrapers.detail_extractor import DetailExtractor
+from utils.constants import STREAMLINED_FIELDS, COMPREHENSIVE_FIELDS
+from utils.tenant_categorizer import get_tenant_categorizer
+
+
+T = TypeVar('T')
+
+
+# Fallback patterns for Post Details fields missed by structured parsing, compiled once
+FALLBACK_PATTERNS: Dict[str, Pattern] = {
+    key: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for key, pattern in {
+        'property_360_link': r'Property 360 View Link[:\s]*([^\n]+)',
+        'type_of_property': r'Type of Property[:\s]*([^\n]+)',
+        'mall_size_sqm': r'Mall Size in SQM[:\s]*([0-9,]+)',
+        'gla_sqm': r'GLA in SQM[:\s]*([0-9,]+)',
+        'levels': r'No\.?\s*of\s*Level[:\s]*([0-9]+)',
+        'car_parks': r'No\.?\s*of\s*Car\s*Park[:\s]*([0-9,]+)',
+        'retail_outlets': r'No\.?\s*Retail\s*Outlets?[:\s]*([0-9,]+)',
+        'annual_footfall': r'Annual\s*Footfall[:\s]*([0-9,]+)',
+        'year_built': r'Year\s*Built[:\s]*([^\n]+)',
+        'owner_company': r'Owner\s*Company\s*Name[:\s]*([^\n]+)',
+        'managing_agent': r'Managing\s*Agent[:\s]*([^\n]+)',
+        'leasing_agent': r'Leasing\s*Agent[:\s]*([^\n]+)',
+        'main_contractor': r'Main\s*Contractor[:\s]*([^\n]+)',
+        'retail_solutions_provider': r'Retail\s*Solutions\s*Provider[:\s]*([^\n]+)'
+    }.items()
+}
+
+# Fallback fields stored as integers
+NUMERIC_FIELDS = frozenset(['mall_size_sqm', 'gla_sqm', 'levels', 'car_parks', 'retail_outlets',
+                            'annual_footfall'])
+
+# Post Details field names with a fixed key
+FIELD_KEY_MAPPINGS = {
+    'Property 360 View Link': 'property_360_link',
+    'Type of Property': 'type_of_property',
+    'Mall Size in SQM': 'mall_size_sqm',
+    'GLA in SQM': 'gla_sqm',
+    'No of Level': 'levels',
+    'No of Car Parks': 'car_parks',
+    'No Retail Outlets': 'retail_outlets',
+    'Annual Footfall EstimatedActual': 'annual_footfall',
+    'Year Built': 'year_built',
+    'AnchorNotable Tenants': 'anchor_tenants',
+    'Owner Company Name': 'owner_company',
+    'Managing Agent Company Name': 'managing_agent',
+    'Leasing Agent Company Name': 'leasing_agent',
+    'Main Contractor': 'main_contractor',
+    ('Retail Solutions Provider Service Provider Footfall Retail Analytics Technology Others'):
+        'retail_solutions_provider'
+}
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s]')
+_UNDERSCORES_RE = re.compile(r'_+')
+NON_DIGIT_RE = re.compile(r'[^\d]')
+
+
+@lru_cache(maxsize=1024)
+def field_name_to_key(field_name: str) -> str:
+    """Convert human-readable field names to snake_case keys (memoized, names repeat per page)"""
+    # Remove icons and special characters
+    clean_name = _HTML_TAG_RE.sub('', field_name)  # Remove HTML tags
+    clean_name = _SPECIAL_CHAR_RE.sub('', clean_name)  # Remove special chars
+    clean_name = clean_name.strip()
+
+    # Try exact match first
+    if clean_name in FIELD_KEY_MAPPINGS:
+        return FIELD_KEY_MAPPINGS[clean_name]
+
+    # Fallback to automatic conversion
+    key = clean_name.lower().replace(' ', '_')
+    key = _UNDERSCORES_RE.sub('_', key)  # Remove multiple underscores
+    key = key.strip('_')  # Remove leading/trailing underscores
+
+    return key
+
+
+def select_fields(fields: Optional[Iterable[str]], available: Iterable[str]) -> FrozenSet[str]:
+    """
+    Resolve a field projection against the fields an extraction produces
+
+    Args:
+        fields: Requested field names; None selects every field
+        available: Fields the extraction can produce
+
+    Returns:
+        Selected fields, without 'url' which is always included
+    """
+    if fields is None:
+        return frozenset(available)
+
+    selected = frozenset(fields) - {'url'}
+    unknown = selected.difference(available)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))} "
+                         f"(available: {', '.join(available)})")
+    return selected
 
 
 class EnhancedDataExtractor:
@@ -18,40 +118,65 @@ class EnhancedDataExtractor:
 
     def __init__(self):
         self.base_extractor = DetailExtractor()
-
-    def extract_comprehensive_mall_data(self, html: str, url: str) -> Dict[str, Any]:
+        self.last_parse_time = 0.0  # Seconds the latest streamlined extraction spent parsing HTML
+
+    def _timed_parse(self, parse: Callable[[], T]) -> T:
+        """Run a parser call, recording its duration in last_parse_time"""
+        start = time.perf_counter()
+        try:
+            return parse()
+        finally:
+            self.last_parse_time = time.perf_counter() - start
+
+    def extract_comprehensive_mall_data(self, html: str, url: str,
+                                        fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Extract comprehensive data from mall page HTML
 
         Args:
             html: Raw HTML content
             url: Mall URL
+            fields: Only run the extractors for these keys (see COMPREHENSIVE_FIELDS);
+                None extracts everything
 
         Returns:
-            Dictionary with all extractable data
+            Dictionary with all extractable data, or only the selected fields
         """
+        selected = select_fields(fields, COMPREHENSIVE_FIELDS)
         soup = BeautifulSoup(html, 'html.parser')
 
-        # Start with basic extraction
-        mall_data = {
-            'url': url,
-            'mall_name': self._extract_mall_name_enhanced(soup),
-            'basic_info': self._extract_basic_info_enhanced(soup),
-            'property_details': self._extract_property_details_comprehensive(soup),
-            'location_data': self._extract_location_data_enhanced(soup),
-            'contact_info': self._extract_contact_info_comprehensive(soup),
-            'tenant_data': self._extract_tenant_data_comprehensive(soup),
-            'media_content': self._extract_media_content_comprehensive(soup),
-            'structured_data': self._extract_structured_data_comprehensive(soup),
-            'metadata': self._extract_metadata_enhanced(soup)
+        extractors = {
+            'mall_name': self._extract_mall_name_enhanced,
+            'basic_info': self._extract_basic_info_enhanced,
+            'property_details': self._extract_property_details_comprehensive,
+            'location_data': self._extract_location_data_enhanced,
+            'contact_info': self._extract_contact_info_comprehensive,
+            'tenant_data': self._extract_tenant_data_comprehensive,
+            'media_content': self._extract_media_content_comprehensive,
+            'structured_data': self._extract_structured_data_comprehensive,
+            'metadata': self._extract_metadata_enhanced
         }
 
+        # Skipped fields cost nothing: their extractors never run
+        mall_data = {'url': url}
+        for key, extract in extractors.items():
+            if key in selected:
+                mall_data[key] = extract(soup)
+
         return mall_data
 
     def _extract_mall_name_enhanced(self, soup: BeautifulSoup) -> Optional[str]:
         """Enhanced mall name extraction with multiple fallbacks"""
         # Primary: Look for main heading
-        title_elem = soup.find('h1')
+        title_text = self._clean_mall_title(soup.find('h1'))
+        if title_text:
+            return title_text
+
+        # Secondary: Look for specific mall name patterns
+        return self._match_mall_name_patterns(soup)
+
+    def _clean_mall_title(self, title_elem) -> Optional[str]:
+        """Mall name from the main heading, without the common suffixes"""
         if title_elem:
             title_text = title_elem.get_text(strip=True)
             # Clean up common suffixes
@@ -59,8 +184,10 @@ class EnhancedDataExtractor:
             title_text = re.sub(r'\s*-\s*Retail Properties.*', '', title_text, flags=re.IGNORECASE)
             if len(title_text) > 3:
                 return title_text
+        return None
 
-        # Secondary: Look for specific mall name patterns
+    def _match_mall_name_patterns(self, soup: BeautifulSoup) -> Optional[str]:
+        """Fallback mall name from text patterns anywhere on the page"""
         name_patterns = [
             r'Mall Size in SQM:\s*\d+.*?([A-Za-z\s]+?)(?:\s*-|\s*\|)',
             r'([A-Za-z\s]+?)(?:\s*-|\s*\|).*?Mall'
@@ -111,9 +238,11 @@ class EnhancedDataExtractor:
 
     def _extract_property_details_comprehensive(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract comprehensive property details from Post Details section"""
-        property_details = {}
+        section = self._find_property_details_section(soup)
+        return self._extract_property_details_from_section(section)
 
-        # Find the Post Details section
+    def _find_property_details_section(self, soup: BeautifulSoup):
+        """Locate the Post Details section"""
         post_details_section = None
 
         # Look for various possible selectors for the Post Details section
@@ -132,11 +261,20 @@ class EnhancedDataExtractor:
 
         if not post_details_section:
             # Fallback: look for any div containing "Property 360 View" or similar
-            all_divs = soup.find_all('div')
-            for div in all_divs:
-                if 'Property 360 View' in div.get_text() or 'Type of Property' in div.get_text():
-                    post_details_section = div
-                    break
+            post_details_section = self._find_property_details_fallback(soup)
+
+        return post_details_section
+
+    def _find_property_details_fallback(self, soup: BeautifulSoup):
+        """First div mentioning Post Details fields, for pages without a details container"""
+        for div in soup.find_all('div'):
+            if 'Property 360 View' in div.get_text() or 'Type of Property' in div.get_text():
+                return div
+        return None
+
+    def _extract_property_details_from_section(self, post_details_section) -> Dict[str, Any]:
+        """Extract property details from the located Post Details section"""
+        property_details = {}
 
         if post_details_section:
             # Method 1: Extract using structured HTML parsing (handles expansion automatically)
@@ -149,13 +287,13 @@ class EnhancedDataExtractor:
 
             for key, pattern in fallback_patterns.items():
                 if key not in property_details:  # Only use fallback if not already captured
-                    match = re.search(pattern, text_content, re.IGNORECASE | re.MULTILINE)
+                    match = pattern.search(text_content)
                     if match:
                         value = match.group(1).strip()
                         if value and not value.startswith('http'):  # Skip URLs for now
                             # Clean up numeric values
-                            if key in ['mall_size_sqm', 'gla_sqm', 'levels', 'car_parks', 'retail_outlets', 'annual_footfall']:
-                                value = re.sub(r'[^\d]', '', value)
+                            if key in NUMERIC_FIELDS:
+                                value = NON_DIGIT_RE.sub('', value)
                                 if value.isdigit():
                                     value = int(value)
                             property_details[key] = value
@@ -207,7 +345,7 @@ class EnhancedDataExtractor:
                             value = span.get_text(strip=True)
                         elif 'number' in str(span.get('class', [])):
                             # Clean numeric values
-                            numeric_value = re.sub(r'[^\d]', '', value)
+                            numeric_value = NON_DIGIT_RE.sub('', value)
                             if numeric_value.isdigit():
                                 value = int(numeric_value)
                         elif 'textbox' in str(span.get('class', [])):
@@ -226,59 +364,11 @@ class EnhancedDataExtractor:
 
     def _field_name_to_key(self, field_name: str) -> str:
         """Convert human-readable field names to snake_case keys"""
-        # Remove icons and special characters
-        clean_name = re.sub(r'<[^>]+>', '', field_name)  # Remove HTML tags
-        clean_name = re.sub(r'[^\w\s]', '', clean_name)  # Remove special chars
-        clean_name = clean_name.strip()
-
-        # Handle specific field name mappings
-        field_mappings = {
-            'Property 360 View Link': 'property_360_link',
-            'Type of Property': 'type_of_property',
-            'Mall Size in SQM': 'mall_size_sqm',
-            'GLA in SQM': 'gla_sqm',
-            'No of Level': 'levels',
-            'No of Car Parks': 'car_parks',
-            'No Retail Outlets': 'retail_outlets',
-            'Annual Footfall EstimatedActual': 'annual_footfall',
-            'Year Built': 'year_built',
-            'AnchorNotable Tenants': 'anchor_tenants',
-            'Owner Company Name': 'owner_company',
-            'Managing Agent Company Name': 'managing_agent',
-            'Leasing Agent Company Name': 'leasing_agent',
-            'Main Contractor': 'main_contractor',
-            'Retail Solutions Provider Service Provider Footfall Retail Analytics Technology Others': 'retail_solutions_provider'
-        }
+        return field_name_to_key(field_name)
 
-        # Try exact match first
-        if clean_name in field_mappings:
-            return field_mappings[clean_name]
-
-        # Fallback to automatic conversion
-        key = clean_name.lower().replace(' ', '_')
-        key = re.sub(r'_+', '_', key)  # Remove multiple underscores
-        key = key.strip('_')  # Remove leading/trailing underscores
-
-        return key
-
-    def _get_fallback_regex_patterns(self) -> Dict[str, str]:
-        """Get fallback regex patterns for any fields missed by structured parsing"""
-        return {
-            'property_360_link': r'Property 360 View Link[:\s]*([^\n]+)',
-            'type_of_property': r'Type of Property[:\s]*([^\n]+)',
-            'mall_size_sqm': r'Mall Size in SQM[:\s]*([0-9,]+)',
-            'gla_sqm': r'GLA in SQM[:\s]*([0-9,]+)',
-            'levels': r'No\.?\s*of\s*Level[:\s]*([0-9]+)',
-            'car_parks': r'No\.?\s*of\s*Car\s*Park[:\s]*([0-9,]+)',
-            'retail_outlets': r'No\.?\s*Retail\s*Outlets?[:\s]*([0-9,]+)',
-            'annual_footfall': r'Annual\s*Footfall[:\s]*([0-9,]+)',
-            'year_built': r'Year\s*Built[:\s]*([^\n]+)',
-            'owner_company': r'Owner\s*Company\s*Name[:\s]*([^\n]+)',
-            'managing_agent': r'Managing\s*Agent[:\s]*([^\n]+)',
-            'leasing_agent': r'Leasing\s*Agent[:\s]*([^\n]+)',
-            'main_contractor': r'Main\s*Contractor[:\s]*([^\n]+)',
-            'retail_solutions_provider': r'Retail\s*Solutions\s*Provider[:\s]*([^\n]+)'
-        }
+    def _get_fallback_regex_patterns(self) -> Dict[str, Pattern]:
+        """Get compiled fallback regex patterns for any fields missed by structured parsing"""
+        return FALLBACK_PATTERNS
 
     def _extract_location_data_enhanced(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Enhanced location data extraction"""
@@ -493,27 +583,7 @@ class EnhancedDataExtractor:
 
     def _categorize_tenant(self, tenant_name: str) -> str:
         """Categorize tenant by type based on name"""
-        name_lower = tenant_name.lower()
-
-        categories = {
-            'fashion': ['h&m', 'zara', 'uniqlo', 'gap', 'forever21', 'mango', 'bershka', 'stradivarius', 'pull&bear', 'massimo dutti', 'oysho', 'lefties', 'giordano', 'gant', 'r&b', 'american eagle', 'mothercare', 'monsoon', 'loccitane', 'sephora', 'mac', 'kiko milano', 'the body shop', 'victoria secret', 'bath&body works', 'nayomi', 'aldo', 'mini bounce'],
-            'food': ['starbucks', 'tim hortons', 'caffe nero', 'costa', 'third avenue', 'dip n dip', 'india palace', 'gazebo', 'la brioche', 'coffee club', 'galito', 'chilli', 'nandos', 'bursa kebap evi', 'shake shack', 'barbeque nation', 'mcdonalds', 'burger king', 'pizza hut', 'kfc', 'sushi library', 'villa beirut'],
-            'hypermarket': ['carrefour'],
-            'department_store': ['centrepoint', 'riva', 'red tag', 'matalan', 'max', 'twenty4'],
-            'home_improvement': ['home centre', '2xl home', 'pan home', 'chattles & more'],
-            'entertainment': ['adventure zone', 'zeal entertainment centre', 'fun city', 'royal cinemas', 'e-max'],
-            'electronics': ['sharaf dg', 'jumbo'],
-            'books': ['borders'],
-            'sports': ['fitness first', 'sun & sand sports', 'nike', 'adidas', 'reebok', 'under armour', 'puma', 'skechers'],
-            'pharmacy': ['life pharmacy', 'watsons'],
-            'services': ['yas clinic', 'united furniture']
-        }
-
-        for category, keywords in categories.items():
-            if any(keyword in name_lower for keyword in keywords):
-                return category
-
-        return 'other'
+        return get_tenant_categorizer().categorize(tenant_name)
 
     def calculate_data_completeness_score(self, mall_data: Dict[str, Any]) -> float:
         """Calculate data completeness score"""
@@ -566,41 +636,83 @@ class EnhancedDataExtractor:
 
         return score / total_weight if total_weight > 0 else 0.0
 
-    def extract_streamlined_mall_data(self, html: str, url: str) -> Dict[str, Any]:
+    def extract_streamlined_mall_data(self, html: str, url: str,
+                                      fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Extract only essential mall data in streamlined format.
         Produces clean JSON with only the requested fields.
+
+        Args:
+            html: Raw HTML content
+            url: Mall URL
+            fields: Only extract these keys (see STREAMLINED_FIELDS); None extracts everything
+        """
+        selected = select_fields(fields, STREAMLINED_FIELDS)
+        soup = self._timed_parse(lambda: BeautifulSoup(html, 'lxml'))
+
+        return self._build_streamlined_record(url, selected, {
+            'name': lambda: self._extract_mall_name_enhanced(soup),
+            'external_url': lambda: self._extract_filtered_external_url(soup),
+            'property_details': lambda: self._extract_property_details_comprehensive(soup),
+            'location': lambda: self._extract_location_for_streamlined(soup),
+            'tenants': lambda: self._extract_clean_tenant_data(soup),
+            'first_image': lambda: self._extract_first_image_url(soup),
+            'status': lambda: self._parse_status_fields(soup)
+        })
+
+    def _build_streamlined_record(self, url: str, selected: FrozenSet[str],
+                                  extractors: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
         """
-        soup = BeautifulSoup(html, 'lxml')
+        Assemble a streamlined record, running only the extractors the selection needs
 
+        Args:
+            url: Mall URL
+            selected: Fields to include, from select_fields()
+            extractors: Zero-argument extractor per core field, plus 'status'
+                returning (mall_type, development_status)
+
+        Returns:
+            Streamlined mall data with the selected fields, in the usual key order
+        """
         # Extract core fields
-        mall_data = {
-            'url': url,
-            'name': self._extract_mall_name_enhanced(soup),
-            'external_url': self._extract_filtered_external_url(soup),
-            'property_details': self._extract_property_details_comprehensive(soup),
-            'location': self._extract_location_for_streamlined(soup),
-            'tenants': self._extract_clean_tenant_data(soup),
-            'first_image': self._extract_first_image_url(soup)
-        }
+        mall_data = {'url': url}
+        for key in ('name', 'external_url', 'property_details', 'location', 'tenants',
+                    'first_image'):
+            if key in selected:
+                mall_data[key] = extractors[key]()
 
         # Add parsed status fields
-        mall_type, development_status = self._parse_status_fields(soup)
-        mall_data['mall_type'] = mall_type
-        mall_data['development_status'] = development_status
+        if 'mall_type' in selected or 'development_status' in selected:
+            mall_type, development_status = extractors['status']()
+            if 'mall_type' in selected:
+                mall_data['mall_type'] = mall_type
+            if 'development_status' in selected:
+                mall_data['development_status'] = development_status
 
         # Add total tenants count
-        mall_data['total_tenants'] = len(mall_data['tenants']) if mall_data['tenants'] else 0
+        if 'total_tenants' in selected:
+            tenants = mall_data['tenants'] if 'tenants' in selected else extractors['tenants']()
+            mall_data['total_tenants'] = len(tenants) if tenants else 0
 
         return mall_data
 
     def _parse_status_fields(self, soup: BeautifulSoup) -> tuple[str, str]:
         """Parse status field into mall_type and development_status"""
+        # Get the combined status string
+        status_elem = soup.find('span', class_=lambda x: x and 'badge' in str(x))
+        return self._status_fields_from(
+            status_elem, lambda: soup.find('div', class_=lambda x: x and 'pull-left' in str(x))
+        )
+
+    def _status_fields_from(self, status_elem, find_type_elem) -> tuple[str, str]:
+        """
+        Split the status badge into mall_type and development_status
+
+        find_type_elem is only called when the badge does not carry the type.
+        """
         mall_type = None
         development_status = None
 
-        # Get the combined status string
-        status_elem = soup.find('span', class_=lambda x: x and 'badge' in str(x))
         if status_elem:
             status_text = status_elem.get_text(strip=True)
 
@@ -612,7 +724,7 @@ class EnhancedDataExtractor:
                     development_status = parts[1].strip()
             else:
                 # Fallback: try to extract from property type
-                type_elem = soup.find('div', class_=lambda x: x and 'pull-left' in str(x))
+                type_elem = find_type_elem()
                 if type_elem:
                     type_text = type_elem.get_text(strip=True)
                     if 'Super Regional' in type_text:
@@ -635,43 +747,52 @@ class EnhancedDataExtractor:
 
         candidates = []
         for link in website_links:
-            url = link.get('href')
-            if url:
-                # Skip social media and Google services
-                skip_domains = [
-                    'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com',
-                    'youtube.com', 'google.com', 'maps.google.com', 'x.com',
-                    'ik.imagekit.io', 'imagekit.io'  # Skip image hosting services
-                ]
-
-                # Skip if it's in the skip domains
-                if any(domain in url.lower() for domain in skip_domains):
-                    continue
+            rank = self._rank_external_link(link)
+            if rank is None:
+                continue
+            if rank:
+                return link.get('href')  # High priority match
 
-                # Skip URLs that are likely images or files
-                if any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp']):
-                    continue
+            # Collect other potential website URLs
+            candidates.append(link.get('href'))
 
-                # Skip very long URLs (likely tracking/redirect URLs)
-                if len(url) > 300:
-                    continue
+        # Return first candidate if no high-priority match
+        return candidates[0] if candidates else None
 
-                # Prioritize URLs that look like official websites
-                link_text = link.get_text(strip=True).lower()
-                parent_text = link.parent.get_text(strip=True).lower() if link.parent else ""
+    def _rank_external_link(self, link) -> Optional[bool]:
+        """True for a likely official website link, False for a candidate, None if filtered out"""
+        url = link.get('href')
+        if not url:
+            return None
+
+        # Skip social media and Google services
+        skip_domains = [
+            'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com',
+            'youtube.com', 'google.com', 'maps.google.com', 'x.com',
+            'ik.imagekit.io', 'imagekit.io'  # Skip image hosting services
+        ]
 
-                # Look for website-related keywords in link text or parent
-                website_keywords = ['website', 'official', 'visit', 'www.', '.com', '.net', '.org']
+        # Skip if it's in the skip domains
+        if any(domain in url.lower() for domain in skip_domains):
+            return None
 
-                if any(keyword in link_text or keyword in parent_text or keyword in url.lower()
-                       for keyword in website_keywords):
-                    return url  # High priority match
+        # Skip URLs that are likely images or files
+        if any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp']):
+            return None
 
-                # Collect other potential website URLs
-                candidates.append(url)
+        # Skip very long URLs (likely tracking/redirect URLs)
+        if len(url) > 300:
+            return None
 
-        # Return first candidate if no high-priority match
-        return candidates[0] if candidates else None
+        # Prioritize URLs that look like official websites
+        link_text = link.get_text(strip=True).lower()
+        parent_text = link.parent.get_text(strip=True).lower() if link.parent else ""
+
+        # Look for website-related keywords in link text or parent
+        website_keywords = ['website', 'official', 'visit', 'www.', '.com', '.net', '.org']
+
+        return any(keyword in link_text or keyword in parent_text or keyword in url.lower()
+                   for keyword in website_keywords)
 
     def _extract_location_for_streamlined(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract location data for streamlined format"""
@@ -680,26 +801,41 @@ class EnhancedDataExtractor:
         # Extract coordinates from JavaScript
         scripts = soup.find_all('script')
         for script in scripts:
-            script_text = script.get_text() if script.get_text() else ''
-            lat_match = re.search(r'parseFloat\(([0-9.-]+)\)', script_text)
-            lng_match = re.search(r'parseFloat\(([0-9.-]+)\)', script_text[script_text.find('parseFloat') + 1:] if 'parseFloat' in script_text else '')
-
-            if lat_match and lng_match:
-                try:
-                    location_data['latitude'] = float(lat_match.group(1))
-                    location_data['longitude'] = float(lng_match.group(1))
-                    break
-                except ValueError:
-                    continue
+            coordinates = self._coordinates_from_script(script)
+            if coordinates:
+                location_data['latitude'], location_data['longitude'] = coordinates
+                break
 
         # Extract address
         address_elem = soup.find('div', class_=lambda x: x and 'post_location_map' in str(x))
+        address_text = self._address_from(address_elem)
+        if address_text:
+            location_data['address'] = address_text
+
+        return location_data
+
+    def _coordinates_from_script(self, script) -> Optional[tuple[float, float]]:
+        """Latitude and longitude from a Google Maps script block"""
+        script_text = script.get_text() if script.get_text() else ''
+        lat_match = re.search(r'parseFloat\(([0-9.-]+)\)', script_text)
+        after_lat = (script_text[script_text.find('parseFloat') + 1:]
+                     if 'parseFloat' in script_text else '')
+        lng_match = re.search(r'parseFloat\(([0-9.-]+)\)', after_lat)
+
+        if lat_match and lng_match:
+            try:
+                return float(lat_match.group(1)), float(lng_match.group(1))
+            except ValueError:
+                pass
+        return None
+
+    def _address_from(self, address_elem) -> Optional[str]:
+        """Address text from the location map block"""
         if address_elem:
             address_text = address_elem.get_text(strip=True)
             if len(address_text) > 10:
-                location_data['address'] = address_text
-
-        return location_data
+                return address_text
+        return None
 
     def _extract_clean_tenant_data(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Extract tenant data with only name and category (no search URLs)"""
@@ -710,33 +846,48 @@ class EnhancedDataExtractor:
         tenants = []
 
         for link in tenant_links:
-            tenant_name = link.get_text(strip=True)
-            search_url = link.get('href')
-
-            if tenant_name and len(tenant_name) > 2 and search_url:
-                tenants.append({
-                    'name': tenant_name,
-                    'category': self._categorize_tenant(tenant_name)
-                })
+            tenant = self._tenant_from_link(link)
+            if tenant:
+                tenants.append(tenant)
 
         return tenants
 
+    def _tenant_from_link(self, link) -> Optional[Dict[str, Any]]:
+        """Tenant name and category from a tenant search link"""
+        tenant_name = link.get_text(strip=True)
+        search_url = link.get('href')
+
+        if tenant_name and len(tenant_name) > 2 and search_url:
+            return {
+                'name': tenant_name,
+                'category': self._categorize_tenant(tenant_name)
+            }
+        return None
+
     def _extract_first_image_url(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract only the first property image URL"""
         img_elements = soup.find_all('img')
 
         for img in img_elements:
-            src = img.get('src') or img.get('data-src')
-            alt = img.get('alt', '')
+            src = self._property_image_src(img)
+            if src:
+                return src
 
-            if src and not src.startswith('data:'):
-                # Convert relative URLs to absolute
-                if not src.startswith('http'):
-                    src = f"https://www.mecsr.org{src}"
+        return None
 
-                # Skip logos and icons
-                if not any(skip_word in alt.lower() or skip_word in src.lower()
-                          for skip_word in ['logo', 'icon', 'banner', 'button']):
-                    return src
+    def _property_image_src(self, img) -> Optional[str]:
+        """Absolute image URL unless the image is missing, inline or a logo/icon"""
+        src = img.get('src') or img.get('data-src')
+        alt = img.get('alt', '')
+
+        if src and not src.startswith('data:'):
+            # Convert relative URLs to absolute
+            if not src.startswith('http'):
+                src = f"https://www.mecsr.org{src}"
+
+            # Skip logos and icons
+            if not any(skip_word in alt.lower() or skip_word in src.lower()
+                       for skip_word in ['logo', 'icon', 'banner', 'button']):
+                return src
 
         return None
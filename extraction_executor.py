@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Executor-backed Extraction Stage
+
+Runs the CPU-bound BeautifulSoup parsing of mall pages in a process pool, so
+network I/O keeps flowing on the event loop while pages are being parsed.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, Iterable, FrozenSet, Tuple
+
+from config import settings
+from enhanced_extractor import EnhancedDataExtractor, select_fields
+from lxml_extractor import LxmlExtractor
+from single_pass_extractor import SinglePassExtractor
+from utils.constants import (
+    EXTRACTOR_BS4, EXTRACTOR_SINGLE_PASS, EXTRACTOR_LXML, EXTRACTOR_VERSION, STREAMLINED_FIELDS,
+    METRIC_PARSE, METRIC_EXTRACT
+)
+from utils.metrics import MetricsRegistry, get_metrics_registry
+
+
+# Per-process extractor, created once by the pool initializer
+_worker_extractor: Optional[EnhancedDataExtractor] = None
+
+# Extracted record with its parse and extract seconds
+TimedRecord = Tuple[Dict[str, Any], float, float]
+
+
+def create_extractor(backend: Optional[str] = None) -> EnhancedDataExtractor:
+    """
+    Create the streamlined extractor for a backend
+
+    Args:
+        backend: "bs4", "single_pass" or "lxml"; None uses the EXTRACTOR_BACKEND setting
+
+    Returns:
+        Extractor whose extract_streamlined_mall_data implements the backend
+    """
+    backend = backend or settings.extractor_backend
+    if backend == EXTRACTOR_LXML:
+        return LxmlExtractor()
+    if backend == EXTRACTOR_SINGLE_PASS:
+        return SinglePassExtractor()
+    if backend == EXTRACTOR_BS4:
+        return EnhancedDataExtractor()
+    raise ValueError(f"Unknown extractor backend: {backend}")
+
+
+def _init_worker(backend: Optional[str] = None):
+    """Create the extractor used by this worker process"""
+    global _worker_extractor
+    _worker_extractor = create_extractor(backend)
+
+
+def _timed_extract(extractor: EnhancedDataExtractor, html: str, url: str,
+                   fields: Optional[FrozenSet[str]] = None) -> TimedRecord:
+    """Extract a streamlined record, returning it with the parse and extract seconds"""
+    extractor.last_parse_time = 0.0
+    start = time.perf_counter()
+    record = extractor.extract_streamlined_mall_data(html, url, fields)
+    elapsed = time.perf_counter() - start
+    return record, extractor.last_parse_time, elapsed - extractor.last_parse_time
+
+
+def _extract_timed_in_worker(html: str, url: str,
+                             fields: Optional[FrozenSet[str]] = None) -> TimedRecord:
+    """Extract a streamlined mall record inside a worker process, with its parse/extract timings"""
+    if _worker_extractor is None:
+        _init_worker()
+    return _timed_extract(_worker_extractor, html, url, fields)
+
+
+class ExtractionExecutor:
+    """Turns raw HTML into streamlined mall dicts off the event loop"""
+
+    def __init__(self, max_workers: Optional[int] = None, backend: Optional[str] = None,
+                 fields: Optional[Iterable[str]] = None, metrics: Optional[MetricsRegistry] = None):
+        """
+        Initialize the ExtractionExecutor
+
+        Args:
+            max_workers: Worker processes to use; None means one per CPU core,
+                0 runs extraction inline on the event loop
+            backend: Extractor backend; None uses the EXTRACTOR_BACKEND setting
+            fields: Streamlined fields to extract; None extracts every field
+            metrics: Registry receiving parse and extract timings (default: process-wide registry)
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 0:
+            raise ValueError(f"max_workers must be >= 0, got {max_workers}")
+
+        self.max_workers = max_workers
+        self.backend = backend or settings.extractor_backend
+        self.fields = select_fields(fields, STREAMLINED_FIELDS) if fields is not None else None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inline_extractor: Optional[EnhancedDataExtractor] = None
+
+        # Timed inside the worker, so pool queueing and pickling are not counted
+        self.metrics = metrics or get_metrics_registry()
+        self._parse_seconds = self.metrics.histogram(METRIC_PARSE, "HTML parse time per mall page")
+        self._extract_seconds = self.metrics.histogram(METRIC_EXTRACT,
+                                                       "Field extraction time per mall page")
+
+        # Fail fast on a misconfigured backend, and keep the inline extractor
+        extractor = create_extractor(self.backend)
+        if max_workers == 0:
+            self._inline_extractor = extractor
+
+    @property
+    def inline(self) -> bool:
+        """Whether extraction runs on the event loop instead of a process pool"""
+        return self.max_workers == 0
+
+    @property
+    def cache_variant(self) -> str:
+        """Key separating cached records by backend, extractor version and field projection"""
+        fields = ','.join(sorted(self.fields)) if self.fields is not None else '*'
+        return f"{self.backend}:v{EXTRACTOR_VERSION}:{fields}"
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.backend,)
+            )
+        return self._executor
+
+    async def extract(self, html: str, url: str) -> Dict[str, Any]:
+        """
+        Extract a streamlined mall record from raw HTML
+
+        Args:
+            html: Raw HTML content
+            url: Mall URL
+
+        Returns:
+            Streamlined mall data dictionary
+        """
+        if self.inline:
+            record, parse_time, extract_time = _timed_extract(self._inline_extractor, html, url,
+                                                              self.fields)
+        else:
+            loop = asyncio.get_running_loop()
+            record, parse_time, extract_time = await loop.run_in_executor(
+                self._get_executor(), _extract_timed_in_worker, html, url, self.fields
+            )
+
+        self._parse_seconds.observe(parse_time)
+        self._extract_seconds.observe(extract_time)
+        return record
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Listing-only export of MECSR mall data.
+
+Builds partial mall records (name, URL, property type, status, IDs, coordinates)
+straight from the directory listing cards, so a full refresh costs one request
+per directory page. Records missing a required field can optionally be
+completed from their detail page.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from scrapers.detail_extractor import DetailExtractor
+from scrapers.rate_limiter import TokenBucketRateLimiter
+from scrapers.response_cache import ResponseCache
+from scrapers.session_pool import SessionPool
+from config import settings
+from extraction_executor import create_extractor
+from utils.constants import (
+    OUTPUT_DIR, OUTPUT_LISTING_PATTERN, TIMESTAMP_FORMAT,
+    LISTING_REQUIRED_FIELDS, MAX_PAGES_TO_SCRAPE
+)
+from utils.helpers import ensure_directory, get_iso_timestamp
+
+
+def missing_fields(record: Dict[str, Any],
+                   required_fields: List[str] = LISTING_REQUIRED_FIELDS) -> List[str]:
+    """Required fields a listing record has no value for"""
+    return [field for field in required_fields if record.get(field) in (None, '')]
+
+
+def _detail_fields(mall_extractor, html: str, url: str) -> Dict[str, Any]:
+    """Map streamlined detail-page data onto listing record fields"""
+    mall_data = mall_extractor.extract_streamlined_mall_data(html, url)
+    location = mall_data.get('location') or {}
+    return {
+        'name': mall_data.get('name'),
+        'property_type': mall_data.get('mall_type'),
+        'status': mall_data.get('development_status'),
+        'latitude': location.get('latitude'),
+        'longitude': location.get('longitude')
+    }
+
+
+async def enrich_listing_records(extractor: DetailExtractor,
+                                 records: List[Dict[str, Any]],
+                                 required_fields: List[str] = LISTING_REQUIRED_FIELDS,
+                                 max_concurrent: int = 3) -> int:
+    """
+    Fill missing required fields from each incomplete record's detail page
+
+    Args:
+        extractor: DetailExtractor whose crawler fetches the detail pages
+        records: Listing records, updated in place
+        required_fields: Fields every record should have
+        max_concurrent: Concurrent detail page requests
+
+    Returns:
+        Number of detail pages fetched
+    """
+    incomplete = [record for record in records if missing_fields(record, required_fields)]
+    if not incomplete:
+        return 0
+
+    print(f"🔎 Enriching {len(incomplete)} incomplete records from their detail pages")
+    semaphore = asyncio.Semaphore(max_concurrent)
+    mall_extractor = create_extractor()
+
+    async def enrich(record: Dict[str, Any]):
+        async with semaphore:
+            result = await extractor.crawler.crawl_single_page(record['url'])
+            if not result or not result.get('success'):
+                return
+
+            try:
+                detail_fields = _detail_fields(mall_extractor, result['html'], record['url'])
+            except Exception as e:
+                print(f"    ⚠️ Could not extract {record['url']}: {e}")
+                return
+
+            # Listing values win; the detail page only fills the gaps
+            for field in missing_fields(record, required_fields):
+                if detail_fields.get(field) not in (None, ''):
+                    record[field] = detail_fields[field]
+            record['enriched'] = True
+
+    await asyncio.gather(*(enrich(record) for record in incomplete))
+    return len(incomplete)
+
+
+def save_listing_records(records: List[Dict[str, Any]], output_file: str, detail_requests: int = 0):
+    """Save listing records to JSON"""
+    output = {
+        'metadata': {
+            'scraped_at': get_iso_timestamp(),
+            'mode': 'listing',
+            'total_malls': len(records),
+            'complete_records': sum(1 for record in records if not missing_fields(record)),
+            'detail_requests': detail_requests,
+            'scraper_version': 'simple_v1.0'
+        },
+        'malls': records
+    }
+
+    output_path = Path(output_file)
+    ensure_directory(str(output_path.parent))
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+    print(f"💾 Results saved to: {output_file}")
+
+
+async def export_listing(num_pages: int = MAX_PAGES_TO_SCRAPE, enrich: bool = False,
+                         output_file: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Run a listing-only export
+
+    Args:
+        num_pages: Number of directory pages to scan
+        enrich: Fetch detail pages for records missing a required field
+        output_file: Output JSON file (default: timestamped file in output/)
+
+    Returns:
+        List of listing records
+    """
+    session_pool = SessionPool()
+    extractor = DetailExtractor(
+        session_pool=session_pool,
+        rate_limiter=TokenBucketRateLimiter.from_settings(),
+        response_cache=ResponseCache.from_settings() if settings.cache_enabled else None,
+        base_url=settings.base_url
+    )
+
+    try:
+        start = time.perf_counter()
+        records = await extractor.collect_listing_records_async(num_pages=num_pages,
+                                                                max_concurrent=2)
+        detail_requests = await enrich_listing_records(extractor, records) if enrich else 0
+        elapsed = time.perf_counter() - start
+    finally:
+        await session_pool.close()
+
+    if not records:
+        print("❌ No listing cards found!")
+        return records
+
+    complete = sum(1 for record in records if not missing_fields(record))
+    print(f"✅ {len(records)} malls ({complete} complete) "
+          f"from {num_pages + detail_requests} requests in {elapsed:.1f}s")
+
+    if not output_file:
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        output_file = f"{OUTPUT_DIR}/{OUTPUT_LISTING_PATTERN.format(timestamp=timestamp)}"
+    save_listing_records(records, output_file, detail_requests)
+    return records
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Export mall records from the directory listing cards only")
+    parser.add_argument("--pages", type=int, default=MAX_PAGES_TO_SCRAPE,
+                        help=f"Directory pages to scan (default: {MAX_PAGES_TO_SCRAPE})")
+    parser.add_argument("--enrich", action="store_true",
+                        help="Fetch the detail page of records missing a required field")
+    parser.add_argument("--output", default=None,
+                        help="Output JSON file (default: timestamped file in output/)")
+    args = parser.parse_args(argv)
+
+    print("📋 MECSR Listing Export")
+    print("=" * 40)
+    asyncio.run(export_listing(num_pages=args.pages, enrich=args.enrich, output_file=args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+lxml Streamlined Extractor
+
+Alternate backend for the streamlined mall record that parses with lxml
+directly and locates fields with precompiled XPath expressions, skipping the
+BeautifulSoup tree build and its lambda class matchers. Field rules are shared
+with EnhancedDataExtractor, so the output schema and values are the same.
+"""
+
+from typing import Dict, Any, Iterator, Iterable, Optional
+from lxml import etree
+
+from enhanced_extractor import EnhancedDataExtractor, NON_DIGIT_RE, select_fields
+from utils.constants import STREAMLINED_FIELDS
+
+
+# Tags whose strings BeautifulSoup leaves out of a parent's get_text()
+_SKIPPED_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+
+def _first_with_class(tag: str, needle: str) -> etree.XPath:
+    """XPath for the first tag whose class attribute contains needle"""
+    return etree.XPath(f"(//{tag}[contains(normalize-space(@class), '{needle}')])[1]")
+
+
+_FIRST_H1 = etree.XPath("(//h1)[1]")
+_WEBSITE_LINKS = etree.XPath(
+    "//a[starts-with(@href, 'http') and not(contains(@href, 'mecsr.org'))]"
+)
+_TENANT_LINKS = etree.XPath("//a[contains(@href, '?q=')]")
+_SCRIPTS = etree.XPath("//script")
+_IMAGES = etree.XPath("//img")
+_ADDRESS = _first_with_class('div', 'post_location_map')
+_PROPERTY_TYPE = _first_with_class('div', 'pull-left')
+_STATUS_BADGE = _first_with_class('span', 'badge')
+
+# Post Details container, same priority order as EnhancedDataExtractor's CSS selectors
+# (.post-details is left out: [class*="post-details"] always matches first)
+_DETAILS_SELECTORS = [
+    _first_with_class('*', 'post-details'),
+    etree.XPath("(//*[@id='post-details'])[1]"),
+    _first_with_class('div', 'detail'),
+    _first_with_class('section', 'detail')
+]
+
+_TABLE_GROUPS = etree.XPath(".//div[contains(normalize-space(@class), 'table-view-group')]")
+_FIELD_NAME = etree.XPath("(.//div[contains(normalize-space(@class), 'bold')])[1]")
+_FIELD_VALUE = etree.XPath("(.//div[contains(normalize-space(@class), 'col-sm-8')])[1]")
+_VALUE_LINK = etree.XPath("(.//a[@href])[1]")
+_VALUE_SPAN = etree.XPath("(.//span)[1]")
+
+_PARSER = etree.HTMLParser()
+
+
+def _iter_text(element) -> Iterator[str]:
+    """Text pieces of an element, as BeautifulSoup's get_text() collects them"""
+    if element.tag in _SKIPPED_TEXT_TAGS:
+        yield from element.itertext()  # Asked directly, their own strings count
+        return
+
+    if element.text:
+        yield element.text
+    for child in element:
+        # Comments and processing instructions have a non-string tag; only their tail is text
+        if isinstance(child.tag, str) and child.tag not in _SKIPPED_TEXT_TAGS:
+            yield from _iter_text(child)
+        if child.tail:
+            yield child.tail
+
+
+def _first(xpath: etree.XPath, element) -> Optional["_Node"]:
+    """First XPath match wrapped as a _Node"""
+    matches = xpath(element)
+    return _Node(matches[0]) if matches else None
+
+
+class _Node:
+    """Minimal BeautifulSoup-style view of an lxml element for the shared field helpers"""
+
+    __slots__ = ('element',)
+
+    def __init__(self, element):
+        self.element = element
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.element.get(name, default)
+
+    def get_text(self, strip: bool = False) -> str:
+        if strip:
+            return ''.join(text.strip() for text in _iter_text(self.element) if text.strip())
+        return ''.join(_iter_text(self.element))
+
+    @property
+    def parent(self) -> Optional["_Node"]:
+        parent = self.element.getparent()
+        return _Node(parent) if parent is not None else None
+
+
+class LxmlExtractor(EnhancedDataExtractor):
+    """Streamlined extractor backed by lxml and precompiled XPath"""
+
+    def extract_streamlined_mall_data(self, html: str, url: str,
+                                      fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Extract only essential mall data in streamlined format.
+        Same output as EnhancedDataExtractor.extract_streamlined_mall_data.
+        """
+        selected = select_fields(fields, STREAMLINED_FIELDS)
+        try:
+            root = self._timed_parse(lambda: etree.fromstring(html, _PARSER)) if html else None
+        except ValueError:
+            root = None  # e.g. an XML encoding declaration in a str document
+        if root is None:
+            return super().extract_streamlined_mall_data(html, url, selected)
+
+        return self._build_streamlined_record(url, selected, {
+            'name': lambda: (self._clean_mall_title(_first(_FIRST_H1, root))
+                             or self._match_mall_name_patterns(_Node(root))),
+            'external_url': lambda: self._lxml_external_url(root),
+            'property_details': lambda: self._extract_property_details_from_section(
+                self._lxml_details_section(root)
+            ),
+            'location': lambda: self._lxml_location(root),
+            'tenants': lambda: self._lxml_tenants(root),
+            'first_image': lambda: self._lxml_first_image(root),
+            'status': lambda: self._status_fields_from(
+                _first(_STATUS_BADGE, root), lambda: _first(_PROPERTY_TYPE, root)
+            )
+        })
+
+    def _lxml_external_url(self, root) -> Optional[str]:
+        """Official website link, first plain candidate otherwise"""
+        candidate = None
+        for link in _WEBSITE_LINKS(root):
+            rank = self._rank_external_link(_Node(link))
+            if rank:
+                return link.get('href')
+            if rank is not None and candidate is None:
+                candidate = link.get('href')
+        return candidate
+
+    def _lxml_details_section(self, root) -> Optional[_Node]:
+        """Post Details container, or the first div mentioning its fields"""
+        for selector in _DETAILS_SELECTORS:
+            section = _first(selector, root)
+            if section is not None:
+                return section
+
+        for div in root.iter('div'):
+            text = _Node(div).get_text()
+            if 'Property 360 View' in text or 'Type of Property' in text:
+                return _Node(div)
+        return None
+
+    def _extract_structured_table_data(self, post_details_section) -> Dict[str, Any]:
+        """Structured Post Details rows; BeautifulSoup sections go to the base implementation"""
+        if not isinstance(post_details_section, _Node):
+            return super()._extract_structured_table_data(post_details_section)
+
+        structured_data = {}
+        for group in _TABLE_GROUPS(post_details_section.element):
+            try:
+                field_name_div = _first(_FIELD_NAME, group)
+                if not field_name_div:
+                    continue
+                field_name = field_name_div.get_text(strip=True)
+
+                value_div = _FIELD_VALUE(group)
+                if not value_div:
+                    continue
+
+                value = None
+                link = _VALUE_LINK(value_div[0])
+                span = _VALUE_SPAN(value_div[0])
+                if link:
+                    # Handle URLs (like Property 360 View Link)
+                    value = link[0].get('href')
+                    if value and not value.startswith('http'):
+                        value = f"https://www.mecsr.org{value}"
+                elif span:
+                    value = _Node(span[0]).get_text(strip=True)
+                    span_class = span[0].get('class') or ''
+                    if 'number' in span_class and 'select' not in span_class:
+                        # Clean numeric values
+                        numeric_value = NON_DIGIT_RE.sub('', value)
+                        if numeric_value.isdigit():
+                            value = int(numeric_value)
+
+                if value and field_name:
+                    structured_data[self._field_name_to_key(field_name)] = value
+
+            except Exception:
+                # Skip problematic groups and continue
+                continue
+
+        return structured_data
+
+    def _lxml_location(self, root) -> Dict[str, Any]:
+        """Coordinates from the map script and the address block"""
+        location_data = {}
+
+        for script in _SCRIPTS(root):
+            coordinates = self._coordinates_from_script(_Node(script))
+            if coordinates:
+                location_data['latitude'], location_data['longitude'] = coordinates
+                break
+
+        address_text = self._address_from(_first(_ADDRESS, root))
+        if address_text:
+            location_data['address'] = address_text
+
+        return location_data
+
+    def _lxml_tenants(self, root) -> list:
+        """Tenant names and categories from tenant search links"""
+        tenants = []
+        for link in _TENANT_LINKS(root):
+            tenant = self._tenant_from_link(_Node(link))
+            if tenant:
+                tenants.append(tenant)
+        return tenants
+
+    def _lxml_first_image(self, root) -> Optional[str]:
+        """First property image URL"""
+        for img in _IMAGES(root):
+            src = self._property_image_src(_Node(img))
+            if src:
+                return src
+        return None
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Re-extract MECSR mall data from a raw page archive.
+
+Replays every archived mall page through the streamlined extractor without any
+network access, so extraction changes can be applied to a previous crawl in
+seconds instead of re-scraping the whole site.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from extraction_executor import ExtractionExecutor
+from scrapers.page_archive import PageArchive
+from utils.constants import OUTPUT_DIR, OUTPUT_FILE_PATTERN, TIMESTAMP_FORMAT
+from utils.helpers import create_error_result
+from utils.storage import save_results_json
+
+
+def is_mall_detail_url(url: str) -> bool:
+    """Whether an archived URL is a mall detail page rather than a directory page"""
+    return '/directory-shopping-centres/' in url and '?page=' not in url
+
+
+def re_extract_archive(archive_path: str, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run the streamlined extractor over every mall page in an archive
+
+    Args:
+        archive_path: Archive path (with or without the .warc.gz suffix)
+        workers: Worker processes; None means one per CPU core, 0 runs inline
+
+    Returns:
+        List of result dictionaries in the same shape the scraper produces
+    """
+    archive = PageArchive(archive_path)
+    pages = [(entry, html) for entry, html in archive.iter_pages()
+             if is_mall_detail_url(entry['url'])]
+    extracted = asyncio.run(_extract_pages(pages, workers))
+
+    results = []
+    for (entry, _), mall_data in zip(pages, extracted):
+        if isinstance(mall_data, Exception):
+            results.append(create_error_result(str(mall_data), entry['url']))
+        else:
+            results.append({
+                'url': entry['url'],
+                'success': True,
+                'data': mall_data,
+                'response_time': entry.get('response_time', 0.0),
+                'scraped_at': entry.get('fetched_at')
+            })
+    return results
+
+
+async def _extract_pages(pages: List[tuple], workers: Optional[int]) -> List[Any]:
+    """Extract every (entry, html) page, returning each record or the exception it raised"""
+    extraction = ExtractionExecutor(max_workers=workers)
+    try:
+        return await asyncio.gather(
+            *(extraction.extract(html, entry['url']) for entry, html in pages),
+            return_exceptions=True
+        )
+    finally:
+        extraction.shutdown()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Re-extract mall data from a raw page archive")
+    parser.add_argument("archive",
+                        help="Archive path, e.g. output/archive/mecsr_pages_20250913_142810")
+    parser.add_argument("--output", default=None,
+                        help="Output JSON file (default: timestamped file in output/)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Extraction processes (default: one per CPU core, 0 = inline)")
+    args = parser.parse_args(argv)
+
+    print(f"🗃️ Re-extracting from archive: {args.archive}")
+    start = time.perf_counter()
+    results = re_extract_archive(args.archive, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    if not results:
+        print("❌ No mall pages found in archive!")
+        return
+
+    successes = sum(1 for r in results if r.get('success'))
+    print(f"✅ Re-extracted {successes}/{len(results)} malls in {elapsed:.1f}s "
+          f"({len(results) / elapsed if elapsed > 0 else 0:.1f} pages/sec)")
+
+    output_file = args.output
+    if not output_file:
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        output_file = f"{OUTPUT_DIR}/{OUTPUT_FILE_PATTERN.format(timestamp=timestamp)}"
+
+    save_results_json(results, output_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Adaptive concurrency control for MECSR scraping.
+Additive-increase/multiplicative-decrease (AIMD) limit on in-flight requests,
+raised while responses stay fast and clean and cut back on throttling or server errors.
+"""
+
+from typing import Optional, Dict, Any
+import asyncio
+import time
+
+
+# Status codes and exception types that mean the site is overloaded or pushing back
+THROTTLE_STATUS = 429
+TIMEOUT_ERROR_TYPES = frozenset(['TimeoutError', 'ServerTimeoutError', 'ConnectionTimeoutError',
+                                 'SocketTimeoutError'])
+
+
+class AdaptiveConcurrencyController:
+    """Async limit on concurrent requests, tuned from response outcomes (AIMD)"""
+
+    def __init__(self,
+                 initial: int = 3,
+                 min_concurrency: int = 1,
+                 max_concurrency: int = 16,
+                 decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0):
+        """
+        Initialize the AdaptiveConcurrencyController
+
+        Args:
+            initial: Starting limit, clamped to [min_concurrency, max_concurrency]
+            min_concurrency: Lowest limit backoff can reach
+            max_concurrency: Highest limit growth can reach
+            decrease_factor: Multiplier applied to the limit on 429/5xx/timeouts
+            latency_tolerance: Growth pauses while smoothed latency exceeds the
+                fastest observed latency by this factor
+
+        Raises:
+            ValueError: If the bounds or factors are invalid
+        """
+        if min_concurrency < 1:
+            raise ValueError(f"min_concurrency must be >= 1, got {min_concurrency}")
+        if max_concurrency < min_concurrency:
+            raise ValueError(f"max_concurrency ({max_concurrency}) must be >= "
+                             f"min_concurrency ({min_concurrency})")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be between 0 and 1, got {decrease_factor}")
+        if latency_tolerance < 1:
+            raise ValueError(f"latency_tolerance must be >= 1, got {latency_tolerance}")
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        # Fractional limit: each healthy response adds 1/limit, i.e. +1 per round of requests
+        self._limit = float(min(max(initial, min_concurrency), max_concurrency))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+        self._min_latency: Optional[float] = None
+        self._smoothed_latency: Optional[float] = None
+        self._last_decrease = 0.0
+
+        self.stats = {
+            'initial_limit': int(self._limit),
+            'peak_limit': int(self._limit),
+            'increases': 0,
+            'decreases': 0,
+            'congestion_signals': 0
+        }
+
+    @classmethod
+    def from_settings(cls, initial: Optional[int] = None) -> "AdaptiveConcurrencyController":
+        """
+        Build a controller from ScrapingSettings
+
+        Args:
+            initial: Starting limit; None starts at the configured minimum
+
+        Returns:
+            Configured AdaptiveConcurrencyController
+        """
+        from config import settings
+
+        return cls(
+            initial=initial or settings.min_concurrency,
+            min_concurrency=settings.min_concurrency,
+            max_concurrency=settings.max_concurrency,
+            decrease_factor=settings.concurrency_decrease_factor,
+            latency_tolerance=settings.concurrency_latency_tolerance
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return int(self._limit)
+
+    async def acquire(self):
+        """Wait for a free slot under the current limit"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def release(self):
+        """Free a slot and wake waiters that now fit under the limit"""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
+    def record_result(self, result: Dict[str, Any]):
+        """
+        Adjust the limit from a crawl result
+
+        Args:
+            result: Crawl result with status_code / error_type and response_time
+        """
+        status_code = result.get('status_code')
+        if status_code == THROTTLE_STATUS or (status_code or 0) >= 500 \
+                or result.get('error_type') in TIMEOUT_ERROR_TYPES:
+            self._on_congestion()
+        elif result.get('success'):
+            self._on_success(result.get('response_time', 0.0))
+
+    def _on_success(self, latency: float):
+        """Additive increase while latency stays near the best seen"""
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += 0.2 * (latency - self._smoothed_latency)
+
+        if self._smoothed_latency > self._min_latency * self.latency_tolerance:
+            return  # Queueing somewhere: hold the limit
+
+        previous = int(self._limit)
+        self._limit = min(self.max_concurrency, self._limit + 1.0 / self._limit)
+        if int(self._limit) > previous:
+            self.stats['increases'] += 1
+            self.stats['peak_limit'] = max(self.stats['peak_limit'], int(self._limit))
+
+    def _on_congestion(self):
+        """Multiplicative decrease, at most once per round trip"""
+        self.stats['congestion_signals'] += 1
+
+        # Requests already in flight report the same overload; back off once for all of them
+        now = time.monotonic()
+        if now - self._last_decrease < (self._smoothed_latency or 0.0):
+            return
+
+        self._last_decrease = now
+        decreased = max(float(self.min_concurrency), self._limit * self.decrease_factor)
+        if int(decreased) < int(self._limit):
+            self.stats['decreases'] += 1
+        self._limit = decreased
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get controller statistics
+
+        Returns:
+            Dictionary with the current and peak limit and adjustment counts
+        """
+        stats = dict(self.stats)
+        stats['limit'] = self.limit
+        stats['min_concurrency'] = self.min_concurrency
+        stats['max_concurrency'] = self.max_concurrency
+        stats['smoothed_latency'] = self._smoothed_latency
+        return stats
@@ -3,25 +3,84 @@ DetailExtractor component for MECSR directory scraping.
 Extracts individual mall data from HTML pages, focusing on links, coordinates, and detailed property information.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable
 import re
+import json
 import asyncio
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from scrapers.concurrency_controller import AdaptiveConcurrencyController
 from scrapers.pagination_crawler import PaginationCrawler
+from scrapers.rate_limiter import TokenBucketRateLimiter
+from scrapers.response_cache import ResponseCache
+from scrapers.retry import RetryPolicy
+from scrapers.page_archive import PageArchive
+from scrapers.session_pool import SessionPool
+from utils.constants import BASE_URL
+
+
+# Directory pages only need their anchors parsed to harvest mall links
+MALL_LINK_STRAINER = SoupStrainer('a', href=True)
 
 
 class DetailExtractor:
     """Extractor for individual mall data from MECSR directory HTML"""
 
-    def __init__(self):
-        """Initialize the DetailExtractor"""
-        pass
+    def __init__(self,
+                 session_pool: Optional[SessionPool] = None,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 base_url: str = BASE_URL,
+                 archive: Optional[PageArchive] = None):
+        """
+        Initialize the DetailExtractor
+
+        Args:
+            session_pool: Shared SessionPool so every phase reuses the same connections
+            rate_limiter: Shared rate limiter so discovery counts against the same budget
+            response_cache: On-disk HTTP cache for revalidating directory pages
+            concurrency_controller: Shared adaptive concurrency limit
+            retry_policy: Retries transient directory page failures; None fetches once
+            base_url: Site root every directory and mall URL is built on, e.g. a local
+                fixture server instead of the live site
+            archive: Page archive that also receives the directory pages
+        """
+        self.retry_policy = retry_policy
+        self.base_url = base_url.rstrip('/')
+        self.directory_url = f"{self.base_url}/directory-shopping-centres"
+        self.crawler = PaginationCrawler(
+            base_url=self.base_url,
+            session_pool=session_pool,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            concurrency_controller=concurrency_controller,
+            archive=archive
+        )
+        # Directory pages that could not be fetched by the latest collect_mall_urls_async call
+        self.failed_directory_pages: List[int] = []
+
+    def _absolute_url(self, link: str) -> str:
+        """Resolve a site-relative link against base_url"""
+        return link if link.startswith('http') else f"{self.base_url}{link}"
+
+    async def _fetch_directory_page(self, page_url: str) -> Optional[Dict]:
+        """Fetch a directory page, with retries when a retry policy is set"""
+        if self.retry_policy:
+            return await self.crawler.crawl_with_retries(page_url, self.retry_policy)
+        return await self.crawler.crawl_single_page(page_url)
+
+    async def cleanup(self):
+        """Release the crawler's session if it is not borrowed from a shared pool"""
+        await self.crawler.cleanup()
 
     def extract_mall_links(self, html: str) -> List[str]:
         """
         Extract mall links from HTML
 
+        Only anchors with an href are parsed, the rest of the page is skipped.
+
         Args:
             html: Raw HTML content
 
@@ -31,22 +90,20 @@ class DetailExtractor:
         if not html:
             return []
 
-
-        soup = BeautifulSoup(html, 'html.parser')
-        links = []
+        anchors = BeautifulSoup(html, 'html.parser', parse_only=MALL_LINK_STRAINER)
+        links = {}  # Ordered set: keeps page order, constant-time duplicate check
 
         # Find all links to mall detail pages
-        for link in soup.find_all('a', href=True):
+        for link in anchors.find_all('a', href=True):
             href = link.get('href')
             if href and '/directory-shopping-centres/' in href and href != '/directory-shopping-centres/':
                 # Keep relative URLs for consistency
                 if href.startswith('http'):
                     # Convert to relative URL
                     href = href.replace('https://www.mecsr.org', '')
-                if href not in links:  # Avoid duplicates
-                    links.append(href)
+                links[href] = None
 
-        return links
+        return list(links)
 
     def extract_mall_data(self, html: str) -> List[Dict[str, any]]:
         """
@@ -177,41 +234,51 @@ class DetailExtractor:
         """
         try:
             # Convert relative URL to absolute URL
-            if not mall_url.startswith('http'):
-                mall_url = f"https://www.mecsr.org{mall_url}"
+            mall_url = self._absolute_url(mall_url)
 
-            # Import here to avoid circular imports
-            from scrapers.pagination_crawler import PaginationCrawler
-
-            crawler = PaginationCrawler()
-            result = await crawler.crawl_single_page(mall_url)
+            result = await self.crawler.crawl_single_page(mall_url)
 
             if result and result.get('success') and result.get('html'):
-                html = result['html']
-
-                # Extract coordinates from Google Maps JavaScript
-                lat_match = re.search(r'parseFloat\(([0-9.-]+)\)', html)
-                lng_match = re.search(r'parseFloat\(([0-9.-]+)\)', html[html.find('parseFloat') + 1:])
-
-                if lat_match and lng_match:
-                    try:
-                        latitude = float(lat_match.group(1))
-                        longitude = float(lng_match.group(1))
-
-                        # Validate coordinate ranges
-                        if -90 <= latitude <= 90 and -180 <= longitude <= 180:
-                            return {
-                                'latitude': latitude,
-                                'longitude': longitude
-                            }
-                    except ValueError:
-                        pass
+                return self.extract_coordinates(result['html'])
 
         except Exception as e:
             print(f"Error extracting coordinates from {mall_url}: {e}")
 
         return None
 
+    def extract_coordinates(self, html: str) -> Optional[Dict[str, float]]:
+        """
+        Extract coordinates from an already fetched mall detail page
+
+        Args:
+            html: HTML content of a mall detail page
+
+        Returns:
+            Dictionary with lat/lng coordinates or None
+        """
+        if not html:
+            return None
+
+        # Extract coordinates from Google Maps JavaScript
+        lat_match = re.search(r'parseFloat\(([0-9.-]+)\)', html)
+        lng_match = re.search(r'parseFloat\(([0-9.-]+)\)', html[html.find('parseFloat') + 1:])
+
+        if lat_match and lng_match:
+            try:
+                latitude = float(lat_match.group(1))
+                longitude = float(lng_match.group(1))
+
+                # Validate coordinate ranges
+                if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+                    return {
+                        'latitude': latitude,
+                        'longitude': longitude
+                    }
+            except ValueError:
+                pass
+
+        return None
+
     async def extract_external_urls(self, mall_html: str) -> List[str]:
         """
         Extract external URLs from mall detail pages (More Details buttons)
@@ -225,7 +292,10 @@ class DetailExtractor:
         if not mall_html:
             return []
 
-        soup = BeautifulSoup(mall_html, 'html.parser')
+        return self._extract_external_urls_from_soup(BeautifulSoup(mall_html, 'html.parser'))
+
+    def _extract_external_urls_from_soup(self, soup: BeautifulSoup) -> List[str]:
+        """Extract external "More Details" URLs from a parsed mall page"""
         external_urls = []
 
         # Look for "More Details" buttons that link to external sites
@@ -257,7 +327,10 @@ class DetailExtractor:
         if not mall_html:
             return {}
 
-        soup = BeautifulSoup(mall_html, 'html.parser')
+        return self._extract_detailed_info_from_soup(BeautifulSoup(mall_html, 'html.parser'))
+
+    def _extract_detailed_info_from_soup(self, soup: BeautifulSoup) -> Dict[str, any]:
+        """Extract detailed property information from a parsed mall page"""
         details = {}
 
         # Extract property details from various sections
@@ -272,7 +345,6 @@ class DetailExtractor:
         json_scripts = soup.find_all('script', type='application/ld+json')
         for script in json_scripts:
             try:
-                import json
                 data = json.loads(script.string)
                 if isinstance(data, dict) and data.get('@type') in ['Place', 'LocalBusiness', 'Organization']:
                     self._extract_from_json_ld(data, details)
@@ -292,6 +364,37 @@ class DetailExtractor:
 
         return details
 
+    def extract_mall_details(self, mall_html: str) -> Dict[str, any]:
+        """
+        Run every detail extractor over one fetched mall page
+
+        The page is parsed once and coordinates are read from the same HTML, so no
+        second request is needed.
+
+        Args:
+            mall_html: HTML content of a mall detail page
+
+        Returns:
+            Dictionary with external URLs, detailed information and coordinates
+        """
+        if not mall_html:
+            return {}
+
+        soup = BeautifulSoup(mall_html, 'html.parser')
+        details = {}
+
+        external_urls = self._extract_external_urls_from_soup(soup)
+        if external_urls:
+            details['external_urls'] = external_urls
+
+        details.update(self._extract_detailed_info_from_soup(soup))
+
+        coordinates = self.extract_coordinates(mall_html)
+        if coordinates:
+            details.update(coordinates)
+
+        return details
+
     def _extract_property_specifications(self, section, details: Dict[str, any]):
         """Extract property specifications from a section"""
         # Look for common property detail patterns
@@ -412,7 +515,7 @@ class DetailExtractor:
 
         print(f"🔄 Starting batch scraping of {len(mall_urls)} mall pages (batch size: {batch_size})")
 
-        crawler = PaginationCrawler()
+        crawler = self.crawler
         semaphore = asyncio.Semaphore(batch_size)
         results = []
 
@@ -435,20 +538,8 @@ class DetailExtractor:
                         'page_size': len(html)
                     }
 
-                    # Extract external URLs
-                    external_urls = await self.extract_external_urls(html)
-                    if external_urls:
-                        mall_details['external_urls'] = external_urls
-
-                    # Extract detailed property information
-                    detailed_info = await self.extract_detailed_mall_info(html)
-                    mall_details.update(detailed_info)
-
-                    # Extract coordinates
-                    coordinates = await self.get_mall_coordinates(url)
-                    if coordinates:
-                        mall_details['latitude'] = coordinates['latitude']
-                        mall_details['longitude'] = coordinates['longitude']
+                    # External URLs, property details and coordinates all come from this page
+                    mall_details.update(self.extract_mall_details(html))
 
                     print(f"    ✅ Extracted: {len(mall_details)} fields")
                     return mall_details
@@ -484,14 +575,14 @@ class DetailExtractor:
         """
         print(f"🔍 Collecting sample of {sample_size} mall URLs from first {max_pages} pages...")
 
-        crawler = PaginationCrawler()
+        crawler = self.crawler
         all_mall_urls = []
 
         for page_num in range(1, max_pages + 1):
             if page_num == 1:
-                page_url = "https://www.mecsr.org/directory-shopping-centres"
+                page_url = self.directory_url
             else:
-                page_url = f"https://www.mecsr.org/directory-shopping-centres?page={page_num}"
+                page_url = f"{self.directory_url}?page={page_num}"
 
             print(f"  📄 Scanning page {page_num}: {page_url}")
 
@@ -510,10 +601,7 @@ class DetailExtractor:
 
             # Convert to absolute URLs
             for link in mall_links:
-                if not link.startswith('http'):
-                    full_url = f"https://www.mecsr.org{link}"
-                else:
-                    full_url = link
+                full_url = self._absolute_url(link)
                 all_mall_urls.append(full_url)
 
             print(f"    ✅ Found {len(mall_links)} malls on page {page_num} (total so far: {len(all_mall_urls)})")
@@ -526,19 +614,20 @@ class DetailExtractor:
         print(f"🎯 Collected {len(sample_urls)} sample mall URLs")
         return sample_urls
 
-    async def collect_all_mall_urls(self, base_url: str = "https://www.mecsr.org/directory-shopping-centres") -> List[str]:
+    async def collect_all_mall_urls(self, base_url: Optional[str] = None) -> List[str]:
         """
         Collect all mall URLs from the MECSR directory by paginating through all pages
 
         Args:
-            base_url: Base directory URL to start from
+            base_url: Base directory URL to start from (default: the extractor's directory URL)
 
         Returns:
             Complete list of all mall URLs
         """
         print("🔍 Collecting all mall URLs from MECSR directory...")
 
-        crawler = PaginationCrawler()
+        crawler = self.crawler
+        base_url = base_url or self.directory_url
         all_mall_urls = set()
         page_num = 1
 
@@ -565,10 +654,7 @@ class DetailExtractor:
 
             # Convert to absolute URLs and add to set
             for link in mall_links:
-                if not link.startswith('http'):
-                    full_url = f"https://www.mecsr.org{link}"
-                else:
-                    full_url = link
+                full_url = self._absolute_url(link)
                 all_mall_urls.add(full_url)
 
             print(f"    ✅ Found {len(mall_links)} malls on page {page_num} (total unique: {len(all_mall_urls)})")
@@ -590,14 +676,25 @@ class DetailExtractor:
         print(f"🎯 Collected {len(final_urls)} unique mall URLs total")
         return final_urls
 
-    async def collect_mall_urls_async(self, num_pages: int = 15, base_url: str = "https://www.mecsr.org/directory-shopping-centres", max_concurrent: int = 5) -> List[str]:
+    async def collect_mall_urls_async(self,
+                                      num_pages: int = 15,
+                                      base_url: Optional[str] = None,
+                                      max_concurrent: int = 5,
+                                      url_queue: Optional[asyncio.Queue] = None,
+                                      limit: Optional[int] = None,
+                                      on_queued: Optional[Callable[[str], None]] = None
+                                      ) -> List[str]:
         """
         Collect mall URLs from the first N pages of MECSR directory asynchronously
 
         Args:
             num_pages: Number of pages to scrape (default 15)
-            base_url: Base directory URL to start from
+            base_url: Base directory URL to start from (default: the extractor's directory URL)
             max_concurrent: Maximum number of concurrent requests
+            url_queue: Optional queue that receives each new mall URL as soon as its
+                directory page is parsed, so detail scraping can start immediately
+            limit: Maximum number of URLs to put on url_queue
+            on_queued: Called with each URL as it is put on url_queue
 
         Returns:
             List of unique mall URLs from the specified number of pages
@@ -605,8 +702,10 @@ class DetailExtractor:
         print(f"🔍 Asynchronously collecting mall URLs from first {num_pages} pages...")
         print(f"⚡ Using {max_concurrent} concurrent requests")
 
-        crawler = PaginationCrawler()
+        base_url = base_url or self.directory_url
         all_mall_urls = set()
+        queued_urls = set()
+        self.failed_directory_pages = []
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def scrape_single_page(page_num: int) -> List[str]:
@@ -620,10 +719,11 @@ class DetailExtractor:
                 print(f"  📄 Scraping page {page_num}: {page_url}")
 
                 try:
-                    result = await crawler.crawl_single_page(page_url)
+                    result = await self._fetch_directory_page(page_url)
 
                     if not result or not result.get('success'):
                         print(f"    ❌ Failed to fetch page {page_num}")
+                        self.failed_directory_pages.append(page_num)
                         return []
 
                     html = result['html']
@@ -636,17 +736,25 @@ class DetailExtractor:
                     # Convert to absolute URLs
                     absolute_urls = []
                     for link in mall_links:
-                        if not link.startswith('http'):
-                            full_url = f"https://www.mecsr.org{link}"
-                        else:
-                            full_url = link
-                        absolute_urls.append(full_url)
+                        absolute_urls.append(self._absolute_url(link))
 
                     print(f"    ✅ Found {len(mall_links)} malls on page {page_num}")
+
+                    # Hand new URLs to the detail-scrape queue straight away
+                    if url_queue is not None:
+                        for url in absolute_urls:
+                            within_limit = limit is None or len(queued_urls) < limit
+                            if url not in queued_urls and within_limit:
+                                queued_urls.add(url)
+                                if on_queued:
+                                    on_queued(url)
+                                await url_queue.put(url)
+
                     return absolute_urls
 
                 except Exception as e:
                     print(f"    ❌ Error scraping page {page_num}: {e}")
+                    self.failed_directory_pages.append(page_num)
                     return []
 
         # Create tasks for all pages
@@ -670,3 +778,60 @@ class DetailExtractor:
         print(f"🎯 Collected {len(final_urls)} unique mall URLs from {num_pages} pages")
         print(f"📊 Average malls per page: {len(final_urls) / num_pages:.1f}")
         return final_urls
+
+    async def collect_listing_records_async(self, num_pages: int = 15,
+                                            base_url: Optional[str] = None,
+                                            max_concurrent: int = 5) -> List[Dict[str, any]]:
+        """
+        Collect partial mall records from the directory listing cards
+
+        Only the directory pages are fetched; each card yields name, URL, property
+        type, status, IDs and coordinates when the card carries them.
+
+        Args:
+            num_pages: Number of directory pages to scan
+            base_url: Base directory URL to start from (default: the extractor's directory URL)
+            max_concurrent: Maximum number of concurrent requests
+
+        Returns:
+            List of mall records with absolute URLs, in directory order
+        """
+        print(f"🔍 Collecting listing cards from first {num_pages} pages...")
+
+        base_url = base_url or self.directory_url
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def scrape_single_page(page_num: int) -> List[Dict[str, any]]:
+            """Scrape a single page and return its listing records"""
+            async with semaphore:
+                page_url = base_url if page_num == 1 else f"{base_url}?page={page_num}"
+
+                try:
+                    result = await self._fetch_directory_page(page_url)
+
+                    if not result or not result.get('success'):
+                        print(f"    ❌ Failed to fetch page {page_num}")
+                        return []
+
+                    malls = self.extract_mall_data(result['html'])
+                    for mall in malls:
+                        mall['url'] = self._absolute_url(mall['url'])
+
+                    print(f"    ✅ Found {len(malls)} listing cards on page {page_num}")
+                    return malls
+
+                except Exception as e:
+                    print(f"    ❌ Error scraping page {page_num}: {e}")
+                    return []
+
+        tasks = [scrape_single_page(page_num) for page_num in range(1, num_pages + 1)]
+        page_results = await asyncio.gather(*tasks)
+
+        # Keep the first card for each mall, in page order
+        records = {}
+        for malls in page_results:
+            for mall in malls:
+                records.setdefault(mall['url'], mall)
+
+        print(f"🎯 Collected {len(records)} listing records from {num_pages} pages")
+        return list(records.values())
@@ -0,0 +1,179 @@
+"""
+PageArchive component for MECSR scraping.
+Append-only, gzip-compressed archive of fetched pages (one WARC-style record per
+gzip member) with a JSONL index of URL -> offset for offline re-extraction.
+"""
+
+from typing import Dict, Any, Iterator, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+import gzip
+import json
+import os
+
+
+ARCHIVE_SUFFIX = ".warc.gz"
+INDEX_SUFFIX = ".idx.jsonl"
+
+
+class PageArchive:
+    """Compressed append-only store of raw page bodies"""
+
+    def __init__(self, path: str):
+        """
+        Initialize the PageArchive
+
+        Args:
+            path: Archive path without suffix; creates <path>.warc.gz and <path>.idx.jsonl
+        """
+        base = str(path)
+        for suffix in (ARCHIVE_SUFFIX, INDEX_SUFFIX):
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+
+        self.data_path = Path(base + ARCHIVE_SUFFIX)
+        self.index_path = Path(base + INDEX_SUFFIX)
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._data_file = None
+        self._index_file = None
+        self.records_written = 0
+
+    def _open_for_append(self):
+        """Open the data and index files lazily in append mode"""
+        if self._data_file is None:
+            self._data_file = open(self.data_path, 'ab')
+            self._index_file = open(self.index_path, 'a', encoding='utf-8')
+
+    def append(self, url: str, html: str, status_code: int = 200,
+               content_type: str = '', response_time: float = 0.0) -> Dict[str, Any]:
+        """
+        Append a page to the archive
+
+        Args:
+            url: Page URL
+            html: Response body
+            status_code: HTTP status of the response
+            content_type: Response content type
+            response_time: Seconds taken to fetch the page
+
+        Returns:
+            Index entry written for the record
+        """
+        self._open_for_append()
+
+        fetched_at = datetime.now().isoformat()
+        body = html.encode('utf-8')
+        header = (
+            "WARC/1.0\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Date: {fetched_at}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode('utf-8')
+
+        # Each record is a standalone gzip member, so it can be read by seeking to its offset
+        record = gzip.compress(header + body + b"\r\n\r\n")
+        offset = self._data_file.seek(0, os.SEEK_END)
+        self._data_file.write(record)
+        self._data_file.flush()
+
+        entry = {
+            'url': url,
+            'offset': offset,
+            'length': len(record),
+            'status_code': status_code,
+            'content_type': content_type,
+            'response_time': response_time,
+            'fetched_at': fetched_at
+        }
+        self._index_file.write(json.dumps(entry) + "\n")
+        self._index_file.flush()
+        self.records_written += 1
+        return entry
+
+    def load_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the index, keeping the most recent record for each URL
+
+        Returns:
+            Dictionary mapping URL to its index entry
+        """
+        index = {}
+        if not self.index_path.exists():
+            return index
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Tolerate a torn final line after a crash
+                index[entry['url']] = entry
+        return index
+
+    def read(self, entry: Dict[str, Any]) -> Optional[str]:
+        """
+        Read one page body using its index entry
+
+        Args:
+            entry: Index entry from load_index()
+
+        Returns:
+            Page HTML or None if the record is unreadable
+        """
+        try:
+            with open(self.data_path, 'rb') as f:
+                return self._read_record(f, entry)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_record(f, entry: Dict[str, Any]) -> Optional[str]:
+        """Decode the record at an index entry's offset from an open data file"""
+        try:
+            f.seek(entry['offset'])
+            record = gzip.decompress(f.read(entry['length']))
+        except (OSError, EOFError, KeyError, gzip.BadGzipFile):
+            return None
+
+        _, _, payload = record.partition(b"\r\n\r\n")
+        if payload.endswith(b"\r\n\r\n"):
+            payload = payload[:-4]
+        return payload.decode('utf-8', errors='replace')
+
+    def iter_pages(self) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        Iterate over the latest archived body for every URL
+
+        Yields:
+            Tuples of (index entry, html)
+        """
+        entries = sorted(self.load_index().values(), key=lambda e: e['offset'])
+        if not entries:
+            return
+
+        with open(self.data_path, 'rb') as f:
+            for entry in entries:
+                html = self._read_record(f, entry)
+                if html is not None:
+                    yield entry, html
+
+    def close(self):
+        """Close the archive files"""
+        if self._data_file is not None:
+            self._data_file.close()
+            self._index_file.close()
+            self._data_file = None
+            self._index_file = None
+
+    def __enter__(self) -> "PageArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -5,10 +5,22 @@ Handles paginated page crawling with parallel processing and rate limiting.
 
 from typing import List, Optional, Any, Dict
 import asyncio
-import aiohttp
+import time
 from unittest.mock import MagicMock
 import logging
 
+from scrapers.concurrency_controller import AdaptiveConcurrencyController
+from scrapers.page_archive import PageArchive
+from scrapers.rate_limiter import TokenBucketRateLimiter
+from scrapers.response_cache import ResponseCache
+from scrapers.retry import RetryPolicy, parse_retry_after
+from scrapers.session_pool import SessionPool
+from utils.constants import (
+    METRIC_RATE_LIMIT_WAIT, METRIC_CONCURRENCY_WAIT, METRIC_TTFB, METRIC_BODY_DOWNLOAD,
+    METRIC_REQUESTS, METRIC_RESPONSE_BYTES
+)
+from utils.metrics import MetricsRegistry, get_metrics_registry
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,7 +32,13 @@ class PaginationCrawler:
     def __init__(self,
                  base_url: str = "https://www.mecsr.org",
                  endpoint: str = "/directory-shopping-centres",
-                 max_concurrent_requests: int = 5):
+                 max_concurrent_requests: int = 5,
+                 session_pool: Optional[SessionPool] = None,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 archive: Optional[PageArchive] = None,
+                 concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+                 metrics: Optional[MetricsRegistry] = None):
         """
         Initialize the PaginationCrawler
 
@@ -28,29 +46,52 @@ class PaginationCrawler:
             base_url: Base URL for MECSR website
             endpoint: Directory endpoint path
             max_concurrent_requests: Maximum concurrent requests
+            session_pool: Shared SessionPool to borrow connections from
+            rate_limiter: Shared rate limiter consulted before each request
+            response_cache: On-disk cache used to skip or revalidate refetches
+            archive: Page archive that receives every successfully fetched body
+            concurrency_controller: Shared adaptive limit used instead of the fixed
+                max_concurrent_requests semaphore
+            metrics: Registry receiving per-phase request timings (default: process-wide registry)
         """
         self.base_url = base_url
         self.endpoint = endpoint
         self.max_concurrent_requests = max_concurrent_requests
-
-        # HTTP headers to mimic real browser and avoid blocking
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0',
-        }
-
-        # Connector will be created when session is created
-        self.session = None
-        self.connector = None
+        self.metrics = metrics or get_metrics_registry()
+
+        # Borrow the shared session pool, or own a private one when used standalone
+        self._owns_session_pool = session_pool is None
+        max_in_flight = (concurrency_controller.max_concurrency if concurrency_controller
+                         else max_concurrent_requests)
+        self.session_pool = session_pool or SessionPool(
+            max_connections=max_in_flight * 2,  # Connection pool size
+            max_connections_per_host=max_in_flight,
+            metrics=self.metrics
+        )
+        self.headers = self.session_pool.headers
+
+        # Tokens are taken inside the concurrency slot, so the rate limit holds at
+        # send time; a request whose token is not yet due gives its slot back
+        # while it sleeps, so waiting never blocks requests allowed to run
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self._request_semaphore = (concurrency_controller
+                                   or asyncio.Semaphore(max_concurrent_requests))
+
+        self.response_cache = response_cache
+        self.archive = archive
+
+        self._rate_limit_wait = self.metrics.histogram(
+            METRIC_RATE_LIMIT_WAIT, "Token bucket wait before a request, jitter included")
+        self._concurrency_wait = self.metrics.histogram(
+            METRIC_CONCURRENCY_WAIT, "Wait for a free request slot")
+        self._ttfb = self.metrics.histogram(METRIC_TTFB, "Request start until response headers")
+        self._body_download = self.metrics.histogram(
+            METRIC_BODY_DOWNLOAD, "Response body read time")
+        self._requests = self.metrics.counter(
+            METRIC_REQUESTS, "Requests by outcome (status code, error type or cache)")
+        self._response_bytes = self.metrics.counter(
+            METRIC_RESPONSE_BYTES, "Decoded response body bytes downloaded")
 
     async def crawl_single_page(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -66,32 +107,133 @@ class PaginationCrawler:
         if not url or not isinstance(url, str) or not url.startswith(('http://', 'https://')):
             return None
 
-        # Create session and connector if not exists
-        if self.session is None:
-            if self.connector is None:
-                self.connector = aiohttp.TCPConnector(
-                    limit=self.max_concurrent_requests * 2,  # Connection pool size
-                    limit_per_host=self.max_concurrent_requests,
-                    ttl_dns_cache=300,  # DNS cache for 5 minutes
-                    use_dns_cache=True,
-                    keepalive_timeout=60,
-                )
-            self.session = aiohttp.ClientSession(
-                connector=self.connector,
-                headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=30, connect=10)
+        # Serve fresh cache entries without touching the network or the rate limit
+        cache_entry = None
+        if self.response_cache:
+            cache_entry = self.response_cache.get(url)
+            if cache_entry and self.response_cache.is_fresh(cache_entry):
+                html = self.response_cache.load_body(cache_entry)
+                if html is not None:
+                    self.response_cache.stats['fresh_hits'] += 1
+                    self._requests.inc(outcome='cache')
+                    result = self._cached_result(url, cache_entry, html, status_code=200,
+                                                 response_time=0.0)
+                    return self._archive_result(result)
+
+        rate_limit_wait = self.rate_limiter.jitter_delay() if self.rate_limiter else 0.0
+        if rate_limit_wait:
+            await asyncio.sleep(rate_limit_wait)
+
+        concurrency_wait = 0.0
+        while True:
+            slot_requested = time.perf_counter()
+            async with self._request_semaphore:
+                concurrency_wait += time.perf_counter() - slot_requested
+                due_in = (self.rate_limiter.try_acquire(rate_limit_wait)
+                          if self.rate_limiter else 0.0)
+                if due_in <= 0:
+                    result = await self._fetch(url, cache_entry)
+                    outcome = result.get('status_code') or result.get('error_type', 'error')
+                    self._requests.inc(outcome=outcome)
+                    if self.concurrency_controller:
+                        self.concurrency_controller.record_result(result)
+                    break
+            # Token not due yet: sleep outside the slot, then compete for both again
+            rate_limit_wait += due_in
+            await asyncio.sleep(due_in)
+
+        if self.rate_limiter:
+            self._rate_limit_wait.observe(rate_limit_wait)
+        self._concurrency_wait.observe(concurrency_wait)
+        return self._archive_result(result)
+
+    async def crawl_with_retries(self, url: str,
+                                 retry_policy: RetryPolicy) -> Optional[Dict[str, Any]]:
+        """
+        Crawl a single page, retrying transient failures in place
+
+        Meant for the few pages fetched outside a worker pool (directory pages);
+        mall pages are re-queued by the scraper instead of waiting here.
+
+        Args:
+            url: URL to crawl
+            retry_policy: Decides which failures are retried and the backoff
+
+        Returns:
+            Final crawl result, or None if invalid URL
+        """
+        attempt = 0
+        while True:
+            result = await self.crawl_single_page(url)
+            if not retry_policy.should_retry(result, attempt):
+                return result
+
+            delay = retry_policy.backoff_delay(attempt, result.get('retry_after'))
+            attempt += 1
+            logger.info(f"Retrying {url} in {delay:.1f}s ({result.get('error')}, "
+                        f"retry {attempt}/{retry_policy.max_retries})")
+            if result.get('status_code') == 429 and self.rate_limiter:
+                self.rate_limiter.pause(delay)
+            await asyncio.sleep(delay)
+
+    def _archive_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a successful result's body to the page archive, if one is attached"""
+        if self.archive and result.get('success') and result.get('html') is not None:
+            self.archive.append(
+                result['url'],
+                result['html'],
+                status_code=result.get('status_code', 200),
+                content_type=result.get('content_type', ''),
+                response_time=result.get('response_time', 0.0)
             )
+        return result
+
+    def _cached_result(self, url: str, cache_entry: Dict[str, Any], html: str,
+                       status_code: int, response_time: float) -> Dict[str, Any]:
+        """Build a crawl result from a cached page body"""
+        return {
+            "url": url,
+            "success": True,
+            "html": html,
+            "status_code": status_code,
+            "response_time": response_time,
+            "content_length": len(html),
+            "content_type": cache_entry.get('content_type', ''),
+            "content_hash": cache_entry['content_hash'],
+            "from_cache": True
+        }
+
+    async def _fetch(self, url: str,
+                     cache_entry: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Perform the HTTP request for a single page"""
+        session = await self.session_pool.get_session()
+        headers = {}
+        if self.response_cache:
+            headers = self.response_cache.conditional_headers(cache_entry)
 
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            async with self.session.get(url) as response:
-                response_time = time.time() - start_time
+            async with session.get(url, headers=headers) as response:
+                response_time = time.perf_counter() - start_time
+                self._ttfb.observe(response_time)
+
+                # Unchanged since the cached copy: reuse the stored body
+                if response.status == 304 and cache_entry:
+                    html = self.response_cache.load_body(cache_entry)
+                    if html is not None:
+                        self.response_cache.touch(url, cache_entry, response.headers)
+                        self.response_cache.stats['revalidated'] += 1
+                        return self._cached_result(url, cache_entry, html, status_code=304,
+                                                   response_time=response_time)
 
                 if response.status == 200:
-                    html = await response.text()
-                    return {
+                    body_start = time.perf_counter()
+                    body = await response.read()
+                    self._body_download.observe(time.perf_counter() - body_start)
+                    self._response_bytes.inc(len(body))
+                    html = await response.text()  # Decodes the body already read
+                    result = {
                         "url": url,
                         "success": True,
                         "html": html,
@@ -100,17 +242,24 @@ class PaginationCrawler:
                         "content_length": len(html),
                         "content_type": response.headers.get('content-type', '')
                     }
+                    if self.response_cache:
+                        self.response_cache.stats['misses'] += 1
+                        result["content_hash"] = self.response_cache.store(url, html,
+                                                                           response.headers)
+                        result["from_cache"] = False
+                    return result
                 else:
                     return {
                         "url": url,
                         "success": False,
                         "error": f"HTTP {response.status}",
                         "status_code": response.status,
-                        "response_time": response_time
+                        "response_time": response_time,
+                        "retry_after": parse_retry_after(response.headers.get('Retry-After'))
                     }
 
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             error_type = type(e).__name__
             return {
                 "url": url,
@@ -168,7 +317,7 @@ class PaginationCrawler:
 
     async def crawl_pages(self, urls: List[str]) -> List[Any]:
         """
-        Crawl multiple pages concurrently with semaphore-based rate limiting
+        Crawl multiple pages concurrently with semaphore-based concurrency control
 
         Args:
             urls: List of URLs to crawl
@@ -179,16 +328,8 @@ class PaginationCrawler:
         if not urls:
             return []
 
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
-
-        async def crawl_with_semaphore(url: str) -> Optional[Dict[str, Any]]:
-            """Crawl a single URL with semaphore control"""
-            async with semaphore:
-                return await self.crawl_single_page(url)
-
-        # Process all URLs concurrently with semaphore control
-        tasks = [crawl_with_semaphore(url) for url in urls]
+        # Concurrency and rate limits are enforced inside crawl_single_page
+        tasks = [self.crawl_single_page(url) for url in urls]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter out None results and exceptions, keep only successful results
@@ -200,10 +341,6 @@ class PaginationCrawler:
         return valid_results
 
     async def cleanup(self):
-        """Clean up aiohttp session and connector"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
-        if self.connector and not self.connector.closed:
-            await self.connector.close()
-            self.connector = None
+        """Clean up aiohttp session and connector if this crawler owns them"""
+        if self._owns_session_pool:
+            await self.session_pool.close()
@@ -0,0 +1,165 @@
+"""
+Token-bucket rate limiter for MECSR scraping.
+Paces requests to a configured requests-per-minute budget with burst capacity and jitter.
+"""
+
+from typing import Optional, Dict, Any
+import asyncio
+import random
+import time
+
+
+class TokenBucketRateLimiter:
+    """Async token bucket shared by every crawler that talks to the same site"""
+
+    def __init__(self,
+                 requests_per_minute: float,
+                 burst: int = 1,
+                 jitter: float = 0.0):
+        """
+        Initialize the TokenBucketRateLimiter
+
+        Args:
+            requests_per_minute: Sustained request budget
+            burst: Bucket capacity, i.e. requests that may be sent back-to-back
+            jitter: Maximum random delay (seconds) added before each request
+
+        Raises:
+            ValueError: If the rate or burst is invalid
+        """
+        if requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be > 0, got {requests_per_minute}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+
+        self.requests_per_minute = requests_per_minute
+        self.rate = requests_per_minute / 60.0  # tokens per second
+        self.interval = 1.0 / self.rate
+        self.capacity = burst
+        # Jitter is capped at one interval so it shuffles sends within their slot
+        # instead of pushing the sustained rate above the budget
+        self.jitter = min(max(jitter, 0.0), self.interval)
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        self.stats = {
+            'acquired': 0,
+            'throttled': 0,
+            'total_wait': 0.0,
+            'pauses': 0
+        }
+
+    @classmethod
+    def from_settings(cls, requests_per_minute: Optional[float] = None) -> "TokenBucketRateLimiter":
+        """
+        Build a limiter from ScrapingSettings
+
+        Args:
+            requests_per_minute: Override for settings.requests_per_minute
+
+        Returns:
+            Configured TokenBucketRateLimiter
+        """
+        from config import settings
+
+        return cls(
+            requests_per_minute=requests_per_minute or settings.requests_per_minute,
+            burst=settings.rate_limit_burst,
+            jitter=settings.rate_limit_jitter
+        )
+
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last update"""
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self, waited: float = 0.0) -> float:
+        """
+        Take one token if it is due now, without reserving future tokens
+
+        Meant to be called while holding a request slot, so the token is spent
+        at send time: requests queued for slots cannot bank tokens and then
+        go out together once slots free up.
+
+        Args:
+            waited: Seconds the caller has waited so far, for the statistics
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until the next one is due
+        """
+        self._refill(time.monotonic())
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) / self.rate
+
+        self._tokens -= 1.0
+        self.stats['acquired'] += 1
+        if waited > 0:
+            self.stats['throttled'] += 1
+            self.stats['total_wait'] += waited
+        return 0.0
+
+    def jitter_delay(self) -> float:
+        """Random delay to sleep before competing for a token, 0.0 without jitter"""
+        return random.uniform(0, self.jitter) if self.jitter else 0.0
+
+    async def acquire(self) -> float:
+        """
+        Reserve one token and wait until it is due
+
+        For callers that send right after the wait; callers that queue for a
+        request slot afterwards should use try_acquire inside the slot instead.
+
+        The token is reserved under the lock and the wait happens outside it, so
+        callers queue in FIFO order without serialising on a shared sleep.
+
+        Returns:
+            Seconds spent waiting
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            # A negative balance is a reservation on future tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if self.jitter:
+            wait += random.uniform(0, self.jitter)
+
+        self.stats['acquired'] += 1
+        if wait > 0:
+            self.stats['throttled'] += 1
+            self.stats['total_wait'] += wait
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def pause(self, seconds: float):
+        """
+        Hold new requests for seconds, e.g. after a 429 with Retry-After
+
+        The bucket is drained so the next token is due only after the pause;
+        requests then resume at the normal rate instead of in a burst.
+
+        Args:
+            seconds: Pause length; overlapping pauses do not add up
+        """
+        self._refill(time.monotonic())
+        tokens = -seconds * self.rate
+        if tokens < self._tokens:
+            self._tokens = tokens
+            self.stats['pauses'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics
+
+        Returns:
+            Dictionary with acquisition counts and wait totals
+        """
+        stats = dict(self.stats)
+        stats['requests_per_minute'] = self.requests_per_minute
+        stats['avg_wait'] = stats['total_wait'] / stats['acquired'] if stats['acquired'] else 0.0
+        return stats
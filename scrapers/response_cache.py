@@ -0,0 +1,191 @@
+"""
+ResponseCache component for MECSR scraping.
+Content-addressed on-disk HTTP cache keyed by URL, with TTL freshness and
+ETag/Last-Modified revalidation so unchanged pages come back as cheap 304s.
+"""
+
+from typing import Optional, Dict, Any
+from pathlib import Path
+import gzip
+import hashlib
+import json
+import os
+import time
+
+
+class ResponseCache:
+    """On-disk cache of page bodies and their extracted records"""
+
+    def __init__(self, directory: str = "./.http_cache", ttl_seconds: float = 6 * 3600):
+        """
+        Initialize the ResponseCache
+
+        Args:
+            directory: Cache root directory
+            ttl_seconds: Age below which a cached page is served without any request
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+
+        # index/ maps URL hashes to response metadata, bodies/ is keyed by the
+        # SHA-256 of the page body and extracted/ by that hash plus URL and variant
+        self.index_dir = self.directory / "index"
+        self.bodies_dir = self.directory / "bodies"
+        self.extracted_dir = self.directory / "extracted"
+        for path in (self.index_dir, self.bodies_dir, self.extracted_dir):
+            path.mkdir(parents=True, exist_ok=True)
+
+        self.stats = {
+            'fresh_hits': 0,
+            'revalidated': 0,
+            'misses': 0,
+            'stored': 0
+        }
+
+    @classmethod
+    def from_settings(cls) -> "ResponseCache":
+        """Build a cache from ScrapingSettings"""
+        from config import settings
+
+        return cls(directory=settings.cache_directory, ttl_seconds=settings.cache_ttl_seconds)
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        """SHA-256 hex digest of a string"""
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+    def _index_path(self, url: str) -> Path:
+        return self.index_dir / f"{self._hash(url)}.json"
+
+    def _body_path(self, content_hash: str) -> Path:
+        return self.bodies_dir / content_hash[:2] / f"{content_hash}.html.gz"
+
+    def _extracted_path(self, content_hash: str, url: str, variant: Optional[str] = None) -> Path:
+        # Records carry their URL, so pages sharing a body are stored apart, as are
+        # records from another backend, extractor version or projection
+        key = self._hash(f"{url}\n{variant or ''}")[:12]
+        return self.extracted_dir / content_hash[:2] / f"{content_hash}.{key}.json"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Write a file via a temp file so readers never see partial content"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached metadata for a URL
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Cache entry dictionary or None if the URL has not been cached
+        """
+        path = self._index_path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not self._body_path(entry.get('content_hash', '')).exists():
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry is young enough to skip revalidation"""
+        return (time.time() - entry.get('fetched_at', 0)) < self.ttl_seconds
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers for a refetch
+
+        Args:
+            entry: Cache entry from get()
+
+        Returns:
+            Headers dictionary (empty if nothing to revalidate against)
+        """
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load_body(self, entry: Dict[str, Any]) -> Optional[str]:
+        """Read the cached HTML body for an entry"""
+        try:
+            with gzip.open(self._body_path(entry['content_hash']), 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, KeyError, EOFError):
+            return None
+
+    def store(self, url: str, html: str, headers: Dict[str, str], status_code: int = 200) -> str:
+        """
+        Store a freshly fetched page
+
+        Args:
+            url: Page URL
+            html: Response body
+            headers: Response headers
+            status_code: Response status
+
+        Returns:
+            Content hash of the stored body
+        """
+        content_hash = self._hash(html)
+        body_path = self._body_path(content_hash)
+        if not body_path.exists():
+            self._write_atomic(body_path, gzip.compress(html.encode('utf-8')))
+
+        entry = {
+            'url': url,
+            'content_hash': content_hash,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'content_type': headers.get('Content-Type', ''),
+            'status_code': status_code,
+            'fetched_at': time.time()
+        }
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode('utf-8'))
+        self.stats['stored'] += 1
+        return content_hash
+
+    def touch(self, url: str, entry: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        """
+        Mark an entry as revalidated after a 304 Not Modified
+
+        Args:
+            url: Page URL
+            entry: Existing cache entry
+            headers: 304 response headers, which may carry updated validators
+        """
+        entry = dict(entry)
+        if headers:
+            entry['etag'] = headers.get('ETag') or entry.get('etag')
+            entry['last_modified'] = headers.get('Last-Modified') or entry.get('last_modified')
+        entry['fetched_at'] = time.time()
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode('utf-8'))
+
+    def load_extracted(self, content_hash: str, url: str,
+                       variant: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Read the extracted record stored for a URL's page body (and extraction variant)"""
+        try:
+            with open(self._extracted_path(content_hash, url, variant), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store_extracted(self, content_hash: str, url: str, data: Dict[str, Any],
+                        variant: Optional[str] = None):
+        """Store the extracted record for a URL's page body so unchanged pages skip parsing"""
+        self._write_atomic(
+            self._extracted_path(content_hash, url, variant),
+            json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+        )
@@ -0,0 +1,134 @@
+"""
+Retry policy for MECSR scraping.
+Classifies failed crawl results as retryable or permanent and computes jittered
+exponential backoff delays that honour the server's Retry-After header.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any
+import random
+
+
+# Transient HTTP statuses: throttling, timeouts and overloaded or restarting upstreams
+RETRYABLE_STATUS = frozenset([408, 425, 429, 500, 502, 503, 504])
+
+# Exception types (crawl result 'error_type') for timeouts and dropped connections
+RETRYABLE_ERROR_TYPES = frozenset([
+    'TimeoutError', 'ServerTimeoutError', 'ConnectionTimeoutError', 'SocketTimeoutError',
+    'ClientConnectionError', 'ClientConnectorError', 'ClientOSError', 'ServerDisconnectedError',
+    'ClientPayloadError', 'ConnectionResetError', 'ConnectionRefusedError'
+])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait first"""
+
+    def __init__(self,
+                 max_retries: int = 5,
+                 base_delay: float = 2.0,
+                 max_delay: float = 120.0):
+        """
+        Initialize the RetryPolicy
+
+        Args:
+            max_retries: Retries per URL after the first attempt (0 disables retrying)
+            base_delay: Backoff before the first retry, doubled for each further one
+            max_delay: Cap on the backoff delay (Retry-After may ask for longer)
+
+        Raises:
+            ValueError: If a limit is negative
+        """
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {max_retries}")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError(f"Retry delays must be >= 0, got {base_delay} and {max_delay}")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        """Build a policy from ScrapingSettings"""
+        from config import settings
+
+        return cls(
+            max_retries=settings.max_retries,
+            base_delay=settings.base_retry_delay,
+            max_delay=settings.max_retry_delay
+        )
+
+    def is_retryable(self, result: Optional[Dict[str, Any]]) -> bool:
+        """
+        Whether a failed crawl result is worth retrying
+
+        Args:
+            result: Crawl or scrape result; None (an invalid URL) is never retried
+
+        Returns:
+            True for throttling, server errors, timeouts and dropped connections
+        """
+        if not result or result.get('success'):
+            return False
+        return (result.get('status_code') in RETRYABLE_STATUS
+                or result.get('error_type') in RETRYABLE_ERROR_TYPES)
+
+    def should_retry(self, result: Optional[Dict[str, Any]], attempt: int) -> bool:
+        """
+        Whether to retry after a failed attempt
+
+        Args:
+            result: Result of the failed attempt
+            attempt: Retries already made for this URL
+
+        Returns:
+            True if the error is retryable and the retry budget is not spent
+        """
+        return attempt < self.max_retries and self.is_retryable(result)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before the next retry
+
+        Exponential backoff with equal jitter: half the step is fixed, the other
+        half random, so retries of URLs that failed together spread out.
+
+        Args:
+            attempt: Retries already made for this URL
+            retry_after: Server-requested delay, used as a lower bound
+
+        Returns:
+            Delay in seconds
+        """
+        step = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = step / 2 + random.uniform(0, step / 2)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
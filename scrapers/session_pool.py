@@ -0,0 +1,168 @@
+"""
+SessionPool component for MECSR directory scraping.
+Owns a single long-lived aiohttp session/connector that every crawler borrows from,
+so discovery and detail scraping reuse the same warm keep-alive connections.
+"""
+
+from typing import Optional, Dict, Any
+import asyncio
+import aiohttp
+import logging
+import time
+
+from utils.constants import METRIC_DNS, METRIC_CONNECT
+from utils.metrics import MetricsRegistry, get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+# HTTP headers to mimic real browser and avoid blocking
+DEFAULT_HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'),
+    'Accept': ('text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,'
+               'image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7'),
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+}
+
+
+class SessionPool:
+    """Shared aiohttp session and connector with explicit lifecycle and reuse stats"""
+
+    def __init__(self,
+                 max_connections: int = 20,
+                 max_connections_per_host: int = 10,
+                 keepalive_timeout: float = 60,
+                 headers: Optional[Dict[str, str]] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        """
+        Initialize the SessionPool
+
+        Args:
+            max_connections: Total connection pool size
+            max_connections_per_host: Connection limit per host
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            headers: Default headers sent with every request
+            metrics: Registry receiving DNS and connect timings (default: process-wide registry)
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.headers = dict(headers or DEFAULT_HEADERS)
+        self.metrics = metrics or get_metrics_registry()
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.connector: Optional[aiohttp.TCPConnector] = None
+        self._lock = asyncio.Lock()
+
+        # Connection reuse stats, fed by aiohttp tracing hooks
+        self.stats = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'sessions_created': 0
+        }
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool currently has no open session"""
+        return self.session is None or self.session.closed
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Build the trace config used to count new vs reused connections and time DNS/connect"""
+        trace_config = aiohttp.TraceConfig()
+        dns_seconds = self.metrics.histogram(METRIC_DNS, "DNS resolution time (cache misses)")
+        connect_seconds = self.metrics.histogram(METRIC_CONNECT,
+                                                 "New connection time, DNS and TLS included")
+
+        async def on_request_start(session, context, params):
+            self.stats['requests'] += 1
+
+        async def on_dns_resolvehost_start(session, context, params):
+            context.dns_start = time.perf_counter()
+
+        async def on_dns_resolvehost_end(session, context, params):
+            dns_seconds.observe(time.perf_counter() - context.dns_start)
+
+        async def on_connection_create_start(session, context, params):
+            context.connect_start = time.perf_counter()
+
+        async def on_connection_create_end(session, context, params):
+            self.stats['connections_created'] += 1
+            connect_seconds.observe(time.perf_counter() - context.connect_start)
+
+        async def on_connection_reuseconn(session, context, params):
+            self.stats['connections_reused'] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session, creating it on first use
+
+        Returns:
+            Open aiohttp ClientSession
+        """
+        if not self.closed:
+            return self.session
+
+        async with self._lock:
+            if self.closed:
+                self.connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    ttl_dns_cache=300,  # DNS cache for 5 minutes
+                    use_dns_cache=True,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+                self.session = aiohttp.ClientSession(
+                    connector=self.connector,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=30, connect=10),
+                    trace_configs=[self._create_trace_config()]
+                )
+                self.stats['sessions_created'] += 1
+
+        return self.session
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse statistics
+
+        Returns:
+            Dictionary with request/connection counters and reuse ratio
+        """
+        stats = dict(self.stats)
+        total = stats['connections_created'] + stats['connections_reused']
+        stats['reuse_ratio'] = stats['connections_reused'] / total if total else 0.0
+        return stats
+
+    async def close(self):
+        """Close the shared session and connector"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        if self.connector and not self.connector.closed:
+            await self.connector.close()
+        self.session = None
+        self.connector = None
+
+    async def __aenter__(self) -> "SessionPool":
+        await self.get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -4,29 +4,50 @@ Simple MECSR Scraper - Lean and Clean Version
 Strips out complexity while keeping core functionality working.
 """
 
+import argparse
 import asyncio
-import json
 import time
-from pathlib import Path
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 # Only essential imports
-from enhanced_extractor import EnhancedDataExtractor
+from config import settings
+from enhanced_extractor import EnhancedDataExtractor, select_fields
+from extraction_executor import ExtractionExecutor
+from scrapers.concurrency_controller import AdaptiveConcurrencyController
+from scrapers.detail_extractor import DetailExtractor
+from scrapers.page_archive import PageArchive
 from scrapers.pagination_crawler import PaginationCrawler
+from scrapers.rate_limiter import TokenBucketRateLimiter
+from scrapers.response_cache import ResponseCache
+from scrapers.retry import RetryPolicy
+from scrapers.session_pool import SessionPool
+from storage.incremental import (
+    find_previous_output, load_previous_records, plan_incremental_scrape, merge_incremental_results,
+    scraped_at_by_url
+)
+from storage.jsonl_sink import JsonlResultSink
+from storage.run_journal import RunJournal
+from storage.sqlite_store import SqliteMallStore
 
 # Utility imports
+from utils.metrics import MetricsRegistry, MetricsDumper, TimedQueue, get_metrics_registry
 from utils.helpers import (
-    get_iso_timestamp, ensure_directory, create_error_result
+    get_iso_timestamp, create_error_result, parse_field_list
 )
+from utils.storage import save_results_json
 from utils.constants import (
     DEFAULT_MAX_CONCURRENT, DEFAULT_REQUESTS_PER_MINUTE, DEFAULT_BATCH_SIZE,
-    OUTPUT_DIR, OUTPUT_FILE_PATTERN, TIMESTAMP_FORMAT,
+    DEFAULT_PIPELINE_MODE, PIPELINE_BATCH, PIPELINE_STREAM,
+    OUTPUT_DIR, OUTPUT_FILE_PATTERN, OUTPUT_JSONL_PATTERN, OUTPUT_REPORT_PATTERN,
+    ARCHIVE_FILE_PATTERN, TIMESTAMP_FORMAT,
     MSG_STARTING, MSG_DISCOVERING, MSG_PROCESSING_BATCH,
-    TOTAL_MALLS_TO_SCRAPE, MAX_PAGES_TO_SCRAPE
+    TOTAL_MALLS_TO_SCRAPE, MAX_PAGES_TO_SCRAPE, STREAMLINED_FIELDS, METRIC_QUEUE_WAIT, METRIC_PAGE
 )
 from utils.reporting import (
-    generate_scraping_report, print_scraping_summary, print_final_report
+    generate_scraping_report, print_scraping_summary, print_final_report, print_phase_timings,
+    present_fields, write_report_json
 )
 
 
@@ -36,16 +57,72 @@ class SimpleMECSRScraper:
     def __init__(self,
                  max_concurrent: int = DEFAULT_MAX_CONCURRENT,
                  requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
-                 batch_size: int = DEFAULT_BATCH_SIZE):
-        self.max_concurrent = max_concurrent
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 session_pool: Optional[SessionPool] = None,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 pipeline: str = DEFAULT_PIPELINE_MODE,
+                 extraction_workers: Optional[int] = 0,
+                 response_cache: Optional[ResponseCache] = None,
+                 archive: Optional[PageArchive] = None,
+                 sink: Optional[JsonlResultSink] = None,
+                 journal: Optional[RunJournal] = None,
+                 fields: Optional[List[str]] = None,
+                 concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        if pipeline not in (PIPELINE_BATCH, PIPELINE_STREAM):
+            raise ValueError(f"Unknown pipeline mode: {pipeline}")
+
+        # With an adaptive controller there is one worker per slot it may ever open;
+        # the controller decides how many of them have a request in flight
+        self.max_concurrent = (concurrency_controller.max_concurrency if concurrency_controller
+                               else max_concurrent)
         self.requests_per_minute = requests_per_minute
         self.batch_size = batch_size
-        self.delay = 60 / requests_per_minute  # Conservative rate limiting
-        self.random_delay = 2.0  # Additional random delay to avoid patterns
+        self.pipeline = pipeline
+
+        # Token bucket paces requests; jitter avoids detectable patterns
+        self.rate_limiter = (rate_limiter
+                             or TokenBucketRateLimiter.from_settings(requests_per_minute))
+
+        # Every stage records its latency per phase into the same registry
+        self.metrics = metrics or get_metrics_registry()
+        self._queue_wait = self.metrics.histogram(METRIC_QUEUE_WAIT,
+                                                  "Wait of a mall URL in the worker queue")
+        self._page_seconds = self.metrics.histogram(METRIC_PAGE,
+                                                    "Fetch and extraction time per mall page")
 
         # Initialize core components
         self.extractor = EnhancedDataExtractor()
-        self.crawler = PaginationCrawler(max_concurrent_requests=max_concurrent)
+        self.extraction = ExtractionExecutor(max_workers=extraction_workers, fields=fields,
+                                             metrics=self.metrics)
+        self.crawler = PaginationCrawler(
+            max_concurrent_requests=max_concurrent,
+            session_pool=session_pool,
+            rate_limiter=self.rate_limiter,
+            response_cache=response_cache,
+            archive=archive,
+            concurrency_controller=concurrency_controller,
+            metrics=self.metrics
+        )
+        self.response_cache = response_cache
+        self.concurrency_controller = concurrency_controller
+
+        # With a streaming sink, records go to disk as they arrive and only a
+        # slim summary of each result is kept in memory for the report
+        self.sink = sink
+
+        # Every finished URL is journaled so interrupted runs can be resumed
+        self.journal = journal
+
+        # Transient failures are re-queued behind the remaining work instead of failing the URL
+        self.retry_policy = retry_policy or RetryPolicy.from_settings()
+        self._retry_attempts: Dict[str, int] = {}
+        self._retry_due: Dict[str, float] = {}
+        self._deferred_urls: List[str] = []
+
+        # Per-field coverage of extracted records, counted before a sink drops them from memory
+        self.field_counts = Counter()
 
         # Simple stats tracking
         self.stats = {
@@ -53,16 +130,100 @@ class SimpleMECSRScraper:
             'total_processed': 0,
             'successful': 0,
             'failed': 0,
+            'retries': 0,
             'avg_response_time': 0.0
         }
 
     async def scrape_malls(self, mall_urls: List[str]) -> Dict[str, Any]:
         """Main scraping function - simple and clean"""
         self.stats['start_time'] = datetime.now()
+        start_time = time.perf_counter()
+        print(MSG_STARTING)
+
+        if self.pipeline == PIPELINE_STREAM:
+            all_results = await self._scrape_streaming(mall_urls)
+        else:
+            all_results = await self._scrape_batches(mall_urls)
+
+        # Generate simple report and return both report and results
+        report = self._generate_report(all_results, time.perf_counter() - start_time)
+        print_scraping_summary(report)
+        return {
+            'report': report,
+            'results': all_results
+        }
+
+    async def scrape_discovered_malls(self,
+                                      extractor: DetailExtractor,
+                                      num_pages: int = MAX_PAGES_TO_SCRAPE,
+                                      max_concurrent_pages: int = 2,
+                                      limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Discover mall URLs and scrape them in one overlapping producer/consumer pipeline
+
+        Each mall URL found on a directory page goes straight onto the worker queue,
+        so detail pages are fetched while the remaining directory pages load.
+
+        Args:
+            extractor: DetailExtractor used to crawl the directory pages
+            num_pages: Number of directory pages to scan
+            max_concurrent_pages: Concurrent directory page requests
+            limit: Maximum number of malls to scrape
+
+        Returns:
+            Dictionary with report, results and the discovered mall URLs
+        """
+        self.stats['start_time'] = datetime.now()
+        start_time = time.perf_counter()
         print(MSG_STARTING)
 
+        url_queue = TimedQueue(self._queue_wait)
+        num_workers = max(1, self.max_concurrent)
+        queued_urls = []
+
+        def on_queued(url: str):
+            # Journaled as queued, so an interrupted run resumes with the same malls in order
+            queued_urls.append(url)
+            if self.journal:
+                self.journal.record_queued_url(url)
+
+        async def produce() -> List[str]:
+            try:
+                mall_urls = await extractor.collect_mall_urls_async(
+                    num_pages=num_pages,
+                    max_concurrent=max_concurrent_pages,
+                    url_queue=url_queue,
+                    limit=limit,
+                    on_queued=on_queued
+                )
+                if self.journal:
+                    # Discovery done, a resume need not repeat it
+                    self.journal.save_urls(queued_urls)
+                return mall_urls
+            finally:
+                for _ in range(num_workers):
+                    await url_queue.put(None)  # Discovery done: stop the workers
+
+        producer = asyncio.create_task(produce())
+        all_results = await self._run_worker_pool(url_queue, num_workers, total=limit)
+        mall_urls = await producer
+
+        report = self._generate_report(all_results, time.perf_counter() - start_time)
+        print_scraping_summary(report)
+        return {
+            'report': report,
+            'results': all_results,
+            'mall_urls': mall_urls
+        }
+
+    def _generate_report(self, results: List[Dict[str, Any]], wall_time: float) -> Dict[str, Any]:
+        """Report on this scraper's results over the measured wall time"""
+        return generate_scraping_report(results, wall_time=wall_time, fields=self.extraction.fields,
+                                        field_counts=self.field_counts)
+
+    async def _scrape_batches(self, mall_urls: List[str]) -> List[Dict[str, Any]]:
+        """Process URLs in fixed-size batches"""
         all_results = []
-        semaphore = asyncio.Semaphore(self.max_concurrent)
 
         # Process in simple batches
         for i in range(0, len(mall_urls), self.batch_size):
@@ -76,64 +237,180 @@ class SimpleMECSRScraper:
                 size=len(batch_urls)
             ))
 
-            batch_results = await self._process_batch(batch_urls, semaphore)
-            all_results.extend(batch_results)
+            batch_results = [r for r in await self._process_batch(batch_urls)
+                             if not self._defer_retry(r)]
+            all_results.extend(self._record_result(r) for r in batch_results)
 
             # Simple progress update
-            self.stats['total_processed'] += len(batch_urls)
+            self.stats['total_processed'] += len(batch_results)
             print(f"   ✅ Completed: {self.stats['total_processed']}/{len(mall_urls)} total")
 
-        # Generate simple report and return both report and results
-        report = generate_scraping_report(all_results)
-        print_scraping_summary(all_results)
-        return {
-            'report': report,
-            'results': all_results
-        }
+        all_results.extend(await self._retry_deferred(self.max_concurrent, total=len(mall_urls)))
+        return all_results
+
+    async def _scrape_streaming(self, mall_urls: List[str]) -> List[Dict[str, Any]]:
+        """Process URLs with a continuous worker pool so one slow page never stalls the rest"""
+        url_queue = TimedQueue(self._queue_wait)
+        for url in mall_urls:
+            url_queue.put_nowait(url)
+
+        num_workers = max(1, min(self.max_concurrent, len(mall_urls)))
+        for _ in range(num_workers):
+            url_queue.put_nowait(None)  # One stop signal per worker
+
+        return await self._run_worker_pool(url_queue, num_workers, total=len(mall_urls))
+
+    async def _run_worker_pool(self,
+                               url_queue: asyncio.Queue,
+                               num_workers: int,
+                               total: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Run workers that pull URLs from url_queue until each receives a None stop signal,
+        then retry the URLs that failed with transient errors
+
+        Args:
+            url_queue: Queue of URLs to scrape, terminated by one None per worker
+            num_workers: Number of concurrent workers
+            total: Expected number of URLs, used for progress output when known
+
+        Returns:
+            List of result dictionaries in completion order
+        """
+        all_results = await self._run_workers(url_queue, num_workers, total)
+        all_results.extend(await self._retry_deferred(num_workers, total))
+        return all_results
+
+    async def _retry_deferred(self, num_workers: int,
+                              total: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Re-run deferred URLs in rounds until none is left to retry
+
+        Args:
+            num_workers: Maximum number of concurrent workers
+            total: Expected number of URLs, used for progress output when known
+
+        Returns:
+            Final results of the retried URLs
+        """
+        all_results = []
+        while self._deferred_urls:
+            # Earliest due first, so workers wait as little as possible
+            retry_urls = sorted(self._deferred_urls, key=self._retry_due.__getitem__)
+            self._deferred_urls = []
+            print(f"🔁 Retrying {len(retry_urls)} pages that failed with transient errors")
+
+            url_queue = TimedQueue(self._queue_wait)
+            for url in retry_urls:
+                url_queue.put_nowait(url)
+            retry_workers = max(1, min(num_workers, len(retry_urls)))
+            for _ in range(retry_workers):
+                url_queue.put_nowait(None)
+
+            all_results.extend(await self._run_workers(url_queue, retry_workers, total))
+        return all_results
+
+    def _defer_retry(self, result: Dict[str, Any]) -> bool:
+        """
+        Schedule a failed URL for a later retry if its error is transient
+
+        Args:
+            result: Result of the latest attempt
+
+        Returns:
+            True if the URL was deferred; False if the result is final
+        """
+        url = result.get('url')
+        attempt = self._retry_attempts.get(url, 0)
+        if not self.retry_policy.should_retry(result, attempt):
+            if attempt:
+                result['retries'] = attempt
+            return False
+
+        delay = self.retry_policy.backoff_delay(attempt, result.get('retry_after'))
+        if result.get('status_code') == 429:
+            # Throttled: slow every request down, not just this URL's retry
+            self.rate_limiter.pause(delay)
+
+        self._retry_attempts[url] = attempt + 1
+        self._retry_due[url] = time.monotonic() + delay
+        self._deferred_urls.append(url)
+        self.stats['retries'] += 1
+        return True
+
+    async def _run_workers(self,
+                           url_queue: asyncio.Queue,
+                           num_workers: int,
+                           total: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run one pool of workers over url_queue; transient failures are deferred, not returned"""
+        result_queue = asyncio.Queue()
+
+        async def worker():
+            try:
+                while True:
+                    url = await url_queue.get()
+                    if url is None:
+                        break
+
+                    # Retried URLs wait out their backoff here, after the fresh work is done
+                    due = self._retry_due.pop(url, None)
+                    if due is not None:
+                        await asyncio.sleep(max(0.0, due - time.monotonic()))
+
+                    try:
+                        result = await self._process_url(url)
+                    except Exception as e:
+                        result = self._create_error_result(url, str(e))
+                    if self._defer_retry(result):
+                        continue
+                    await result_queue.put(result)
+            finally:
+                await result_queue.put(None)  # Signal this worker has finished
+
+        print(f"👷 Starting {num_workers} workers")
+        workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
 
-    async def _process_batch(self, batch_urls: List[str], semaphore) -> List[Dict[str, Any]]:
+        all_results = []
+        finished_workers = 0
+        try:
+            while finished_workers < num_workers:
+                result = await result_queue.get()
+                if result is None:
+                    finished_workers += 1
+                    continue
+
+                all_results.append(self._record_result(result))
+                self.stats['total_processed'] += 1
+
+                # Same cadence as batch mode: report every batch_size pages
+                if self.stats['total_processed'] % self.batch_size == 0:
+                    print(f"   ✅ Completed: {self.stats['total_processed']}/{total or '?'} total")
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self.stats['total_processed'] % self.batch_size:
+            processed = self.stats['total_processed']
+            print(f"   ✅ Completed: {processed}/{total or processed} total")
+        return all_results
+
+    def _record_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Hand a finished result to the journal and sink and return what should stay in memory"""
+        if self.journal is not None:
+            self.journal.record(result)
+        if result.get('success') and result.get('data'):
+            self.field_counts.update(present_fields(result['data']))
+
+        if self.sink is None:
+            return result
+
+        self.sink.write(result)
+        return {key: value for key, value in result.items() if key != 'data'}
+
+    async def _process_batch(self, batch_urls: List[str]) -> List[Dict[str, Any]]:
         """Process a single batch of URLs"""
-        async def process_single_url(url: str) -> Dict[str, Any]:
-            async with semaphore:
-                # Add random delay to avoid detection patterns
-                import random
-                random_delay = random.uniform(0, self.random_delay)
-                total_delay = self.delay + random_delay
-                await asyncio.sleep(total_delay)
-
-                start_time = time.time()
-                try:
-                    # Get page content
-                    result = await self.crawler.crawl_single_page(url)
-                    if not result or not result.get('success'):
-                        return self._create_error_result(url, "Failed to fetch page")
-
-                    html = result['html']
-
-                    # Extract data using streamlined extractor
-                    mall_data = self.extractor.extract_streamlined_mall_data(html, url)
-
-                    elapsed = time.time() - start_time
-                    self.stats['successful'] += 1
-                    self.stats['avg_response_time'] = (
-                        (self.stats['avg_response_time'] * (self.stats['successful'] - 1) + elapsed)
-                        / self.stats['successful']
-                    )
-
-                    return {
-                        'url': url,
-                        'success': True,
-                        'data': mall_data,
-                        'response_time': elapsed,
-                        'scraped_at': get_iso_timestamp()
-                    }
-
-                except Exception as e:
-                    self.stats['failed'] += 1
-                    return self._create_error_result(url, str(e))
-
         # Process all URLs in batch concurrently
-        tasks = [process_single_url(url) for url in batch_urls]
+        tasks = [self._process_url(url) for url in batch_urls]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter out exceptions
@@ -146,111 +423,434 @@ class SimpleMECSRScraper:
 
         return valid_results
 
-    def _create_error_result(self, url: str, error: str) -> Dict[str, Any]:
-        """Create error result dictionary"""
-        return create_error_result(error, url)
-
+    async def _process_url(self, url: str) -> Dict[str, Any]:
+        """Fetch and extract a single mall page"""
+        # Rate limiting and concurrency are enforced by the crawler
+        start_time = time.perf_counter()
+        try:
+            # Get page content
+            result = await self.crawler.crawl_single_page(url)
+            if not result or not result.get('success'):
+                return self._create_error_result(url, "Failed to fetch page", result)
+
+            html = result['html']
+
+            # Unchanged pages reuse the record extracted from the same body last time
+            mall_data = None
+            content_hash = result.get('content_hash')
+            variant = self.extraction.cache_variant
+            if result.get('from_cache') and content_hash:
+                mall_data = self.response_cache.load_extracted(content_hash, url, variant)
+
+            if mall_data is None:
+                # Extract data using streamlined extractor (in the process pool when enabled)
+                mall_data = await self.extraction.extract(html, url)
+                if content_hash:
+                    self.response_cache.store_extracted(content_hash, url, mall_data, variant)
+
+            elapsed = time.perf_counter() - start_time
+            self._page_seconds.observe(elapsed)
+            self.stats['successful'] += 1
+            self.stats['avg_response_time'] = (
+                (self.stats['avg_response_time'] * (self.stats['successful'] - 1) + elapsed)
+                / self.stats['successful']
+            )
+
+            return {
+                'url': url,
+                'success': True,
+                'data': mall_data,
+                'response_time': elapsed,
+                'scraped_at': get_iso_timestamp()
+            }
+
+        except Exception as e:
+            self.stats['failed'] += 1
+            return self._create_error_result(url, str(e))
+
+    async def cleanup(self):
+        """Stop extraction workers"""
+        self.extraction.shutdown()
+
+    def _create_error_result(self, url: str, error: str,
+                             crawl_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Create error result dictionary, keeping what the retry policy needs from the crawl"""
+        error_result = create_error_result(error, url)
+        if crawl_result:
+            for key in ('status_code', 'error_type', 'retry_after'):
+                if crawl_result.get(key) is not None:
+                    error_result[key] = crawl_result[key]
+        return error_result
 
     async def save_results(self, results: List[Dict[str, Any]], output_file: str):
         """Save results to JSON with proper datetime handling"""
-        # Prepare output structure
-        successful_results = [r for r in results if r.get('success') and r.get('data')]
-
-        output = {
-            'metadata': {
-                'scraped_at': get_iso_timestamp(),
-                'total_malls': len(results),
-                'successful_extractions': len(successful_results),
-                'scraper_version': 'simple_v1.0'
-            },
-            'malls': []
-        }
-
-        # Process each successful result
-        for r in successful_results:
-            if r.get('data'):
-                mall_dict = dict(r['data'])
-
-                # Handle datetime objects for JSON serialization
-                if 'last_updated' in mall_dict and isinstance(mall_dict['last_updated'], datetime):
-                    mall_dict['last_updated'] = mall_dict['last_updated'].isoformat()
-
-                # Add scraping metadata
-                mall_dict['_scraping_metadata'] = {
-                    'response_time': r.get('response_time', 0.0),
-                    'scraped_at': r.get('scraped_at', get_iso_timestamp())
-                }
-
-                output['malls'].append(mall_dict)
-
-        # Custom JSON encoder for datetime objects
-        def datetime_encoder(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
-
-        # Ensure output directory exists
-        output_path = Path(output_file)
-        ensure_directory(str(output_path.parent))
-
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False, default=datetime_encoder)
-
-        print(f"💾 Results saved to: {output_file}")
-        return output
+        return save_results_json(results, output_file)
 
 
-async def main(test_batch_size: int = 100):
+async def main(test_batch_size: int = 100, pipelined: bool = False, use_cache: bool = True,
+               archive_pages: bool = False, output_format: str = None, resume_run_id: str = None,
+               incremental: bool = False, refresh_fraction: float = None, fields: List[str] = None,
+               adaptive: bool = False, metrics_file: str = None):
     """Simple main function with test batch option"""
     print("🏪 Streamlined MECSR Mall Scraper")
     print("=" * 40)
-
-    # Get mall URLs from all pages (up to 1001 malls)
-    from scrapers.detail_extractor import DetailExtractor
-
-    print(MSG_DISCOVERING)
-    extractor = DetailExtractor()
-    mall_urls = await extractor.collect_mall_urls_async(
-        num_pages=MAX_PAGES_TO_SCRAPE,
-        max_concurrent=2  # Very conservative for directory pages
-    )
-
-    # Limit to test batch for performance testing
-    if test_batch_size and len(mall_urls) > test_batch_size:
-        print(f"🔬 Testing with {test_batch_size} malls (limited for performance testing)")
-        mall_urls = mall_urls[:test_batch_size]
-
-    if not mall_urls:
-        print("❌ No mall URLs found!")
+    run_start = time.perf_counter()
+
+    if resume_run_id:
+        # Resume with the interrupted run's id, output file and options
+        if not RunJournal.exists(resume_run_id):
+            print(f"❌ No run journal found for run id: {resume_run_id}")
+            return
+        timestamp = resume_run_id
+        run_meta = RunJournal(resume_run_id).load_meta()
+        output_format = run_meta['output_format']
+        test_batch_size = run_meta.get('test_batch_size')
+        incremental = run_meta.get('incremental', False)
+        refresh_fraction = run_meta.get('refresh_fraction')
+        fields = run_meta.get('fields')
+        pipelined = False  # The remaining URLs are known, nothing to overlap with
+        print(f"♻️ Resuming run {resume_run_id}")
+    else:
+        output_format = output_format or settings.output_format
+        fields = fields or parse_field_list(settings.extract_fields)
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+
+    # Reject unknown fields before the run is journaled
+    try:
+        select_fields(fields, STREAMLINED_FIELDS)
+    except ValueError as e:
+        print(f"❌ {e}")
         return
 
-    print(f"🎯 Found {len(mall_urls)} malls to scrape")
+    # The SQLite store is upserted in place, so it is also the baseline of incremental runs
+    store = SqliteMallStore.from_settings() if output_format == "sqlite" else None
+
+    # Incremental runs start from the latest previous output; a resume keeps the same baseline
+    previous_records = None
+    previous_scraped_at = None
+    previous_output = None
+    if incremental:
+        if refresh_fraction is None:
+            refresh_fraction = settings.incremental_refresh_fraction
+        if store is not None:
+            # Planning only needs each mall's last scrape time, read from the store's index;
+            # a resumed run sees the malls it already refreshed as fresh and skips them
+            previous_scraped_at = store.scraped_at_by_url() or None
+            previous_output = store.output_file if previous_scraped_at else None
+        else:
+            # The run's own output, possibly partial, never counts as the previous one
+            output_pattern = OUTPUT_FILE_PATTERN
+            if output_format == "jsonl":
+                output_pattern = OUTPUT_JSONL_PATTERN
+            run_output = f"{OUTPUT_DIR}/{output_pattern.format(timestamp=timestamp)}"
+            previous_output = (run_meta.get('previous_output') if resume_run_id
+                               else find_previous_output(exclude=run_output))
+            if previous_output:
+                previous_records = load_previous_records(previous_output)
+                previous_scraped_at = scraped_at_by_url(previous_records)
+        if previous_scraped_at is not None:
+            print(f"🔁 Incremental run against {previous_output} ({len(previous_scraped_at)} malls)")
+        else:
+            print("ℹ️ No previous output found, running a full scrape")
+        if pipelined:
+            print("ℹ️ Incremental runs need the full URL list first, --pipelined is ignored")
+            pipelined = False
+
+    # JSON output is only written at the end, so its journal also keeps the records
+    journal = RunJournal(timestamp, store_records=output_format == "json")
+    if not resume_run_id:
+        journal.write_meta(output_format=output_format, test_batch_size=test_batch_size,
+                           incremental=incremental, refresh_fraction=refresh_fraction,
+                           previous_output=str(previous_output) if previous_output else None,
+                           fields=fields)
+        print(f"📒 Run id: {timestamp} (resume with --resume {timestamp})")
+
+    # Adaptive mode starts at the hand-tuned limit and finds the sustainable one from there
+    concurrency_controller = None
+    if adaptive or settings.adaptive_concurrency:
+        concurrency_controller = AdaptiveConcurrencyController.from_settings(initial=3)
+        print(f"🎚️ Adaptive concurrency: {concurrency_controller.min_concurrency}-"
+              f"{concurrency_controller.max_concurrency} requests in flight")
+    directory_concurrency = concurrency_controller.max_concurrency if concurrency_controller else 2
+
+    # Per-phase timings are always collected; a metrics file makes them visible during the run
+    metrics = get_metrics_registry()
+    metrics_dumper = None
+    metrics_file = metrics_file or settings.metrics_file
+    if metrics_file:
+        metrics_dumper = MetricsDumper(metrics, metrics_file,
+                                       interval=settings.metrics_dump_interval)
+        metrics_dumper.start()
+        print(f"📈 Writing metrics to: {metrics_file} (every {settings.metrics_dump_interval:g}s)")
+
+    # One shared connection pool and request budget for discovery and detail scraping;
+    # in adaptive mode the pool is sized so connections never cap the controller
+    if concurrency_controller:
+        session_pool = SessionPool(max_connections=concurrency_controller.max_concurrency * 2,
+                                   max_connections_per_host=concurrency_controller.max_concurrency)
+    else:
+        session_pool = SessionPool()
+    rate_limiter = TokenBucketRateLimiter.from_settings()
+    response_cache = ResponseCache.from_settings() if use_cache and settings.cache_enabled else None
+    retry_policy = RetryPolicy.from_settings()
+
+    # Keep raw pages so extraction changes can be replayed with re_extract.py and
+    # whole runs with benchmarks/fixture_server.py
+    archive = None
+    if archive_pages:
+        archive = PageArchive(f"{OUTPUT_DIR}/{ARCHIVE_FILE_PATTERN.format(timestamp=timestamp)}")
+        print(f"🗃️ Archiving raw pages to: {archive.data_path}")
+
+    # JSONL output is streamed record by record instead of saved at the end
+    sink = None
+    if output_format == "jsonl":
+        sink = JsonlResultSink(f"{OUTPUT_DIR}/{OUTPUT_JSONL_PATTERN.format(timestamp=timestamp)}")
+        print(f"📝 Streaming results to: {sink.output_file}")
+    elif store is not None:
+        sink = store
+        print(f"🗄️ Upserting results into: {store.output_file}")
+
+    extractor = DetailExtractor(
+        session_pool=session_pool,
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+        concurrency_controller=concurrency_controller,
+        retry_policy=retry_policy,
+        base_url=settings.base_url,
+        archive=archive
+    )
 
     # Create scraper with respectful settings to avoid blocking
     scraper = SimpleMECSRScraper(
         max_concurrent=3,  # Reduced concurrency to be respectful
-        requests_per_minute=20,  # Conservative rate to avoid blocking
-        batch_size=10  # Smaller batches for gentler scraping
+        requests_per_minute=settings.requests_per_minute,
+        batch_size=10,  # Progress is reported every 10 pages
+        session_pool=session_pool,
+        rate_limiter=rate_limiter,
+        pipeline=PIPELINE_STREAM,
+        extraction_workers=settings.extraction_workers,
+        response_cache=response_cache,
+        archive=archive,
+        sink=sink,
+        journal=journal,
+        fields=fields,
+        concurrency_controller=concurrency_controller,
+        retry_policy=retry_policy
     )
-
-    # Scrape malls
-    scrape_data = await scraper.scrape_malls(mall_urls)
-
-    # Save results
-    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
-    output_file = f"{OUTPUT_DIR}/{OUTPUT_FILE_PATTERN.format(timestamp=timestamp)}"
-    await scraper.save_results(scrape_data['results'], output_file)
-
-    print_final_report(scrape_data['report'], output_file)
-
-    # Cleanup crawler resources
+    if fields:
+        print(f"🎯 Extracting only: {', '.join(fields)}")
+
+    async def save_output(fresh_results: List[Dict[str, Any]]) -> str:
+        """Write the run's output, merging in carried-over records for incremental runs"""
+        if store is not None and previous_scraped_at is not None:
+            # Carried-over malls are already stored; only drop those gone from the directory,
+            # and only when every directory page was read so a failed page cannot look like removals
+            if directory_complete:
+                discovered = set(discovered_urls)
+                store.remove([url for url in previous_scraped_at if url not in discovered])
+            else:
+                print("ℹ️ Directory not fully read in this run, "
+                      "keeping stored malls that were not discovered")
+        elif previous_records is not None:
+            if not directory_complete:
+                print("ℹ️ Directory not fully read in this run, "
+                      "carrying over malls that were not discovered")
+            merged = merge_incremental_results(discovered_urls, previous_records, fresh_results,
+                                               directory_complete=directory_complete)
+            if sink:
+                # Fresh successes are already streamed; append the carried-over records
+                refreshed_urls = journal.successful_urls()
+                for result in merged:
+                    if result['url'] not in refreshed_urls:
+                        sink.write(result)
+            fresh_results = merged
+
+        if store is not None:
+            print(f"💾 Upserted {store.records_written} records into: {store.output_file} "
+                  f"({store.count()} malls stored)")
+            return str(store.output_file)
+        if sink:
+            print(f"💾 Streamed {sink.records_written} records to: {sink.output_file}")
+            return str(sink.output_file)
+
+        output_file = f"{OUTPUT_DIR}/{OUTPUT_FILE_PATTERN.format(timestamp=timestamp)}"
+        await scraper.save_results(fresh_results, output_file)
+        return output_file
+
+    previous_results = []
+    discovered_urls = []
+    directory_complete = False
     try:
-        await scraper.crawler.cleanup()
-        print("✅ Cleanup completed successfully")
-    except Exception as e:
-        print(f"⚠️ Cleanup warning (non-critical): {e}")
+        if pipelined:
+            # Discovery feeds the detail workers directly, so both phases overlap
+            print(MSG_DISCOVERING)
+            scrape_data = await scraper.scrape_discovered_malls(
+                extractor,
+                num_pages=MAX_PAGES_TO_SCRAPE,
+                # Very conservative for directory pages unless adaptive
+                max_concurrent_pages=directory_concurrency,
+                limit=test_batch_size
+            )
+            if not scrape_data['results']:
+                print("❌ No mall URLs found!")
+                return
+        else:
+            # A resumed run reuses the URL list saved when it was first discovered
+            mall_urls = journal.load_urls() if resume_run_id else None
+            newly_discovered = mall_urls is None
+
+            if newly_discovered:
+                # Get mall URLs from all pages (up to 1001 malls)
+                print(MSG_DISCOVERING)
+                mall_urls = await extractor.collect_mall_urls_async(
+                    num_pages=MAX_PAGES_TO_SCRAPE,
+                    # Very conservative for directory pages unless adaptive
+                    max_concurrent=directory_concurrency
+                )
+                directory_complete = not extractor.failed_directory_pages
+                if resume_run_id:
+                    # A pipelined run interrupted during discovery: its queued URLs come
+                    # first, in queue order
+                    queued_urls = journal.load_queued_urls()
+                    queued = set(queued_urls)
+                    mall_urls = queued_urls + [url for url in mall_urls if url not in queued]
+
+            # Limit to test batch for performance testing
+            # (incremental runs limit the fetch list instead)
+            if test_batch_size and previous_scraped_at is None and len(mall_urls) > test_batch_size:
+                print(f"🔬 Testing with {test_batch_size} malls (limited for performance testing)")
+                mall_urls = mall_urls[:test_batch_size]
+
+            if newly_discovered:
+                journal.save_urls(mall_urls)
+
+            discovered_urls = mall_urls
+            if previous_scraped_at is not None:
+                # Same plan on resume: it only depends on the saved URL list and previous output
+                plan = plan_incremental_scrape(discovered_urls, previous_scraped_at,
+                                               refresh_fraction)
+                print(f"🔁 {len(plan['new_urls'])} new, "
+                      f"{len(plan['refresh_urls'])} stale refreshes, "
+                      f"{len(plan['unchanged_urls'])} unchanged, "
+                      f"{len(plan['removed_urls'])} removed")
+                mall_urls = plan['new_urls'] + plan['refresh_urls']
+                if test_batch_size and len(mall_urls) > test_batch_size:
+                    mall_urls = mall_urls[:test_batch_size]
+
+            if resume_run_id:
+                # Skip URLs that already succeeded; failed and unfinished ones are retried
+                completed_urls = journal.successful_urls()
+                previous_results = journal.successful_results()
+                mall_urls = [url for url in mall_urls if url not in completed_urls]
+                print(f"♻️ {len(completed_urls)} malls already done, {len(mall_urls)} remaining")
+
+            if not discovered_urls:
+                print("❌ No mall URLs found!")
+                return
+
+            if not mall_urls:
+                print("✅ Nothing left to scrape")
+                await save_output(previous_results)
+                return
+
+            print(f"🎯 Found {len(mall_urls)} malls to scrape")
+
+            # Scrape malls
+            scrape_data = await scraper.scrape_malls(mall_urls)
+
+        # Save results
+        output_file = await save_output(previous_results + scrape_data['results'])
+
+        # The run report covers discovery too, so it is timed from start-up
+        report = generate_scraping_report(scrape_data['results'],
+                                          wall_time=time.perf_counter() - run_start,
+                                          metrics=metrics, fields=fields,
+                                          field_counts=scraper.field_counts)
+        report_file = write_report_json(
+            report, f"{OUTPUT_DIR}/{OUTPUT_REPORT_PATTERN.format(timestamp=timestamp)}")
+        print_final_report(report, output_file, report_file)
+        print_phase_timings(metrics)
+
+        pool_stats = session_pool.get_stats()
+        print(f"🔌 Connections: {pool_stats['connections_created']} opened, "
+              f"{pool_stats['connections_reused']} reused ({pool_stats['reuse_ratio']:.0%} reuse)")
+        if report['retries']['attempts']:
+            retries = report['retries']
+            print(f"🔁 Retries: {retries['attempts']} attempts, "
+                  f"{retries['recovered']}/{retries['retried_urls']} retried pages recovered")
+        if concurrency_controller:
+            concurrency_stats = concurrency_controller.get_stats()
+            print(f"🎚️ Concurrency: {concurrency_stats['initial_limit']} → "
+                  f"{concurrency_stats['limit']} (peak {concurrency_stats['peak_limit']}), "
+                  f"{concurrency_stats['decreases']} backoffs on "
+                  f"{concurrency_stats['congestion_signals']} congestion signals")
+        if response_cache:
+            cache_stats = response_cache.stats
+            print(f"🗄️ Cache: {cache_stats['fresh_hits']} fresh, "
+                  f"{cache_stats['revalidated']} not modified, {cache_stats['misses']} downloaded")
+    finally:
+        # Cleanup runs on success, errors and Ctrl-C alike so streamed output is synced
+        try:
+            await scraper.cleanup()
+            await session_pool.close()
+            if metrics_dumper:
+                await metrics_dumper.stop()
+            if archive:
+                archive.close()
+            if sink:
+                sink.close()
+            journal.close()
+            print("✅ Cleanup completed successfully")
+        except Exception as e:
+            print(f"⚠️ Cleanup warning (non-critical): {e}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Streamlined MECSR Mall Scraper")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="Only scrape the first N malls (default: all)")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="Start detail scraping while directory pages are still being "
+                             "discovered")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk HTTP cache and download every page")
+    parser.add_argument("--archive", action="store_true",
+                        help="Store every fetched directory and mall page in a compressed "
+                             "archive, for re-extraction or replay with "
+                             "benchmarks/fixture_server.py")
+    parser.add_argument("--output-format", choices=["json", "jsonl", "sqlite"], default=None,
+                        help="json saves once at the end, jsonl streams each record as it is "
+                             "scraped, sqlite upserts each record into the SQLITE_PATH mall store "
+                             "(default: OUTPUT_FORMAT setting)")
+    parser.add_argument("--resume", metavar="RUN_ID", default=None,
+                        help="Resume an interrupted run, retrying only URLs that have not "
+                             "succeeded")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only scrape new malls plus the stalest known ones, merged with the "
+                             "previous output")
+    parser.add_argument("--refresh-fraction", type=float, default=None,
+                        help="Share of known malls refetched in an incremental run "
+                             "(default: INCREMENTAL_REFRESH_FRACTION setting)")
+    parser.add_argument("--fields", type=parse_field_list, default=None,
+                        help="Comma-separated fields to extract, e.g. "
+                             "name,location,property_details; extractors for other fields are "
+                             "skipped (default: EXTRACT_FIELDS setting, all fields)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Tune request concurrency at runtime (AIMD) between "
+                             "MIN_CONCURRENCY and MAX_CONCURRENCY")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Rewrite per-phase latency metrics to this file during the run: "
+                             "Prometheus text format, or a JSON summary for a .json path "
+                             "(default: METRICS_FILE setting)")
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main(test_batch_size=None))
+    args = parse_args()
+    asyncio.run(main(test_batch_size=args.limit, pipelined=args.pipelined,
+                     use_cache=not args.no_cache, archive_pages=args.archive,
+                     output_format=args.output_format,
+                     resume_run_id=args.resume, incremental=args.incremental,
+                     refresh_fraction=args.refresh_fraction, fields=args.fields,
+                     adaptive=args.adaptive, metrics_file=args.metrics_file))
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Single-pass Streamlined Extractor
+
+Produces the same streamlined mall record as EnhancedDataExtractor, but walks
+the parsed page once and dispatches every element to the field handlers
+registered for its tag, instead of running a separate full-tree search per field.
+"""
+
+from typing import Dict, Any, List, Optional, Callable, Iterable, FrozenSet, Tuple
+from bs4 import BeautifulSoup, Tag
+
+from enhanced_extractor import EnhancedDataExtractor, select_fields
+from utils.constants import STREAMLINED_FIELDS
+
+
+# Post Details container selectors, in the priority order EnhancedDataExtractor tries them
+DETAILS_SELECTOR_COUNT = 5
+
+# Both status fields come from the badge, with the property type block as fallback
+STATUS_FIELDS = ('mall_type', 'development_status')
+
+Handler = Callable[[Tag, Dict[str, Any]], None]
+# Per-tag handlers and any-tag handlers for one field selection
+Dispatch = Tuple[Dict[str, List[Handler]], List[Handler]]
+
+
+def _class_contains(node: Tag, needle: str) -> bool:
+    """Same test as BeautifulSoup's class_=lambda x: x and needle in str(x)"""
+    classes = node.get('class')
+    if not classes:
+        return False
+    return needle in (' '.join(classes) if isinstance(classes, list) else classes)
+
+
+class SinglePassExtractor(EnhancedDataExtractor):
+    """Streamlined extractor that visits each element of the page once"""
+
+    def __init__(self):
+        super().__init__()
+        self._handlers: List[Tuple[Optional[str], Handler, Optional[FrozenSet[str]]]] = []
+        self._dispatch_cache: Dict[FrozenSet[str], Dispatch] = {}
+
+        self.register_handler('h1', self._handle_heading, fields=['name'])
+        self.register_handler('a', self._handle_website_link, fields=['external_url'])
+        self.register_handler('a', self._handle_tenant_link, fields=['tenants', 'total_tenants'])
+        self.register_handler('script', self._handle_script, fields=['location'])
+        self.register_handler('img', self._handle_image, fields=['first_image'])
+        self.register_handler('div', self._handle_address, fields=['location'])
+        self.register_handler('div', self._handle_property_type, fields=STATUS_FIELDS)
+        self.register_handler('span', self._handle_span, fields=STATUS_FIELDS)
+        self.register_handler(None, self._handle_details_container, fields=['property_details'])
+
+    def register_handler(self, tag_name: Optional[str], handler: Handler,
+                         fields: Optional[Iterable[str]] = None):
+        """
+        Register a field handler
+
+        Args:
+            tag_name: Tag the handler receives, or None for every element
+            handler: Callable taking (element, state) that records its findings in state
+            fields: Output fields the handler contributes to; it is skipped when none
+                of them are selected. None runs it for every extraction
+        """
+        handler_fields = frozenset(fields) if fields is not None else None
+        self._handlers.append((tag_name, handler, handler_fields))
+        self._dispatch_cache.clear()
+
+    def _dispatch_for(self, selected: FrozenSet[str]) -> Dispatch:
+        """Per-tag and any-tag handlers needed for a field selection, built once per selection"""
+        dispatch = self._dispatch_cache.get(selected)
+        if dispatch is None:
+            tag_handlers: Dict[str, List[Handler]] = {}
+            any_tag_handlers: List[Handler] = []
+            for tag_name, handler, fields in self._handlers:
+                if fields is not None and not fields & selected:
+                    continue
+                if tag_name is None:
+                    any_tag_handlers.append(handler)
+                else:
+                    tag_handlers.setdefault(tag_name, []).append(handler)
+            dispatch = self._dispatch_cache[selected] = (tag_handlers, any_tag_handlers)
+        return dispatch
+
+    def extract_streamlined_mall_data(self, html: str, url: str,
+                                      fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Extract only essential mall data in streamlined format.
+        Identical output to EnhancedDataExtractor.extract_streamlined_mall_data.
+        """
+        selected = select_fields(fields, STREAMLINED_FIELDS)
+        soup = self._timed_parse(lambda: BeautifulSoup(html, 'lxml'))
+        state = self._walk(soup, selected)
+
+        return self._build_streamlined_record(url, selected, {
+            'name': lambda: (self._clean_mall_title(state['heading'])
+                             or self._match_mall_name_patterns(soup)),
+            'external_url': lambda: state['external_url'] or state['external_candidate'],
+            'property_details': lambda: self._extract_property_details_from_section(
+                self._details_section_from(state, soup)
+            ),
+            'location': lambda: self._location_from(state),
+            'tenants': lambda: state['tenants'],
+            'first_image': lambda: state['first_image'],
+            'status': lambda: self._status_fields_from(state['badge'], lambda: state['type_elem'])
+        })
+
+    def _details_section_from(self, state: Dict[str, Any], soup: BeautifulSoup) -> Optional[Tag]:
+        """Post Details section: first selector with a match wins, then the text fallback"""
+        details_section = next(
+            (node for node in state['details_candidates'] if node is not None), None
+        )
+        if details_section is None:
+            details_section = self._find_property_details_fallback(soup)
+        return details_section
+
+    def _location_from(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Coordinates and address found during the walk"""
+        location = {}
+        if state['coordinates']:
+            location['latitude'], location['longitude'] = state['coordinates']
+        address = self._address_from(state['address_elem'])
+        if address:
+            location['address'] = address
+        return location
+
+    def _walk(self, soup: BeautifulSoup,
+              selected: FrozenSet[str] = frozenset(STREAMLINED_FIELDS)) -> Dict[str, Any]:
+        """Visit every element once and collect what the selected fields' handlers find"""
+        state = {
+            'heading': None,
+            'external_url': None,
+            'external_candidate': None,
+            'tenants': [],
+            'coordinates': None,
+            'first_image': None,
+            'address_elem': None,
+            'type_elem': None,
+            'badge': None,
+            'details_candidates': [None] * DETAILS_SELECTOR_COUNT
+        }
+
+        tag_handlers, any_tag_handlers = self._dispatch_for(selected)
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            for handler in any_tag_handlers:
+                handler(node, state)
+            for handler in tag_handlers.get(node.name, ()):
+                handler(node, state)
+
+        return state
+
+    def _handle_heading(self, node: Tag, state: Dict[str, Any]):
+        """First h1 holds the mall name"""
+        if state['heading'] is None:
+            state['heading'] = node
+
+    def _handle_website_link(self, node: Tag, state: Dict[str, Any]):
+        """Official website candidates"""
+        if state['external_url'] is not None:
+            return
+
+        href = node.get('href')
+        if href and href.startswith('http') and 'mecsr.org' not in href:
+            rank = self._rank_external_link(node)
+            if rank:
+                state['external_url'] = href
+            elif rank is not None and state['external_candidate'] is None:
+                state['external_candidate'] = href
+
+    def _handle_tenant_link(self, node: Tag, state: Dict[str, Any]):
+        """Tenant search links"""
+        href = node.get('href')
+        if href and '?q=' in href:
+            tenant = self._tenant_from_link(node)
+            if tenant:
+                state['tenants'].append(tenant)
+
+    def _handle_script(self, node: Tag, state: Dict[str, Any]):
+        """First Google Maps script with both coordinates"""
+        if state['coordinates'] is None:
+            state['coordinates'] = self._coordinates_from_script(node)
+
+    def _handle_image(self, node: Tag, state: Dict[str, Any]):
+        """First property image"""
+        if state['first_image'] is None:
+            state['first_image'] = self._property_image_src(node)
+
+    def _handle_address(self, node: Tag, state: Dict[str, Any]):
+        """Address block"""
+        if state['address_elem'] is None and _class_contains(node, 'post_location_map'):
+            state['address_elem'] = node
+
+    def _handle_property_type(self, node: Tag, state: Dict[str, Any]):
+        """Property type block"""
+        if state['type_elem'] is None and _class_contains(node, 'pull-left'):
+            state['type_elem'] = node
+
+    def _handle_span(self, node: Tag, state: Dict[str, Any]):
+        """Status badge"""
+        if state['badge'] is None and _class_contains(node, 'badge'):
+            state['badge'] = node
+
+    def _handle_details_container(self, node: Tag, state: Dict[str, Any]):
+        """Record the first element matching each Post Details selector"""
+        candidates = state['details_candidates']
+        if candidates[0] is not None:
+            return  # The highest priority selector already matched
+
+        # [class*="post-details"]; also covers .post-details, which can never win over it
+        if _class_contains(node, 'post-details'):
+            candidates[0] = node
+        elif candidates[1] is None and node.get('id') == 'post-details':
+            candidates[1] = node
+
+        if node.name == 'div':
+            if candidates[3] is None and _class_contains(node, 'detail'):
+                candidates[3] = node
+        elif node.name == 'section':
+            if candidates[4] is None and _class_contains(node, 'detail'):
+                candidates[4] = node
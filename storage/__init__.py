@@ -0,0 +1 @@
+"""Storage backends for MECSR scraper output."""
@@ -0,0 +1,171 @@
+"""
+Incremental scraping support for MECSR runs.
+Compares the freshly discovered URL set with the previous output, plans which
+malls to fetch (new ones plus the stalest sample of known ones) and merges the
+results back into a complete dataset.
+"""
+
+from typing import Dict, Any, List, Optional, Iterable
+from pathlib import Path
+import json
+import math
+
+from utils.constants import OUTPUT_DIR
+
+
+def find_previous_output(output_dir: str = OUTPUT_DIR,
+                         exclude: Optional[str] = None) -> Optional[Path]:
+    """
+    Find the most recent scraper output file
+
+    Args:
+        output_dir: Directory holding mecsr_scraping_<timestamp>.json/.jsonl files
+        exclude: Output file of the current run, which must not count as previous
+
+    Returns:
+        Path of the newest output file or None
+    """
+    candidates = [
+        path for pattern in ("mecsr_scraping_*.json", "mecsr_scraping_*.jsonl")
+        for path in Path(output_dir).glob(pattern)
+        if not exclude or path.resolve() != Path(exclude).resolve()
+    ]
+    if not candidates:
+        return None
+
+    # Timestamps in the file names sort chronologically
+    return max(candidates, key=lambda path: path.stem)
+
+
+def load_previous_records(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load mall records from a JSON or JSONL output file
+
+    Args:
+        path: Output file path
+
+    Returns:
+        Dictionary mapping mall URL to its record
+    """
+    records = {}
+    path = Path(path)
+
+    if path.suffix == '.jsonl':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record['url']] = record
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            for record in json.load(f).get('malls', []):
+                records[record['url']] = record
+
+    return records
+
+
+def record_to_result(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a saved mall record back into a scraper result dictionary"""
+    data = {key: value for key, value in record.items() if key != '_scraping_metadata'}
+    metadata = record.get('_scraping_metadata', {})
+    return {
+        'url': record['url'],
+        'success': True,
+        'data': data,
+        'response_time': metadata.get('response_time', 0.0),
+        'scraped_at': metadata.get('scraped_at')
+    }
+
+
+def scraped_at_by_url(records: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Map each previous record's URL to when it was scraped"""
+    return {
+        url: record.get('_scraping_metadata', {}).get('scraped_at')
+        for url, record in records.items()
+    }
+
+
+def plan_incremental_scrape(discovered_urls: Iterable[str],
+                            previous_scraped_at: Dict[str, Optional[str]],
+                            refresh_fraction: float = 0.03) -> Dict[str, List[str]]:
+    """
+    Decide which malls need fetching in an incremental run
+
+    Args:
+        discovered_urls: URLs found in the directory this run
+        previous_scraped_at: Scrape time of every previously known mall, keyed by URL
+            (see scraped_at_by_url and SqliteMallStore.scraped_at_by_url)
+        refresh_fraction: Share of known malls to refetch, stalest first
+
+    Returns:
+        Dictionary with new_urls, refresh_urls, unchanged_urls and removed_urls
+    """
+    discovered = list(dict.fromkeys(discovered_urls))
+    discovered_set = set(discovered)
+
+    new_urls = [url for url in discovered if url not in previous_scraped_at]
+    known_urls = [url for url in discovered if url in previous_scraped_at]
+
+    # Oldest scrape first, so repeated runs rotate through the whole directory
+    def scraped_at(url: str) -> str:
+        return previous_scraped_at[url] or ''
+
+    refresh_count = min(len(known_urls), math.ceil(len(known_urls) * max(refresh_fraction, 0.0)))
+    refresh_urls = sorted(known_urls, key=scraped_at)[:refresh_count]
+    refresh_set = set(refresh_urls)
+
+    return {
+        'new_urls': new_urls,
+        'refresh_urls': refresh_urls,
+        'unchanged_urls': [url for url in known_urls if url not in refresh_set],
+        'removed_urls': [url for url in previous_scraped_at if url not in discovered_set]
+    }
+
+
+def merge_incremental_results(discovered_urls: Iterable[str],
+                              previous_records: Dict[str, Dict[str, Any]],
+                              fresh_results: List[Dict[str, Any]],
+                              directory_complete: bool = True) -> List[Dict[str, Any]]:
+    """
+    Merge freshly scraped results with carried-over previous records
+
+    A fresh success replaces the previous record; malls that were not refetched,
+    or whose refetch failed, keep their previous record. Malls that were not
+    discovered are dropped only after a complete directory read; otherwise a
+    failed directory page would look like its malls left the directory.
+
+    Args:
+        discovered_urls: URLs found in the directory this run
+        previous_records: Records from the previous output, keyed by URL
+        fresh_results: Results scraped in this run
+        directory_complete: Whether every directory page was read this run
+
+    Returns:
+        Result dictionaries for the complete dataset, in directory order, followed
+        by the undiscovered previous records when the directory read was incomplete
+    """
+    fresh_by_url = {}
+    for result in fresh_results:
+        if result.get('success') or result['url'] not in fresh_by_url:
+            fresh_by_url[result['url']] = result
+
+    merged = []
+    for url in dict.fromkeys(discovered_urls):
+        fresh = fresh_by_url.get(url)
+        if fresh and fresh.get('success'):
+            merged.append(fresh)
+        elif url in previous_records:
+            merged.append(record_to_result(previous_records[url]))
+        elif fresh:
+            merged.append(fresh)
+
+    if not directory_complete:
+        discovered = set(discovered_urls)
+        merged.extend(record_to_result(record) for url, record in previous_records.items()
+                      if url not in discovered)
+    return merged
@@ -0,0 +1,78 @@
+"""
+Streaming JSONL sink for MECSR scraper output.
+Appends one mall record per line as soon as it is extracted, so memory stays
+flat and a crash only loses the records written since the last fsync.
+"""
+
+from typing import Dict, Any
+from pathlib import Path
+import json
+import os
+import time
+
+from utils.helpers import build_mall_record, datetime_encoder, ensure_directory
+
+
+class JsonlResultSink:
+    """Append-only JSON Lines writer for scraped mall records"""
+
+    def __init__(self,
+                 output_file: str,
+                 fsync_every: int = 25,
+                 fsync_interval: float = 5.0):
+        """
+        Initialize the JsonlResultSink
+
+        Args:
+            output_file: Path of the .jsonl file to append to
+            fsync_every: Force records to disk after this many writes
+            fsync_interval: Force records to disk at least this often (seconds)
+        """
+        self.output_file = Path(output_file)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        ensure_directory(str(self.output_file.parent))
+        self._file = open(self.output_file, 'a', encoding='utf-8')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.records_written = 0
+
+    def write(self, result: Dict[str, Any]) -> bool:
+        """
+        Append a scrape result if it carries extracted mall data
+
+        Args:
+            result: Result dictionary from the scraper
+
+        Returns:
+            True if a record was written
+        """
+        if not (result.get('success') and result.get('data')):
+            return False
+
+        line = json.dumps(build_mall_record(result), ensure_ascii=False, default=datetime_encoder)
+        self._file.write(line + "\n")
+        self._file.flush()
+        self.records_written += 1
+        self._unsynced += 1
+
+        sync_due = time.monotonic() - self._last_sync >= self.fsync_interval
+        if self._unsynced >= self.fsync_every or sync_due:
+            self.sync()
+        return True
+
+    def sync(self):
+        """Flush written records to stable storage"""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close the output file"""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
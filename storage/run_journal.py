@@ -0,0 +1,189 @@
+"""
+Persistent run journal for MECSR scraper runs.
+Records the outcome of every scraped URL as it happens so an interrupted run
+can be resumed, retrying only the URLs that have not succeeded yet.
+"""
+
+from typing import Dict, Any, List, Optional, Set
+from pathlib import Path
+import json
+import os
+import time
+
+from utils.constants import RUN_JOURNAL_DIR
+from utils.helpers import datetime_encoder, ensure_directory, get_iso_timestamp
+
+
+class RunJournal:
+    """Append-only journal of URL outcomes for one scraper run"""
+
+    def __init__(self,
+                 run_id: str,
+                 directory: str = RUN_JOURNAL_DIR,
+                 store_records: bool = False,
+                 fsync_every: int = 25):
+        """
+        Initialize the RunJournal
+
+        Args:
+            run_id: Run identifier (the run's output timestamp)
+            directory: Directory holding journals
+            store_records: Also journal extracted mall data, for runs whose output
+                is only written at the end and would otherwise be lost on a crash
+            fsync_every: Force entries to disk after this many writes
+        """
+        self.run_id = run_id
+        self.directory = ensure_directory(directory)
+        self.store_records = store_records
+        self.fsync_every = fsync_every
+
+        self.journal_path = self.directory / f"{run_id}.journal.jsonl"
+        self.meta_path = self.directory / f"{run_id}.meta.json"
+        self.urls_path = self.directory / f"{run_id}.urls.json"
+        self.queued_path = self.directory / f"{run_id}.queued.jsonl"
+
+        self._file = None
+        self._queued_file = None
+        self._unsynced = 0
+
+    @classmethod
+    def exists(cls, run_id: str, directory: str = RUN_JOURNAL_DIR) -> bool:
+        """Whether a journal has been started for a run"""
+        return (Path(directory) / f"{run_id}.meta.json").exists()
+
+    def write_meta(self, **meta: Any):
+        """Write run metadata (output format, output file, options)"""
+        meta = {'run_id': self.run_id, 'started_at': get_iso_timestamp(), **meta}
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    def load_meta(self) -> Dict[str, Any]:
+        """
+        Load run metadata
+
+        Raises:
+            FileNotFoundError: If the run has no journal
+        """
+        with open(self.meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_urls(self, urls: List[str]):
+        """Persist the run's full URL list so a resume does not need to rediscover it"""
+        tmp_path = self.urls_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(urls, f)
+        os.replace(tmp_path, self.urls_path)
+
+    def load_urls(self) -> Optional[List[str]]:
+        """Load the saved URL list, if discovery completed before the interruption"""
+        try:
+            with open(self.urls_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def record_queued_url(self, url: str):
+        """Append a URL as it is handed to the workers, while discovery is still running"""
+        if self._queued_file is None:
+            self._queued_file = open(self.queued_path, 'a', encoding='utf-8')
+        self._queued_file.write(json.dumps(url) + "\n")
+        self._queued_file.flush()
+
+    def load_queued_urls(self) -> List[str]:
+        """Load the URLs queued before the interruption, in queue order"""
+        urls = []
+        if not self.queued_path.exists():
+            return urls
+
+        with open(self.queued_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    urls.append(json.loads(line))
+                except ValueError:
+                    continue  # Tolerate a torn final line after a crash
+        return urls
+
+    def record(self, result: Dict[str, Any]):
+        """
+        Append the outcome of one URL
+
+        Args:
+            result: Result dictionary from the scraper
+        """
+        if self._file is None:
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+
+        entry = {
+            'url': result.get('url'),
+            'success': bool(result.get('success')),
+            'error': result.get('error'),
+            'response_time': result.get('response_time', 0.0),
+            'scraped_at': result.get('scraped_at'),
+            'recorded_at': time.time()
+        }
+        if self.store_records and result.get('data'):
+            entry['data'] = result['data']
+
+        self._file.write(json.dumps(entry, ensure_ascii=False, default=datetime_encoder) + "\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def load_entries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the latest journal entry for each URL
+
+        A URL that succeeded once stays successful even if a later attempt failed.
+        """
+        entries = {}
+        if not self.journal_path.exists():
+            return entries
+
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Tolerate a torn final line after a crash
+                previous = entries.get(entry['url'])
+                if previous and previous['success'] and not entry['success']:
+                    continue
+                entries[entry['url']] = entry
+        return entries
+
+    def successful_urls(self) -> Set[str]:
+        """URLs that have already been scraped successfully"""
+        return {url for url, entry in self.load_entries().items() if entry['success']}
+
+    def failed_urls(self) -> Set[str]:
+        """URLs whose latest attempt failed"""
+        return {url for url, entry in self.load_entries().items() if not entry['success']}
+
+    def successful_results(self) -> List[Dict[str, Any]]:
+        """Rebuild result dictionaries for journaled successes that carry their data"""
+        return [
+            {
+                'url': entry['url'],
+                'success': True,
+                'data': entry['data'],
+                'response_time': entry.get('response_time', 0.0),
+                'scraped_at': entry.get('scraped_at')
+            }
+            for entry in self.load_entries().values()
+            if entry['success'] and entry.get('data')
+        ]
+
+    def close(self):
+        """Sync and close the journal"""
+        for file in (self._file, self._queued_file):
+            if file is not None:
+                file.flush()
+                os.fsync(file.fileno())
+                file.close()
+        self._file = None
+        self._queued_file = None
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+SQLite mall store for MECSR scraper output.
+
+Every streamlined mall record is upserted into one long-lived database instead
+of a new monolithic JSON file per run. Malls, their tenants and property
+details live in normalised tables indexed on URL, name, type and country, and
+every scrape of a mall is kept in a history table, so single-mall lookups and
+incremental planning are indexed queries rather than full-file loads.
+
+Usage:
+    python -m storage.sqlite_store output/mecsr_malls.sqlite --country Qatar
+    python -m storage.sqlite_store output/mecsr_malls.sqlite \
+        --name "Dubai M" --type "Super Regional"
+    python -m storage.sqlite_store output/mecsr_malls.sqlite \
+        --history https://www.mecsr.org/directory-shopping-centres/01-burda
+    python -m storage.sqlite_store output/mecsr_malls.sqlite \
+        --import output/mecsr_scraping_<timestamp>.json
+"""
+
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from pathlib import Path
+import argparse
+import json
+import sqlite3
+import time
+
+from storage.incremental import load_previous_records
+from utils.constants import STREAMLINED_FIELDS
+from utils.helpers import (
+    build_mall_record, country_from_address, datetime_encoder, ensure_directory, get_iso_timestamp
+)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS malls (
+    url TEXT PRIMARY KEY,
+    name TEXT COLLATE NOCASE,
+    external_url TEXT,
+    mall_type TEXT COLLATE NOCASE,
+    development_status TEXT,
+    country TEXT COLLATE NOCASE,
+    address TEXT,
+    latitude REAL,
+    longitude REAL,
+    first_image TEXT,
+    total_tenants INTEGER,
+    response_time REAL,
+    first_scraped_at TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    record TEXT NOT NULL  -- Full streamlined record as JSON, as the file outputs hold it
+);
+CREATE INDEX IF NOT EXISTS idx_malls_name ON malls (name);
+CREATE INDEX IF NOT EXISTS idx_malls_type ON malls (mall_type);
+CREATE INDEX IF NOT EXISTS idx_malls_country ON malls (country);
+-- Covers incremental planning
+CREATE INDEX IF NOT EXISTS idx_malls_scraped_at ON malls (scraped_at, url);
+
+CREATE TABLE IF NOT EXISTS tenants (
+    mall_url TEXT NOT NULL REFERENCES malls (url) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL COLLATE NOCASE,
+    category TEXT,
+    PRIMARY KEY (mall_url, position)
+);
+CREATE INDEX IF NOT EXISTS idx_tenants_name ON tenants (name);
+
+CREATE TABLE IF NOT EXISTS property_details (
+    mall_url TEXT NOT NULL REFERENCES malls (url) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (mall_url, key)
+);
+
+CREATE TABLE IF NOT EXISTS scrape_history (
+    mall_url TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    response_time REAL,
+    PRIMARY KEY (mall_url, scraped_at)
+);
+"""
+
+MALL_COLUMNS = ('url', 'name', 'external_url', 'mall_type', 'development_status', 'country',
+                'address', 'latitude', 'longitude', 'first_image', 'total_tenants', 'response_time',
+                'first_scraped_at', 'scraped_at', 'record')
+
+# first_scraped_at is kept from the first insert; everything else follows the latest scrape
+UPSERT_MALL = (
+    f"INSERT INTO malls ({', '.join(MALL_COLUMNS)}) VALUES ({', '.join('?' * len(MALL_COLUMNS))}) "
+    f"ON CONFLICT (url) DO UPDATE SET "
+    + ', '.join(f"{column} = excluded.{column}" for column in MALL_COLUMNS
+                if column not in ('url', 'first_scraped_at'))
+)
+
+
+class SqliteMallStore:
+    """Batched upserts of mall records into SQLite, usable as the scraper's result sink"""
+
+    def __init__(self,
+                 db_path: str,
+                 batch_size: int = 50,
+                 flush_interval: float = 5.0):
+        """
+        Initialize the SqliteMallStore
+
+        Args:
+            db_path: Database file, created with its schema on first use
+            batch_size: Records buffered before they are written in one transaction
+            flush_interval: Write buffered records at least this often (seconds)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        self.output_file = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        ensure_directory(str(self.output_file.parent))
+        self._conn = sqlite3.connect(str(self.output_file))
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets readers query the store while a run is writing to it
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(SCHEMA)
+
+        self._pending: List[Dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self.records_written = 0
+
+    @classmethod
+    def from_settings(cls) -> "SqliteMallStore":
+        """Open the store configured by ScrapingSettings"""
+        from config import settings
+
+        return cls(settings.sqlite_path, batch_size=settings.sqlite_batch_size)
+
+    def write(self, result: Dict[str, Any]) -> bool:
+        """
+        Queue a scrape result for upsert if it carries extracted mall data
+
+        Args:
+            result: Result dictionary from the scraper
+
+        Returns:
+            True if a record was queued
+        """
+        if not (result.get('success') and result.get('data')):
+            return False
+
+        self._pending.append(build_mall_record(result))
+        self.records_written += 1
+        if (len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+        return True
+
+    def flush(self):
+        """Upsert the queued records in one transaction"""
+        if self._pending:
+            self.upsert_records(self._pending)
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+    def upsert_records(self, records: Iterable[Dict[str, Any]]):
+        """
+        Insert or update mall records, replacing their tenants and property details
+
+        A projected record (--fields) is merged into the stored one, so fields
+        it does not carry keep their stored values, tenants and property details.
+
+        Args:
+            records: Mall records as written to the JSON outputs (with _scraping_metadata)
+        """
+        malls, tenants, details, history = [], [], [], []
+        for record in records:
+            url = record['url']
+            if not record.keys() >= set(STREAMLINED_FIELDS):
+                row = self._conn.execute("SELECT record FROM malls WHERE url = ?",
+                                         (url,)).fetchone()
+                if row:
+                    record = {**json.loads(row['record']), **record}
+            metadata = record.get('_scraping_metadata') or {}
+            scraped_at = metadata.get('scraped_at') or get_iso_timestamp()
+            location = record.get('location') or {}
+
+            malls.append((
+                url, record.get('name'), record.get('external_url'), record.get('mall_type'),
+                record.get('development_status'), country_from_address(location.get('address')),
+                location.get('address'), location.get('latitude'), location.get('longitude'),
+                record.get('first_image'), record.get('total_tenants'),
+                metadata.get('response_time'), scraped_at, scraped_at,
+                json.dumps(record, ensure_ascii=False, default=datetime_encoder)
+            ))
+            tenants.extend(
+                (url, position, tenant.get('name'), tenant.get('category'))
+                for position, tenant in enumerate(record.get('tenants') or []) if tenant.get('name')
+            )
+            details.extend(
+                (url, key, value if value is None or isinstance(value, str)
+                 else json.dumps(value, ensure_ascii=False))
+                for key, value in (record.get('property_details') or {}).items()
+            )
+            history.append((url, scraped_at, metadata.get('response_time')))
+
+        urls = [(mall[0],) for mall in malls]
+        with self._conn:
+            self._conn.executemany(UPSERT_MALL, malls)
+            # A re-scrape replaces the child rows wholesale; tenants can disappear or reorder
+            self._conn.executemany("DELETE FROM tenants WHERE mall_url = ?", urls)
+            self._conn.executemany("DELETE FROM property_details WHERE mall_url = ?", urls)
+            self._conn.executemany("INSERT OR REPLACE INTO tenants VALUES (?, ?, ?, ?)", tenants)
+            self._conn.executemany("INSERT OR REPLACE INTO property_details VALUES (?, ?, ?)",
+                                   details)
+            self._conn.executemany("INSERT OR IGNORE INTO scrape_history VALUES (?, ?, ?)", history)
+
+    def import_file(self, path: str) -> int:
+        """
+        Upsert every record of a JSON or JSONL scraper output
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Number of records imported
+        """
+        records = list(load_previous_records(path).values())
+        self.upsert_records(records)
+        return len(records)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Latest record of one mall, or None if it is not stored"""
+        self.flush()
+        row = self._conn.execute("SELECT record FROM malls WHERE url = ?", (url,)).fetchone()
+        return json.loads(row['record']) if row else None
+
+    def find(self,
+             name: Optional[str] = None,
+             mall_type: Optional[str] = None,
+             country: Optional[str] = None,
+             tenant: Optional[str] = None,
+             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Query stored malls; every filter is case-insensitive and uses an index
+
+        Args:
+            name: Mall name prefix
+            mall_type: Exact mall type
+            country: Exact country
+            tenant: Exact tenant name the mall must have
+            limit: Maximum number of records
+
+        Returns:
+            Matching records, ordered by name
+        """
+        self.flush()
+        conditions, params = [], []
+        if name:
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append(name.replace('%', r'\%').replace('_', r'\_') + '%')
+        if mall_type:
+            conditions.append("mall_type = ?")
+            params.append(mall_type)
+        if country:
+            conditions.append("country = ?")
+            params.append(country)
+        if tenant:
+            conditions.append("url IN (SELECT mall_url FROM tenants WHERE name = ?)")
+            params.append(tenant)
+
+        query = "SELECT record FROM malls"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY name"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row['record']) for row in self._conn.execute(query, params)]
+
+    def load_records(self, urls: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Latest records keyed by URL
+
+        Args:
+            urls: Only these malls; None loads every stored mall
+
+        Returns:
+            Dictionary mapping mall URL to its record
+        """
+        self.flush()
+        if urls is None:
+            rows = self._conn.execute("SELECT url, record FROM malls")
+            return {row['url']: json.loads(row['record']) for row in rows}
+
+        records = {}
+        for url in urls:
+            record = self.get(url)
+            if record is not None:
+                records[url] = record
+        return records
+
+    def scraped_at_by_url(self) -> Dict[str, str]:
+        """Latest scrape time of every stored mall, for incremental planning"""
+        self.flush()
+        rows = self._conn.execute("SELECT url, scraped_at FROM malls")
+        return {row['url']: row['scraped_at'] for row in rows}
+
+    def history(self, url: str) -> List[Tuple[str, Optional[float]]]:
+        """Every recorded (scraped_at, response_time) of a mall, oldest first"""
+        self.flush()
+        rows = self._conn.execute(
+            "SELECT scraped_at, response_time FROM scrape_history "
+            "WHERE mall_url = ? ORDER BY scraped_at", (url,)
+        )
+        return [(row['scraped_at'], row['response_time']) for row in rows]
+
+    def remove(self, urls: Iterable[str]) -> int:
+        """
+        Delete malls that left the directory; their scrape history is kept
+
+        Args:
+            urls: Mall URLs to delete
+
+        Returns:
+            Number of malls deleted
+        """
+        self.flush()
+        with self._conn:
+            cursor = self._conn.executemany("DELETE FROM malls WHERE url = ?",
+                                            [(url,) for url in urls])
+        return cursor.rowcount
+
+    def count(self) -> int:
+        """Number of stored malls"""
+        self.flush()
+        return self._conn.execute("SELECT COUNT(*) FROM malls").fetchone()[0]
+
+    def close(self):
+        """Write queued records and close the database"""
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+    def __enter__(self) -> "SqliteMallStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Query or fill the SQLite mall store")
+    parser.add_argument("db", help="Database file, e.g. output/mecsr_malls.sqlite")
+    parser.add_argument("--import", dest="import_file", default=None,
+                        help="Upsert every record of a JSON/JSONL scraper output first")
+    parser.add_argument("--url", default=None, help="Print the record of one mall")
+    parser.add_argument("--history", metavar="URL", default=None,
+                        help="Print when a mall was scraped")
+    parser.add_argument("--name", default=None, help="Mall name prefix")
+    parser.add_argument("--type", dest="mall_type", default=None, help="Mall type")
+    parser.add_argument("--country", default=None, help="Country")
+    parser.add_argument("--tenant", default=None, help="Tenant name")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of malls to print")
+    args = parser.parse_args(argv)
+
+    with SqliteMallStore(args.db) as store:
+        if args.import_file:
+            print(f"📥 Imported {store.import_file(args.import_file)} malls from {args.import_file}")
+
+        if args.url:
+            record = store.get(args.url)
+            if record is None:
+                print(f"❌ No mall stored for {args.url}")
+            else:
+                print(json.dumps(record, indent=2, ensure_ascii=False))
+        elif args.history:
+            for scraped_at, response_time in store.history(args.history):
+                print(f"{scraped_at}  {response_time or 0.0:.2f}s")
+        elif args.name or args.mall_type or args.country or args.tenant:
+            records = store.find(name=args.name, mall_type=args.mall_type, country=args.country,
+                                 tenant=args.tenant, limit=args.limit)
+            for record in records:
+                print(f"{record.get('name') or '?'}  |  {record.get('mall_type') or '-'}  |  "
+                      f"{record['url']}")
+            print(f"🔎 {len(records)} malls")
+        elif not args.import_file:
+            print(f"🗄️ {store.count()} malls in {args.db}")
+
+
+if __name__ == "__main__":
+    main()
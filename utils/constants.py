@@ -12,13 +12,32 @@ DEFAULT_REQUESTS_PER_MINUTE = 30
 DEFAULT_BATCH_SIZE = 10
 DEFAULT_RATE_LIMIT_DELAY = 2.0  # seconds
 
+# Pipeline modes
+PIPELINE_BATCH = "batch"    # Fixed-size batches, each gathered before the next starts
+PIPELINE_STREAM = "stream"  # Continuous worker pool fed from a URL queue
+DEFAULT_PIPELINE_MODE = PIPELINE_STREAM
+
+# Extraction backends for the streamlined record (all produce identical output)
+EXTRACTOR_BS4 = "bs4"                  # EnhancedDataExtractor, one BeautifulSoup search per field
+EXTRACTOR_SINGLE_PASS = "single_pass"  # One walk over the BeautifulSoup tree
+EXTRACTOR_LXML = "lxml"                # lxml parse with precompiled XPath
+EXTRACTOR_BACKENDS = (EXTRACTOR_BS4, EXTRACTOR_SINGLE_PASS, EXTRACTOR_LXML)
+DEFAULT_EXTRACTOR_BACKEND = EXTRACTOR_SINGLE_PASS
+# Bump whenever any backend's output changes, so records cached for unchanged pages are re-extracted
+EXTRACTOR_VERSION = 1
+
 # Output settings
 OUTPUT_DIR = "output"
+RUN_JOURNAL_DIR = f"{OUTPUT_DIR}/runs"
 TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
 
 # File patterns
 OUTPUT_FILE_PATTERN = "mecsr_scraping_{timestamp}.json"
+OUTPUT_JSONL_PATTERN = "mecsr_scraping_{timestamp}.jsonl"
+OUTPUT_REPORT_PATTERN = "mecsr_report_{timestamp}.json"  # Run report written next to the output
+OUTPUT_LISTING_PATTERN = "mecsr_listing_{timestamp}.json"
 MALLS_DB_FILENAME = "mecsr_malls_{timestamp}.json"
+ARCHIVE_FILE_PATTERN = "archive/mecsr_pages_{timestamp}"  # .warc.gz + .idx.jsonl
 FILE_EXTENSION_JSON = ".json"
 
 # HTTP settings
@@ -37,6 +56,41 @@ MIN_LATITUDE = -90.0
 MAX_LONGITUDE = 180.0
 MIN_LONGITUDE = -180.0
 
+# Fields a listing-only record needs; records missing any are enriched from their detail page
+LISTING_REQUIRED_FIELDS = ['name', 'url', 'property_type', 'status', 'latitude', 'longitude']
+
+# Fields a projection can select; 'url' is always included
+STREAMLINED_FIELDS = ('name', 'external_url', 'property_details', 'location', 'tenants',
+                      'first_image', 'mall_type', 'development_status', 'total_tenants')
+COMPREHENSIVE_FIELDS = ('mall_name', 'basic_info', 'property_details', 'location_data',
+                        'contact_info', 'tenant_data', 'media_content', 'structured_data',
+                        'metadata')
+
+# Metrics: one latency histogram per pipeline phase, in the order a page goes through them
+METRIC_QUEUE_WAIT = "mecsr_queue_wait_seconds"            # URL queued until a worker picks it up
+METRIC_RATE_LIMIT_WAIT = "mecsr_rate_limit_wait_seconds"  # Token bucket wait, including jitter
+METRIC_CONCURRENCY_WAIT = "mecsr_concurrency_wait_seconds"  # Waiting for a request slot
+METRIC_DNS = "mecsr_dns_seconds"                          # DNS resolution (cache misses only)
+METRIC_CONNECT = "mecsr_connect_seconds"                  # New connection, DNS and TLS included
+METRIC_TTFB = "mecsr_ttfb_seconds"                        # Request sent until response headers
+METRIC_BODY_DOWNLOAD = "mecsr_body_download_seconds"      # Reading the response body
+METRIC_PARSE = "mecsr_parse_seconds"                      # HTML parse into a tree
+METRIC_EXTRACT = "mecsr_extract_seconds"                  # Field extraction from the tree
+PHASE_METRICS = (METRIC_QUEUE_WAIT, METRIC_RATE_LIMIT_WAIT, METRIC_CONCURRENCY_WAIT, METRIC_DNS,
+                 METRIC_CONNECT, METRIC_TTFB, METRIC_BODY_DOWNLOAD, METRIC_PARSE, METRIC_EXTRACT)
+METRIC_PAGE = "mecsr_page_seconds"                        # Whole fetch-and-extract of one mall page
+METRIC_REQUESTS = "mecsr_requests_total"                  # Requests by status code or error type
+METRIC_RESPONSE_BYTES = "mecsr_response_bytes_total"      # Decoded response body bytes
+
+# Countries listed in the directory; mall addresses end with one of these names or aliases
+COUNTRY_NAMES = (
+    'United Arab Emirates', 'Saudi Arabia', 'Egypt', 'Iran', 'Kuwait', 'Oman', 'Bahrain', 'Türkiye',
+    'Pakistan', 'Qatar', 'Lebanon', 'Iraq', 'Jordan', 'Nigeria', 'Kazakhstan', 'Azerbaijan',
+    'Morocco', 'Georgia', 'Algeria', 'Ghana', 'Yemen', 'Kyrgyzstan', 'Uzbekistan', 'Sudan', 'Syria',
+    'Libya', 'Afghanistan', 'Kenya', 'Zambia', 'Tunisia', 'Palestine', 'Turkmenistan', 'Tajikistan'
+)
+COUNTRY_ALIASES = {'UAE': 'United Arab Emirates', 'KSA': 'Saudi Arabia', 'Turkey': 'Türkiye'}
+
 # Error messages
 ERROR_TIMEOUT = "Request timeout"
 ERROR_PARSE = "Failed to parse response"
@@ -1,10 +1,14 @@
 """Common utility functions for MECSR scraper."""
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Pattern, Tuple
 from decimal import Decimal
 
+from .constants import COUNTRY_NAMES, COUNTRY_ALIASES
+
 
 def get_iso_timestamp() -> str:
     """Get current timestamp in ISO format."""
@@ -43,6 +47,29 @@ def create_error_result(error: str, url: str) -> Dict[str, Any]:
     }
 
 
+def build_mall_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the output mall record for a successful scrape result."""
+    mall_dict = dict(result['data'])
+
+    # Handle datetime objects for JSON serialization
+    if 'last_updated' in mall_dict and isinstance(mall_dict['last_updated'], datetime):
+        mall_dict['last_updated'] = mall_dict['last_updated'].isoformat()
+
+    # Add scraping metadata
+    mall_dict['_scraping_metadata'] = {
+        'response_time': result.get('response_time', 0.0),
+        'scraped_at': result.get('scraped_at', get_iso_timestamp())
+    }
+    return mall_dict
+
+
+def datetime_encoder(obj: Any) -> str:
+    """JSON encoder hook for datetime objects."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
 def calculate_success_rate(successes: int, total: int) -> float:
     """Calculate success rate as percentage."""
     if total == 0:
@@ -86,6 +113,46 @@ def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
     return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
+def percentile(values: List[float], pct: float) -> float:
+    """Percentile (0-100) of values with linear interpolation; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@lru_cache(maxsize=1)
+def _country_lookup() -> Tuple[Pattern, Dict[str, str]]:
+    """Address suffix pattern (a trailing postcode is allowed) and lowercase name -> country."""
+    countries = {name.lower(): name for name in COUNTRY_NAMES}
+    countries.update((alias.lower(), name) for alias, name in COUNTRY_ALIASES.items())
+    # Longest first, e.g. "saudi arabia" before "arabia"
+    names = sorted(countries, key=len, reverse=True)
+    alternatives = '|'.join(re.escape(name) for name in names)
+    pattern = re.compile(r'(?:^|[^\w])(' + alternatives + r')[\W\d]*$', re.IGNORECASE)
+    return pattern, countries
+
+
+def country_from_address(address: Optional[str]) -> Optional[str]:
+    """Country a mall address ends with, or None if it names no known country."""
+    if not address:
+        return None
+    pattern, countries = _country_lookup()
+    match = pattern.search(address.replace('View On Larger Map', '').strip())
+    return countries[match.group(1).lower()] if match else None
+
+
+def parse_field_list(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated field list; empty or None means all fields."""
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    return fields or None
+
+
 def calculate_eta(current: int, total: int, elapsed_seconds: float) -> str:
     """Calculate estimated time remaining."""
     if current == 0 or elapsed_seconds == 0:
@@ -0,0 +1,295 @@
+"""
+In-process metrics for MECSR scraping.
+
+Latency histograms and counters live in a process-wide registry that the
+crawler, session pool, scraper and extraction stage record into. The registry
+renders the Prometheus text exposition format, so a run can be inspected by
+dumping it to a file periodically (e.g. for node_exporter's textfile collector)
+or as a JSON snapshot with percentiles.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import asyncio
+import json
+import math
+import os
+import random
+import time
+
+from .helpers import percentile
+
+
+# Upper bounds (seconds) spanning sub-millisecond parsing up to long Retry-After waits
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                           1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Samples kept per histogram for exact percentiles; beyond this a uniform reservoir is kept
+MAX_SAMPLES = 100_000
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value the way Prometheus expects"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the text format"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Histogram:
+    """Latency distribution with cumulative buckets plus raw samples for percentiles"""
+
+    def __init__(self, name: str, description: str,
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize the Histogram
+
+        Args:
+            name: Metric name, e.g. mecsr_ttfb_seconds
+            description: Help text shown in the exposition
+            buckets: Increasing bucket upper bounds; +Inf is added implicitly
+        """
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._samples: List[float] = []
+
+    def observe(self, value: float):
+        """Record one observation"""
+        value = max(0.0, value)
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+                break
+
+        if len(self._samples) < MAX_SAMPLES:
+            self._samples.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < MAX_SAMPLES:
+                self._samples[slot] = value
+
+    def percentile(self, pct: float) -> float:
+        """Percentile (0-100) of the observations, 0.0 when there are none"""
+        return percentile(self._samples, pct)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the distribution
+
+        Returns:
+            Dictionary with count, sum, mean, p50, p95, p99 and max
+        """
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max
+        }
+
+    def to_prometheus(self) -> List[str]:
+        """Exposition lines for this histogram"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative += bucket_count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter, optionally split by label values"""
+
+    def __init__(self, name: str, description: str):
+        """
+        Initialize the Counter
+
+        Args:
+            name: Metric name, ending in _total by convention
+            description: Help text shown in the exposition
+        """
+        self.name = name
+        self.description = description
+        self.values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any):
+        """Add amount to the series identified by labels"""
+        key = tuple(sorted((name, str(value)) for name, value in labels.items()))
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    @property
+    def total(self) -> float:
+        """Sum over every label combination"""
+        return sum(self.values.values())
+
+    def to_prometheus(self) -> List[str]:
+        """Exposition lines for this counter"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.values.items()):
+            labels = ','.join(f'{name}="{_escape_label(label)}"' for name, label in key)
+            series = f"{self.name}{{{labels}}}" if labels else self.name
+            lines.append(f"{series} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named histograms and counters with Prometheus text and JSON exporters"""
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, Counter] = {}
+
+    def histogram(self, name: str, description: str = "",
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        """Get the histogram called name, creating it on first use"""
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(name, description or name, buckets)
+        return self.histograms[name]
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Get the counter called name, creating it on first use"""
+        if name not in self.counters:
+            self.counters[name] = Counter(name, description or name)
+        return self.counters[name]
+
+    def observe(self, name: str, value: float):
+        """Record value in the histogram called name"""
+        self.histogram(name).observe(value)
+
+    def to_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+
+        Returns:
+            Exposition text, newline terminated
+        """
+        lines = []
+        for name in sorted(self.histograms):
+            lines.extend(self.histograms[name].to_prometheus())
+        for name in sorted(self.counters):
+            lines.extend(self.counters[name].to_prometheus())
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize every metric
+
+        Returns:
+            Dictionary with per-histogram summaries and per-counter series
+        """
+        return {
+            'histograms': {name: histogram.summary()
+                           for name, histogram in sorted(self.histograms.items())},
+            'counters': {
+                name: {','.join(f"{key}={value}" for key, value in series) or 'total': value
+                       for series, value in sorted(counter.values.items())}
+                for name, counter in sorted(self.counters.items())
+            }
+        }
+
+    def write(self, path: str):
+        """
+        Write the metrics to a file, atomically so readers never see a partial dump
+
+        Args:
+            path: Destination; a .json suffix writes the snapshot, anything else
+                the Prometheus text format
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.suffix == '.json':
+            content = json.dumps(self.snapshot(), indent=2)
+        else:
+            content = self.to_prometheus()
+
+        temp_path = target.with_name(f".{target.name}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, target)
+
+
+class MetricsDumper:
+    """Background task that rewrites a metrics file every few seconds during a run"""
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 15.0):
+        """
+        Initialize the MetricsDumper
+
+        Args:
+            registry: Registry to dump
+            path: Metrics file (see MetricsRegistry.write)
+            interval: Seconds between dumps
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start dumping in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.registry.write(self.path)
+
+    async def stop(self):
+        """Stop the background task and write the final metrics"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.registry.write(self.path)
+
+
+class TimedQueue(asyncio.Queue):
+    """asyncio.Queue that records how long each item waited before being taken"""
+
+    def __init__(self, histogram: Histogram, maxsize: int = 0):
+        """
+        Initialize the TimedQueue
+
+        Args:
+            histogram: Receives each item's wait; None items (stop signals) are not timed
+            maxsize: Queue capacity, 0 for unbounded
+        """
+        super().__init__(maxsize)
+        self.histogram = histogram
+
+    def _put(self, item):
+        super()._put((item, time.perf_counter()))
+
+    def _get(self):
+        item, queued_at = super()._get()
+        if item is not None:
+            self.histogram.observe(time.perf_counter() - queued_at)
+        return item
+
+
+@lru_cache(maxsize=None)
+def get_metrics_registry() -> MetricsRegistry:
+    """Process-wide registry shared by every scraper component"""
+    return MetricsRegistry()
@@ -1,32 +1,125 @@
 """Reporting utilities for MECSR scraper."""
 
-from typing import Dict, Any, List
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
 from datetime import datetime
-from .helpers import format_percentage, format_throughput, calculate_success_rate
+import json
 
+from .constants import (
+    PHASE_METRICS, STREAMLINED_FIELDS, METRIC_REQUESTS, METRIC_RESPONSE_BYTES
+)
+from .helpers import (
+    format_percentage, format_throughput, calculate_success_rate, percentile, ensure_directory
+)
+from .metrics import MetricsRegistry
 
-def generate_scraping_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Generate comprehensive scraping report."""
+
+def _has_value(value: Any) -> bool:
+    """Whether an extracted value carries data (nested dicts need one non-empty entry)."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return bool(value.strip())
+    if isinstance(value, dict):
+        return any(_has_value(item) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return bool(value)
+    return True
+
+
+def present_fields(data: Dict[str, Any]) -> List[str]:
+    """Names of the fields of an extracted record that carry data."""
+    return [field for field, value in data.items() if _has_value(value)]
+
+
+def count_present_fields(results: Iterable[Dict[str, Any]]) -> Counter:
+    """Count, per field, the successful results whose record has a value for it."""
+    counts = Counter()
+    for result in results:
+        if result.get('success') and result.get('data'):
+            counts.update(present_fields(result['data']))
+    return counts
+
+
+def _error_kind(result: Dict[str, Any]) -> str:
+    """Short error class of a failed result: exception type, HTTP status or message."""
+    if result.get('error_type'):
+        return result['error_type']
+    if result.get('status_code'):
+        return f"HTTP {result['status_code']}"
+    return result.get('error') or 'unknown'
+
+
+def _phase_name(metric_name: str) -> str:
+    """Short phase name of a phase histogram, e.g. mecsr_ttfb_seconds -> ttfb."""
+    return metric_name.replace('mecsr_', '').replace('_seconds', '')
+
+
+def _latency_summary(values: List[float]) -> Dict[str, float]:
+    """Percentiles of a list of latencies in seconds."""
+    return {
+        'count': len(values),
+        'mean': sum(values) / len(values) if values else 0.0,
+        'p50': percentile(values, 50),
+        'p90': percentile(values, 90),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': max(values) if values else 0.0
+    }
+
+
+def _timestamp_span(results: List[Dict[str, Any]]) -> float:
+    """Seconds between the first and last scraped_at, for callers without a wall time."""
+    timestamps = []
+    for r in results:
+        try:
+            timestamps.append(datetime.fromisoformat(r['scraped_at']))
+        except (KeyError, TypeError, ValueError):
+            continue
+    if len(timestamps) < 2:
+        return 0.0
+    return (max(timestamps) - min(timestamps)).total_seconds()
+
+
+def generate_scraping_report(results: List[Dict[str, Any]],
+                             wall_time: Optional[float] = None,
+                             metrics: Optional[MetricsRegistry] = None,
+                             fields: Optional[Iterable[str]] = None,
+                             field_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    Generate a scraping report from results and the recorded timings.
+
+    Args:
+        results: Final result of every scraped URL (records may already be streamed out)
+        wall_time: Measured run time in seconds; None falls back to the scraped_at span
+        metrics: Registry with request counters and phase histograms, if collected
+        fields: Streamlined fields that were extracted (default: all)
+        field_counts: Per-field count of records with a value, for results whose
+            records are no longer in memory; None counts them from results
+
+    Returns:
+        Report dictionary, JSON serializable
+    """
     total = len(results)
     successes = sum(1 for r in results if r.get('success', False))
     success_rate = calculate_success_rate(successes, total)
 
-    # Calculate timing
-    start_time = min(r.get('scraped_at') for r in results if r.get('scraped_at'))
-    end_time = max(r.get('scraped_at') for r in results if r.get('scraped_at'))
+    duration_seconds = wall_time if wall_time is not None else _timestamp_span(results)
+    throughput_per_second = total / duration_seconds if duration_seconds > 0 else 0
 
-    if start_time and end_time:
-        try:
-            start = datetime.fromisoformat(start_time)
-            end = datetime.fromisoformat(end_time)
-            duration_seconds = (end - start).total_seconds()
-            throughput_per_second = total / duration_seconds if duration_seconds > 0 else 0
-        except:
-            duration_seconds = 0
-            throughput_per_second = 0
-    else:
-        duration_seconds = 0
-        throughput_per_second = 0
+    requests = metrics.counters.get(METRIC_REQUESTS) if metrics else None
+    http_requests = sum(value for labels, value in requests.values.items()
+                        if ('outcome', 'cache') not in labels) if requests else 0
+    response_bytes = metrics.counters.get(METRIC_RESPONSE_BYTES) if metrics else None
+
+    retried = [r for r in results if r.get('retries')]
+    errors = Counter(_error_kind(r) for r in results if not r.get('success', False))
+
+    if field_counts is None:
+        field_counts = count_present_fields(results)
+    selected = set(fields) if fields is not None else set(STREAMLINED_FIELDS)
+    fields = [field for field in STREAMLINED_FIELDS if field in selected]
 
     return {
         'summary': {
@@ -35,23 +128,54 @@ def generate_scraping_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
             'failed_scrapes': total - successes,
             'success_rate': success_rate,
             'duration_seconds': duration_seconds,
-            'throughput_per_second': throughput_per_second
+            'throughput_per_second': throughput_per_second,
+            'http_requests': int(http_requests),
+            'requests_per_second': http_requests / duration_seconds if duration_seconds > 0 else 0,
+            'bytes_transferred': int(response_bytes.total) if response_bytes else 0
+        },
+        'latency': {
+            'page': _latency_summary([r['response_time'] for r in results
+                                      if r.get('success') and r.get('response_time') is not None]),
+            'phases': {
+                _phase_name(name): metrics.histograms[name].summary()
+                for name in PHASE_METRICS if metrics and name in metrics.histograms
+            }
+        },
+        'retries': {
+            'attempts': sum(r['retries'] for r in retried),
+            'retried_urls': len(retried),
+            'recovered': sum(1 for r in retried if r.get('success'))
+        },
+        'errors': dict(errors.most_common()),
+        'field_success_rates': {
+            field: calculate_success_rate(field_counts.get(field, 0), successes) for field in fields
         },
         'timestamp': datetime.now().isoformat()
     }
 
 
-def print_scraping_summary(results: List[Dict[str, Any]]) -> None:
+def write_report_json(report: Dict[str, Any], report_file: str) -> str:
+    """Write a report as JSON and return its path."""
+    ensure_directory(str(Path(report_file).parent))
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return report_file
+
+
+def print_scraping_summary(report: Dict[str, Any]) -> None:
     """Print human-readable scraping summary."""
-    report = generate_scraping_report(results)
+    summary = report['summary']
 
     print("\n📊 SCRAPING SUMMARY")
-    print(f"Total processed: {report['summary']['total_urls_processed']}")
-    print(f"Successful: {report['summary']['successful_scrapes']}")
-    print(f"Failed: {report['summary']['failed_scrapes']}")
-    print(f"Success rate: {format_percentage(report['summary']['success_rate'])}")
-    print(f"Duration: {report['summary']['duration_seconds']:.1f}s")
-    print(f"Throughput: {format_throughput(report['summary']['throughput_per_second'])}")
+    print(f"Total processed: {summary['total_urls_processed']}")
+    print(f"Successful: {summary['successful_scrapes']}")
+    print(f"Failed: {summary['failed_scrapes']}")
+    print(f"Success rate: {format_percentage(summary['success_rate'])}")
+    print(f"Duration: {summary['duration_seconds']:.1f}s")
+    print(f"Throughput: {format_throughput(summary['throughput_per_second'])}")
+    if report['errors']:
+        errors = ', '.join(f'{kind} ×{count}' for kind, count in report['errors'].items())
+        print(f"Errors: {errors}")
 
 
 def print_progress(current: int, total: int, prefix: str = "Progress") -> None:
@@ -65,10 +189,40 @@ def print_batch_progress(batch_num: int, total_batches: int, batch_size: int) ->
     print(f"📦 Processing batch {batch_num}/{total_batches} ({batch_size} items)")
 
 
-def print_final_report(report: Dict[str, Any], output_file: str) -> None:
+def print_final_report(report: Dict[str, Any], output_file: str,
+                       report_file: Optional[str] = None) -> None:
     """Print final completion report."""
+    summary = report['summary']
+    page_latency = report['latency']['page']
+
     print("\n✅ SCRAPING COMPLETE!")
-    print(f"📊 Total processed: {report['summary']['total_urls_processed']}")
-    print(f"🎯 Success rate: {format_percentage(report['summary']['success_rate'])}")
-    print(f"⚡ Throughput: {format_throughput(report['summary']['throughput_per_second'])}")
+    print(f"📊 Total processed: {summary['total_urls_processed']}")
+    print(f"🎯 Success rate: {format_percentage(summary['success_rate'])}")
+    print(f"⏲️ Wall time: {summary['duration_seconds']:.1f}s")
+    print(f"⚡ Throughput: {format_throughput(summary['throughput_per_second'])} "
+          f"({summary['http_requests']} HTTP requests, {summary['requests_per_second']:.2f}/sec)")
+    print(f"🕐 Page latency: p50 {page_latency['p50']:.2f}s, p95 {page_latency['p95']:.2f}s, "
+          f"max {page_latency['max']:.2f}s")
+    print(f"📦 Downloaded: {summary['bytes_transferred'] / 1_000_000:.1f} MB")
+    weak_fields = [f"{field} {format_percentage(rate)}"
+                   for field, rate in report['field_success_rates'].items() if rate < 100]
+    if weak_fields:
+        print(f"🧩 Field coverage: {', '.join(weak_fields)}")
     print(f"💾 Results saved to: {output_file}")
+    if report_file:
+        print(f"🧾 Report saved to: {report_file}")
+
+
+def print_phase_timings(metrics: MetricsRegistry) -> None:
+    """Print where the time went, one line per pipeline phase."""
+    phases = [metrics.histograms[name] for name in PHASE_METRICS
+              if name in metrics.histograms and metrics.histograms[name].count]
+    if not phases:
+        return
+
+    print("\n⏱️ TIME BY PHASE")
+    print(f"   {'phase':<20}{'count':>8}{'total s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for histogram in phases:
+        phase = _phase_name(histogram.name)
+        print(f"   {phase:<20}{histogram.count:>8}{histogram.sum:>10.1f}"
+              f"{histogram.percentile(50) * 1000:>10.1f}{histogram.percentile(95) * 1000:>10.1f}")
@@ -0,0 +1,30 @@
+"""JSON output writing for MECSR scraper."""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, List
+
+from .helpers import get_iso_timestamp, ensure_directory, build_mall_record, datetime_encoder
+
+
+def save_results_json(results: List[Dict[str, Any]], output_file: str) -> Dict[str, Any]:
+    """Write scrape results to a JSON output file with proper datetime handling."""
+    successful_results = [r for r in results if r.get('success') and r.get('data')]
+
+    output = {
+        'metadata': {
+            'scraped_at': get_iso_timestamp(),
+            'total_malls': len(results),
+            'successful_extractions': len(successful_results),
+            'scraper_version': 'simple_v1.0'
+        },
+        'malls': [build_mall_record(r) for r in successful_results]
+    }
+
+    output_path = Path(output_file)
+    ensure_directory(str(output_path.parent))
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False, default=datetime_encoder)
+
+    print(f"💾 Results saved to: {output_file}")
+    return output
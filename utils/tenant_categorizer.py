@@ -0,0 +1,132 @@
+"""
+Tenant categorization for MECSR mall records.
+
+Keywords come from a taxonomy file (category -> keywords, in priority order)
+and are compiled once into an Aho-Corasick automaton, so categorizing a tenant
+name is a single scan over its characters regardless of the taxonomy size.
+"""
+
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+
+from config import settings
+
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).with_name("tenant_taxonomy.json")
+UNCATEGORIZED = "other"
+
+
+class AhoCorasickMatcher:
+    """Multi-pattern substring matcher; each keyword carries an integer value"""
+
+    def __init__(self, keywords: Dict[str, int]):
+        """
+        Build the automaton
+
+        Args:
+            keywords: Mapping of keyword to the value reported when it occurs
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[int]] = [None]  # Smallest value ending at each state
+
+        for keyword, value in keywords.items():
+            if keyword:
+                self._add(keyword, value)
+        self._build_failure_links()
+
+    def _add(self, keyword: str, value: int):
+        """Insert a keyword into the trie"""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+            state = next_state
+
+        current = self._output[state]
+        self._output[state] = value if current is None else min(current, value)
+
+    def _build_failure_links(self):
+        """Breadth-first failure links; outputs absorb those of their failure state"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+
+                inherited = self._output[self._fail[next_state]]
+                if inherited is not None:
+                    current = self._output[next_state]
+                    self._output[next_state] = (inherited if current is None
+                                                else min(current, inherited))
+
+    def min_match(self, text: str) -> Optional[int]:
+        """Smallest value of any keyword occurring in text, or None"""
+        goto, fail, output = self._goto, self._fail, self._output
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            value = output[state]
+            if value is not None and (best is None or value < best):
+                best = value
+                if best == 0:
+                    break  # Nothing can beat the first category
+        return best
+
+
+class TenantCategorizer:
+    """Maps tenant names to the first taxonomy category with a matching keyword"""
+
+    def __init__(self, taxonomy: Dict[str, List[str]], cache_size: int = 4096):
+        """
+        Initialize the TenantCategorizer
+
+        Args:
+            taxonomy: Ordered mapping of category to lowercase keywords; earlier
+                categories win when keywords from several categories match
+            cache_size: Number of tenant names whose category is memoized
+        """
+        self.categories = list(taxonomy)
+
+        # A keyword listed under several categories belongs to the earliest one
+        keywords = {}
+        for rank, category in enumerate(self.categories):
+            for keyword in taxonomy[category]:
+                keywords.setdefault(keyword.lower(), rank)
+
+        self._matcher = AhoCorasickMatcher(keywords)
+        self.categorize = lru_cache(maxsize=cache_size)(self._categorize)
+
+    @classmethod
+    def from_file(cls, path: str) -> "TenantCategorizer":
+        """Load a taxonomy JSON file ({"category": ["keyword", ...], ...})"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _categorize(self, tenant_name: str) -> str:
+        """Category for a tenant name, 'other' if no keyword occurs in it"""
+        rank = self._matcher.min_match(tenant_name.lower())
+        return self.categories[rank] if rank is not None else UNCATEGORIZED
+
+
+@lru_cache(maxsize=None)
+def get_tenant_categorizer() -> TenantCategorizer:
+    """Process-wide categorizer, built once from TENANT_TAXONOMY_PATH or the bundled taxonomy"""
+    return TenantCategorizer.from_file(settings.tenant_taxonomy_path or str(DEFAULT_TAXONOMY_PATH))